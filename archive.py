@@ -0,0 +1,365 @@
+"""
+Thrift Store Management System - Sales Archive
+Moves closed years of Tb_Transaction/Tb_TransactionItem into compressed
+Parquet files and reads them back for reports that reach into those years
+"""
+
+import argparse
+import getpass
+import os
+import re
+import sys
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+from mysql.connector import Error
+
+from frames import DTYPE_BACKEND
+
+# Every process reading or writing the archive (app, scheduler, archive.py,
+# federated reports) must see the same directory, e.g. a shared mount; the
+# default is next to the code rather than relative to the working directory
+ARCHIVE_DIR = os.path.abspath(os.environ.get(
+    'THRIFT_ARCHIVE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'archive')))
+COMPRESSION = 'zstd'
+# A year is only archived once this long after it ends, so late replays from
+# till queues and back-office corrections land in MySQL before it is frozen
+GRACE_DAYS = 31
+DELETE_BATCH_SIZE = 1000
+
+
+class ArchiveUnavailable(RuntimeError):
+    """An archived year's file could not be read from the archive directory"""
+
+
+def archivable_years(db, today: Optional[date] = None) -> List[int]:
+    """Closed years past the grace period that still have hot rows"""
+    today = today or date.today()
+    rows = db.fetch_query("""
+        SELECT DISTINCT t.YY
+        FROM Tb_Transaction t
+        WHERE t.YY NOT IN (SELECT YY FROM Tb_ArchivedYear)
+        ORDER BY t.YY
+    """)
+    return [year for (year,) in rows
+            if date(year + 1, 1, 1) + timedelta(days=GRACE_DAYS) <= today]
+
+
+def _write_parquet(df: pd.DataFrame, path: str):
+    """Write atomically and check the file reads back with every row"""
+    partial = path + '.partial'
+    df.to_parquet(partial, compression=COMPRESSION, index=False)
+    if len(pd.read_parquet(partial, columns=df.columns[:1].tolist())) != len(df):
+        os.remove(partial)
+        raise RuntimeError(f"archive file {partial} is incomplete")
+    os.replace(partial, path)
+
+
+def _hot_totals(db, year: int) -> Dict:
+    """Row counts and sales total of a year's hot rows, to check its files against"""
+    rows = db.fetch_query("""
+        SELECT COUNT(*), COALESCE(SUM(t.TotalAmount), 0),
+               (SELECT COUNT(*) FROM Tb_TransactionItem ti
+                JOIN Tb_Transaction t2 ON ti.TransactionID = t2.TransactionID
+                WHERE t2.YY = %s)
+        FROM Tb_Transaction t
+        WHERE t.YY = %s
+    """, (year, year), raise_errors=True)
+    transactions, total, lines = rows[0]
+    return {'transactions': int(transactions), 'lines': int(lines),
+            'total': round(float(total), 2)}
+
+
+def _verify_files(directory: str, year: int, transactions_file: str, items_file: str,
+                  expected: Dict):
+    """Raise unless the year's files hold exactly the expected rows and sales total"""
+    transactions = pd.read_parquet(os.path.join(directory, transactions_file),
+                                   columns=['TotalAmount'])
+    lines = pd.read_parquet(os.path.join(directory, items_file), columns=['TransactionID'])
+    found = {'transactions': len(transactions), 'lines': len(lines),
+             'total': round(float(transactions['TotalAmount'].sum()), 2)}
+    if found['transactions'] != expected['transactions'] or found['lines'] != expected['lines'] \
+            or abs(found['total'] - expected['total']) >= 0.005:
+        raise RuntimeError(f"archive files for {year} do not match the database: "
+                           f"files hold {found}, expected {expected}")
+
+
+def _read_year(db, year: int):
+    """A year's transactions and lines, and the hot totals they must add up to"""
+    transactions = db.fetch_df("""
+        SELECT t.TransactionID, t.DD, t.MM, t.YY, t.TotalAmount, t.PaymentMode,
+               t.CustomerID, CONCAT(c.FirstName, ' ', c.LastName) AS Customer,
+               t.EmployeeID, CONCAT(e.FirstName, ' ', e.LastName) AS Employee
+        FROM Tb_Transaction t
+        JOIN Tb_Customer c ON t.CustomerID = c.CustomerID
+        JOIN Tb_Employee e ON t.EmployeeID = e.EmployeeID
+        WHERE t.YY = %s
+        ORDER BY t.TransactionID
+    """, (year,), raise_errors=True)
+    items = db.fetch_df("""
+        SELECT ti.TransactionID, ti.LineNumber, ti.ItemID, ti.Quantity,
+               ti.UnitPrice, ti.LineTotal
+        FROM Tb_TransactionItem ti
+        JOIN Tb_Transaction t ON ti.TransactionID = t.TransactionID
+        WHERE t.YY = %s
+        ORDER BY ti.TransactionID
+    """, (year,), raise_errors=True)
+    return transactions, items, _hot_totals(db, year)
+
+
+def _archived_rows(transactions: pd.DataFrame, items: pd.DataFrame) -> Dict[int, tuple]:
+    """{TransactionID: (TotalAmount, line count)} as archived, to check hot rows against"""
+    lines = items.groupby('TransactionID').size()
+    return {int(trans_id): (round(float(total), 2), int(lines.get(trans_id, 0)))
+            for trans_id, total in zip(transactions['TransactionID'], transactions['TotalAmount'])}
+
+
+def archive_year(db, year: int, directory: str = ARCHIVE_DIR,
+                 batch_size: int = DELETE_BATCH_SIZE, today: Optional[date] = None) -> Dict:
+    """Copy a closed year to Parquet, register it, then delete its hot rows in batches
+
+    Registering the year in Tb_ArchivedYear (with its per customer/employee
+    totals) is the switch-over point: from then on reports read the year
+    from the files and ignore any hot rows left. The year is read in one
+    consistent snapshot, and nothing is registered or deleted unless the
+    files hold the same transaction and line counts and sales total as the
+    hot tables. A run interrupted while deleting is finished by calling
+    this again, after checking the files against what was registered.
+    """
+    today = today or date.today()
+    if date(year + 1, 1, 1) + timedelta(days=GRACE_DAYS) > today:
+        raise ValueError(f"{year} is not closed yet (grace period {GRACE_DAYS} days)")
+
+    registered = db.fetch_query(
+        "SELECT TransactionsFile, ItemsFile, TransactionCount, LineCount, TotalAmount "
+        "FROM Tb_ArchivedYear WHERE YY = %s", (year,), raise_errors=True)
+    if registered:
+        transactions_file, items_file, count, line_count, total = registered[0]
+        _verify_files(directory, year, transactions_file, items_file,
+                      {'transactions': int(count), 'lines': int(line_count),
+                       'total': round(float(total), 2)})
+        archived = _archived_rows(
+            pd.read_parquet(os.path.join(directory, transactions_file),
+                            columns=['TransactionID', 'TotalAmount']),
+            pd.read_parquet(os.path.join(directory, items_file), columns=['TransactionID']))
+        deleted = _delete_hot_rows(db, year, archived, batch_size)
+        return {'year': year, 'transactions': 0, 'lines': 0, 'deleted': deleted}
+
+    # One snapshot, so the files and the totals they are checked against agree
+    db.connection.start_transaction(consistent_snapshot=True, readonly=True)
+    try:
+        transactions, items, expected = _read_year(db, year)
+    finally:
+        db.connection.rollback()
+    if transactions.empty:
+        return {'year': year, 'transactions': 0, 'lines': 0, 'deleted': 0}
+
+    # Registered relative to the archive directory; the store's own folder
+    # keeps databases sharing one archive directory apart
+    store = re.sub(r'[^\w.-]', '_', f"{db.host}_{db.port}_{db.database}")
+    os.makedirs(os.path.join(directory, store), exist_ok=True)
+    transactions_file = f"{store}/transactions_{year}.parquet"
+    items_file = f"{store}/transaction_items_{year}.parquet"
+    _write_parquet(transactions, os.path.join(directory, transactions_file))
+    _write_parquet(items, os.path.join(directory, items_file))
+    _verify_files(directory, year, transactions_file, items_file, expected)
+
+    totals = (transactions.groupby(['CustomerID', 'EmployeeID'])
+              .agg(TransactionCount=('TransactionID', 'size'),
+                   TotalAmount=('TotalAmount', 'sum'))
+              .reset_index())
+    db.connection.start_transaction()
+    cursor = db.connection.cursor()
+    try:
+        cursor.execute(
+            "INSERT INTO Tb_ArchivedYear (YY, TransactionsFile, ItemsFile, TransactionCount, "
+            "LineCount, TotalAmount) VALUES (%s, %s, %s, %s, %s, %s)",
+            (year, transactions_file, items_file, len(transactions), len(items),
+             round(float(transactions['TotalAmount'].sum()), 2))
+        )
+        cursor.executemany(
+            "INSERT INTO Tb_ArchivedSalesTotal (YY, CustomerID, EmployeeID, TransactionCount, "
+            "TotalAmount) VALUES (%s, %s, %s, %s, %s)",
+            [(year, int(c), int(e), int(n), round(float(a), 2))
+             for c, e, n, a in totals.itertuples(index=False)]
+        )
+        db.connection.commit()
+    except Error:
+        db.connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    deleted = _delete_hot_rows(db, year, _archived_rows(transactions, items), batch_size)
+    return {'year': year, 'transactions': len(transactions), 'lines': len(items),
+            'deleted': deleted}
+
+
+def _delete_hot_rows(db, year: int, archived: Dict[int, tuple], batch_size: int) -> int:
+    """Delete archived transactions (lines cascade) in short batches, then mark the year done
+
+    Each batch is locked and compared with archived first, so a
+    transaction whose total or lines changed after it was archived is
+    never deleted with it.
+    """
+    transaction_ids = sorted(archived)
+    deleted = 0
+    cursor = db.connection.cursor()
+    try:
+        for start in range(0, len(transaction_ids), batch_size):
+            batch = transaction_ids[start:start + batch_size]
+            placeholders = ', '.join(['%s'] * len(batch))
+            db.connection.start_transaction()
+            cursor.execute(f"""
+                SELECT t.TransactionID, t.TotalAmount,
+                       (SELECT COUNT(*) FROM Tb_TransactionItem ti
+                        WHERE ti.TransactionID = t.TransactionID)
+                FROM Tb_Transaction t
+                WHERE t.YY = %s AND t.TransactionID IN ({placeholders})
+                FOR UPDATE
+            """, (year, *batch))
+            for trans_id, total, lines in cursor.fetchall():
+                if (round(float(total), 2), int(lines)) != archived[trans_id]:
+                    raise RuntimeError(f"transaction {trans_id} changed after {year} was "
+                                       f"archived; its hot rows were kept")
+            cursor.execute(
+                f"DELETE FROM Tb_Transaction WHERE YY = %s AND TransactionID IN ({placeholders})",
+                (year, *batch)
+            )
+            deleted += cursor.rowcount
+            db.connection.commit()
+        cursor.execute("UPDATE Tb_ArchivedYear SET Status = 'archived' WHERE YY = %s", (year,))
+        db.connection.commit()
+    except (Error, RuntimeError):
+        db.connection.rollback()
+        raise
+    finally:
+        cursor.close()
+    return deleted
+
+
+def read_sales_report(directory: str, files: Dict[int, str], start_year: int, start_month: int,
+                      end_year: int, end_month: int) -> pd.DataFrame:
+    """sp_SalesReport-shaped rows from archived years {year: transactions file}
+
+    Raises ArchiveUnavailable if a file is missing or unreadable, rather
+    than leaving the year out of the report.
+    """
+    frames = []
+    for year, name in sorted(files.items()):
+        path = os.path.join(directory, name)
+        try:
+            df = pd.read_parquet(path, dtype_backend=DTYPE_BACKEND,
+                                 filters=[('MM', '>=', start_month if year == start_year else 1),
+                                          ('MM', '<=', end_month if year == end_year else 12)])
+        except (OSError, ValueError) as e:
+            raise ArchiveUnavailable(f"archived sales for {year} are unavailable "
+                                     f"({path}: {e})") from e
+        frames.append(df)
+    if not frames:
+        return pd.DataFrame()
+    df = pd.concat(frames, ignore_index=True)
+    return pd.DataFrame({
+        'TransactionID': df['TransactionID'],
+        'Customer': df['Customer'],
+        'Employee': df['Employee'],
+        'TransactionDate': (df['DD'].astype(str) + '-' + df['MM'].astype(str)
+                            + '-' + df['YY'].astype(str)),
+        'TotalAmount': df['TotalAmount'],
+        'PaymentMode': df['PaymentMode'],
+    }).convert_dtypes(dtype_backend=DTYPE_BACKEND)
+
+
+def read_purchase_history(directory: str, files: Dict[int, Tuple[str, str]], customer_id: int,
+                          item_names: Callable[[List[int]], Dict[int, str]]) -> pd.DataFrame:
+    """sp_CustomerPurchaseHistory-shaped rows from archived years
+
+    files maps each year to its (transactions file, items file);
+    item_names(ids) returns {ItemID: Name}. Raises ArchiveUnavailable like
+    read_sales_report.
+    """
+    transactions, lines = [], []
+    for year, (transactions_file, items_file) in sorted(files.items()):
+        try:
+            df = pd.read_parquet(os.path.join(directory, transactions_file),
+                                 columns=['TransactionID', 'DD', 'MM', 'YY',
+                                          'TotalAmount', 'PaymentMode'],
+                                 filters=[('CustomerID', '=', customer_id)])
+            if df.empty:
+                continue
+            items = pd.read_parquet(os.path.join(directory, items_file),
+                                    columns=['TransactionID', 'LineNumber', 'ItemID', 'Quantity'],
+                                    filters=[('TransactionID', 'in',
+                                              df['TransactionID'].tolist())])
+        except (OSError, ValueError) as e:
+            raise ArchiveUnavailable(f"archived sales for {year} are unavailable ({e})") from e
+        transactions.append(df)
+        lines.append(items)
+    if not transactions:
+        return pd.DataFrame()
+
+    df = pd.concat(transactions, ignore_index=True)
+    items = pd.concat(lines, ignore_index=True).sort_values(['TransactionID', 'LineNumber'])
+    names = item_names(sorted(int(i) for i in items['ItemID'].unique()))
+    labels = (items['ItemID'].map(lambda item_id: names.get(int(item_id), f"Item {item_id}"))
+              + ' (' + items['Quantity'].astype(str) + ')')
+    summary = labels.groupby(items['TransactionID']).agg(', '.join)
+    return pd.DataFrame({
+        'TransactionID': df['TransactionID'],
+        'TransactionDate': (df['DD'].astype(str) + '-' + df['MM'].astype(str)
+                            + '-' + df['YY'].astype(str)),
+        'TotalAmount': df['TotalAmount'],
+        'PaymentMode': df['PaymentMode'],
+        'Items': df['TransactionID'].map(summary),
+    }).convert_dtypes(dtype_backend=DTYPE_BACKEND)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from database import ThriftStoreDB
+
+    parser = argparse.ArgumentParser(description="Archive closed years of sales to Parquet")
+    parser.add_argument('command', choices=['status', 'run'],
+                        help="status: list archivable and archived years; "
+                             "run: archive every archivable year (or --year)")
+    parser.add_argument('--year', type=int)
+    parser.add_argument('--directory', default=ARCHIVE_DIR)
+    parser.add_argument('--batch-size', type=int, default=DELETE_BATCH_SIZE)
+    parser.add_argument('--host', default=os.environ.get('MYSQL_HOST', 'localhost'))
+    parser.add_argument('--user', default=os.environ.get('MYSQL_USER', 'root'))
+    parser.add_argument('--password', default=os.environ.get('MYSQL_PWD'))
+    parser.add_argument('--database', default=os.environ.get('MYSQL_DATABASE', 'MINIPROJECT_DBMS'))
+    args = parser.parse_args(argv)
+
+    password = args.password if args.password is not None else getpass.getpass("MySQL password: ")
+    db = ThriftStoreDB(args.host, args.user, password, args.database, archive_dir=args.directory)
+    if not db.connect():
+        return 1
+
+    try:
+        if args.command == 'status':
+            for year, status in db.fetch_query(
+                    "SELECT YY, Status FROM Tb_ArchivedYear ORDER BY YY"):
+                print(f"{status:9} {year}")
+            for year in archivable_years(db):
+                print(f"{'hot':9} {year} (archivable)")
+            return 0
+
+        years = [args.year] if args.year else archivable_years(db)
+        for year in years:
+            started = time.perf_counter()
+            result = archive_year(db, year, args.directory, args.batch_size)
+            print(f"archived {year}: {result['transactions']} transactions, "
+                  f"{result['lines']} lines, {result['deleted']} hot rows deleted "
+                  f"in {time.perf_counter() - started:.2f}s")
+        return 0
+    except (ValueError, RuntimeError, Error) as e:
+        print(e)
+        return 1
+    finally:
+        db.disconnect()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
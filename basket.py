@@ -0,0 +1,176 @@
+"""
+Thrift Store Management System - Market Basket Analysis
+Builds a sparse transaction x item (or category) matrix from streamed
+transaction lines and derives "frequently bought together" pairs
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# Transactions can commit out of ID order (e.g. till flushers in several app
+# processes). IDs missing from the newest GAP_WINDOW are re-checked on later
+# refreshes, each at least once and until it is GAP_TIMEOUT_SECONDS old.
+GAP_WINDOW = 1000
+GAP_TIMEOUT_SECONDS = 3600.0
+
+
+class BasketAnalyzer:
+    def __init__(self, level: str = 'item'):
+        """Accumulate co-occurrence counts at 'item' or 'category' level"""
+        if level not in ('item', 'category'):
+            raise ValueError("level must be 'item' or 'category'")
+        self.level = level
+        self.last_transaction_id = 0
+        self.n_baskets = 0
+        self._keys = np.empty(0, dtype=np.int64)   # column -> ItemID/CategoryID
+        self._columns: Dict[int, int] = {}          # ItemID/CategoryID -> column
+        self._basket_counts = np.zeros(0, dtype=np.int64)
+        self._pair_counts = sparse.csr_matrix((0, 0), dtype=np.int64)
+        self._gaps: Dict[int, float] = {}  # missing TransactionID -> when it was noticed
+        self._lock = threading.Lock()
+
+    def refresh(self, db, chunk_size: int = 50000) -> int:
+        """Fold in transactions newer than the last refresh; returns baskets added
+
+        A database error is raised after the complete baskets read so far
+        are kept; the interrupted basket is read again on the next refresh.
+        """
+        with self._lock:
+            before = self.n_baskets
+            self._recheck_gaps(db)
+
+            start = self.last_transaction_id
+            recent = np.empty(0, dtype=np.int64)
+            carry = np.empty((0, 2), dtype=np.int64)
+            try:
+                for chunk in db.iter_transaction_lines(start, chunk_size, self.level):
+                    lines = np.concatenate([carry, chunk]) if len(carry) else chunk
+                    # The last transaction may continue in the next chunk
+                    last_id = lines[-1, 0]
+                    split = np.searchsorted(lines[:, 0], last_id)
+                    recent = self._recent(recent, self._absorb(lines[:split]))
+                    carry = lines[split:]
+                recent = self._recent(recent, self._absorb(carry))
+            finally:
+                self._note_gaps(start, recent)
+            return self.n_baskets - before
+
+    def _recent(self, recent: np.ndarray, basket_ids: np.ndarray) -> np.ndarray:
+        """Absorbed IDs still inside the gap window"""
+        recent = np.concatenate([recent, basket_ids])
+        return recent[recent > self.last_transaction_id - GAP_WINDOW]
+
+    def _note_gaps(self, start: int, recent: np.ndarray):
+        """Remember IDs below the high-water mark that had no lines yet"""
+        low = max(start, self.last_transaction_id - GAP_WINDOW)
+        missing = np.setdiff1d(np.arange(low + 1, self.last_transaction_id + 1), recent)
+        now = time.monotonic()
+        for transaction_id in missing.tolist():
+            self._gaps.setdefault(transaction_id, now)
+
+    def _recheck_gaps(self, db):
+        """Absorb late-committed transactions, then forget gaps that timed out"""
+        if not self._gaps:
+            return
+        gaps: List[int] = sorted(self._gaps)
+        chunks = list(db.iter_transaction_lines(level=self.level, transaction_ids=gaps))
+        if chunks:
+            for transaction_id in self._absorb(np.concatenate(chunks)).tolist():
+                self._gaps.pop(transaction_id, None)
+        now = time.monotonic()
+        self._gaps = {i: seen for i, seen in self._gaps.items()
+                      if now - seen < GAP_TIMEOUT_SECONDS}
+
+    def _absorb(self, lines: np.ndarray) -> np.ndarray:
+        """Add a block of complete baskets given (TransactionID, key) rows; returns their IDs"""
+        if len(lines) == 0:
+            return np.empty(0, dtype=np.int64)
+        transaction_ids, keys = lines[:, 0], lines[:, 1]
+
+        unique_keys, key_inverse = np.unique(keys, return_inverse=True)
+        new_keys = [k for k in unique_keys.tolist() if k not in self._columns]
+        for key in new_keys:
+            self._columns[key] = len(self._columns)
+        if new_keys:
+            self._keys = np.concatenate([self._keys, np.array(new_keys, dtype=np.int64)])
+            self._basket_counts = np.concatenate(
+                [self._basket_counts, np.zeros(len(new_keys), dtype=np.int64)])
+        n_keys = len(self._keys)
+        unique_columns = np.array([self._columns[k] for k in unique_keys.tolist()],
+                                  dtype=np.int64)
+        columns = unique_columns[key_inverse]
+
+        basket_ids, rows = np.unique(transaction_ids, return_inverse=True)
+        # Binary basket matrix; repeated lines of the same key count once
+        baskets = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int64), (rows, columns)),
+            shape=(len(basket_ids), n_keys)
+        )
+        baskets.data[:] = 1
+
+        pairs = (baskets.T @ baskets).tocsr()
+        counts = self._pair_counts
+        if counts.shape != pairs.shape:
+            # Grow the accumulated matrix to cover newly seen keys
+            counts = counts.tocoo()
+            counts = sparse.csr_matrix((counts.data, (counts.row, counts.col)),
+                                       shape=pairs.shape)
+        self._pair_counts = counts + pairs
+        self._basket_counts += np.asarray(baskets.sum(axis=0)).ravel()
+        self.n_baskets += len(basket_ids)
+        self.last_transaction_id = max(self.last_transaction_id, int(basket_ids[-1]))
+        return basket_ids
+
+    def pairs(self, min_count: int = 2, top: int = 50) -> pd.DataFrame:
+        """Key pairs bought together at least min_count times, ranked by lift
+
+        support = P(A and B), confidence = P(B | A), lift = P(A and B) / (P(A) P(B)).
+        """
+        with self._lock:
+            upper = sparse.triu(self._pair_counts, k=1).tocoo()
+            n = self.n_baskets
+            keys = self._keys
+            basket_counts = self._basket_counts.copy()
+
+        mask = upper.data >= min_count
+        a, b, together = upper.row[mask], upper.col[mask], upper.data[mask].astype(float)
+        if n == 0 or len(together) == 0:
+            return pd.DataFrame(columns=['A', 'B', 'Count', 'Support',
+                                         'Confidence A→B', 'Confidence B→A', 'Lift'])
+
+        # Orient every pair by key so results do not depend on column order
+        swap = keys[a] > keys[b]
+        a, b = np.where(swap, b, a), np.where(swap, a, b)
+        count_a = basket_counts[a].astype(float)
+        count_b = basket_counts[b].astype(float)
+        result = pd.DataFrame({
+            'A': keys[a],
+            'B': keys[b],
+            'Count': together.astype(np.int64),
+            'Support': together / n,
+            'Confidence A→B': together / count_a,
+            'Confidence B→A': together / count_b,
+            'Lift': together * n / (count_a * count_b),
+        })
+        return (result.sort_values(['Lift', 'Count', 'A', 'B'],
+                                   ascending=[False, False, True, True])
+                      .head(top)
+                      .reset_index(drop=True))
+
+
+def label_pairs(pairs: pd.DataFrame, names: Dict[int, str]) -> pd.DataFrame:
+    """Replace key columns A/B with display names"""
+    labelled = pairs.copy()
+    for column in ('A', 'B'):
+        labelled[column] = labelled[column].map(names).fillna(labelled[column].astype(str))
+    return labelled
+
+
+def keys_in(pairs: pd.DataFrame) -> Iterable[int]:
+    """Distinct keys referenced by a pairs frame"""
+    return np.union1d(pairs['A'].to_numpy(), pairs['B'].to_numpy()).tolist()
@@ -0,0 +1,87 @@
+"""
+Thrift Store Management System - Option Construction Benchmark
+Compares the old iterrows() pickers on object-dtype frames with typed frames
+and options_from_columns() on a synthetic item table.
+
+    python benchmarks/bench_options.py --rows 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+from decimal import Decimal
+
+import pandas as pd
+from mysql.connector import FieldType
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frames import frame_from_rows, options_from_columns  # noqa: E402
+
+DESCRIPTION = [
+    ('ItemID', FieldType.LONG),
+    ('Name', FieldType.VAR_STRING),
+    ('Price', FieldType.NEWDECIMAL),
+    ('QuantityAvailable', FieldType.LONG),
+]
+
+
+def make_rows(n: int) -> list:
+    """Rows shaped like cursor.fetchall() output for get_all_items()"""
+    return [(i, f"Item {i}", Decimal(f"{i % 500}.99"), i % 7) for i in range(1, n + 1)]
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    columns = [desc[0] for desc in DESCRIPTION]
+
+    def old_frame():
+        return pd.DataFrame(rows, columns=columns)
+
+    def typed_frame():
+        return frame_from_rows(rows, DESCRIPTION)
+
+    object_df = old_frame()
+    typed_df = typed_frame()
+
+    def old_options():
+        return {
+            f"{row['Name']} - ₹{row['Price']} (Stock: {row['QuantityAvailable']})":
+            (row['ItemID'], row['Price'], row['QuantityAvailable'])
+            for _, row in object_df.iterrows()
+            if row['QuantityAvailable'] > 0
+        }
+
+    def new_options():
+        in_stock = typed_df[typed_df['QuantityAvailable'].fillna(0) > 0]
+        return options_from_columns(
+            in_stock, "{Name} - ₹{Price:.2f} (Stock: {QuantityAvailable})",
+            ('ItemID', 'Price', 'QuantityAvailable')
+        )
+
+    assert len(old_options()) == len(new_options())
+
+    print(f"{args.rows:,} rows, best of {args.repeat}")
+    print(f"  object frame build      {best_of(old_frame, args.repeat):9.1f} ms")
+    print(f"  typed frame build       {best_of(typed_frame, args.repeat):9.1f} ms")
+    print(f"  iterrows options        {best_of(old_options, args.repeat):9.1f} ms")
+    print(f"  column options          {best_of(new_options, args.repeat):9.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Thrift Store Management System - Prepared Statement Benchmark
+Per-call latency of the hot data-layer lookups run as plain statements vs
+cached prepared statements, on the pure-Python and C-extension protocol
+implementations. Prints a Markdown table for the README. Needs a live database:
+
+    python benchmarks/bench_prepared.py --user root --password secret --calls 2000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict
+
+import mysql.connector
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import ThriftStoreDB  # noqa: E402
+
+
+def per_call_us(call: Callable[[], object], calls: int) -> list:
+    call()  # warm up / prepare once
+    samples = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+def lookups(db: ThriftStoreDB) -> Dict[str, Callable[[], object]]:
+    """The hot data-layer calls, going through ThriftStoreDB as the app does"""
+    customer = db.fetch_query("SELECT COALESCE(MIN(CustomerID), 0) FROM Tb_Customer")
+    sku = db.fetch_query("SELECT SKU FROM Tb_Item WHERE SKU IS NOT NULL LIMIT 1")
+    customer_id = customer[0][0] if customer else 0
+    sku = sku[0][0] if sku else ''
+    if not customer_id or not sku:
+        # Lookups that find nothing measure a different code path
+        sys.exit("needs a database with customers and SKU-tagged items (see seeds/)")
+
+    def lookup_item():
+        # Measure the query, not the hot-item cache in front of it
+        db.item_cache.clear()
+        return db.lookup_item(sku)
+
+    return {
+        'lookup_item (cache miss)': lookup_item,
+        'get_customer_total_purchases': lambda: db.get_customer_total_purchases(customer_id),
+        'get_all_categories': db.get_all_categories,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=3306)
+    parser.add_argument('--user', required=True)
+    parser.add_argument('--password', default='')
+    parser.add_argument('--database', default='MINIPROJECT_DBMS')
+    parser.add_argument('--calls', type=int, default=2000)
+    args = parser.parse_args()
+
+    implementations = [('pure', True)]
+    if mysql.connector.HAVE_CEXT:
+        implementations.append(('cext', False))
+    else:
+        print("C extension not installed; measuring the pure-Python driver only")
+
+    medians = {}
+    server = None
+    for label, use_pure in implementations:
+        for prepare in (False, True):
+            db = ThriftStoreDB(args.host, args.user, args.password, args.database,
+                               port=args.port, use_pure=use_pure, prepare=prepare)
+            if not db.connect():
+                sys.exit(1)
+            server = server or db.fetch_query("SELECT VERSION()")[0][0]
+            for name, call in lookups(db).items():
+                medians[label, prepare, name] = statistics.median(per_call_us(call, args.calls))
+            db.disconnect()
+
+    print(f"median µs per call, {args.calls:,} calls each; MySQL {server} at "
+          f"{args.host}:{args.port}, mysql-connector {mysql.connector.__version__}")
+    print("| call | driver | plain | prepared | speedup |")
+    print("|---|---|---|---|---|")
+    for label, _ in implementations:
+        for name in dict.fromkeys(n for _, _, n in medians):
+            plain, prepared = medians[label, False, name], medians[label, True, name]
+            print(f"| {name} | {label} | {plain:.1f} | {prepared:.1f} | {plain / prepared:.2f}x |")
+
+
+if __name__ == '__main__':
+    main()
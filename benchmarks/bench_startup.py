@@ -0,0 +1,77 @@
+"""
+Thrift Store Management System - Startup Benchmark
+Measures cold start and rerun time of app.py with Streamlit's AppTest harness.
+
+Without connection options only the landing page is measured. With them, each
+page is opened in turn against a live database:
+
+    python benchmarks/bench_startup.py --user root --password secret
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from database import ThriftStoreDB  # noqa: E402
+from views import COLD_START_BUDGET_MS, PAGES, RERUN_BUDGET_MS  # noqa: E402
+
+APP_PATH = os.path.join(ROOT, 'app.py')
+
+
+def timed_run(app: AppTest) -> float:
+    started = time.perf_counter()
+    app.run(timeout=30)
+    return (time.perf_counter() - started) * 1000
+
+
+def report(label: str, samples: list, budget_ms: int):
+    median = statistics.median(samples)
+    verdict = 'ok' if median <= budget_ms else 'OVER BUDGET'
+    print(f"{label:28} median {median:8.1f} ms  max {max(samples):8.1f} ms  "
+          f"(budget {budget_ms} ms) {verdict}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--user')
+    parser.add_argument('--password', default='')
+    parser.add_argument('--database', default='MINIPROJECT_DBMS')
+    parser.add_argument('--reruns', type=int, default=10)
+    args = parser.parse_args()
+
+    app = AppTest.from_file(APP_PATH)
+    report('cold start (landing)', [timed_run(app)], COLD_START_BUDGET_MS)
+    report('rerun (landing)', [timed_run(app) for _ in range(args.reruns)], RERUN_BUDGET_MS)
+
+    if not args.user:
+        return
+
+    db = ThriftStoreDB(args.host, args.user, args.password, args.database)
+    if not db.connect():
+        sys.exit(1)
+
+    for label in PAGES:
+        app = AppTest.from_file(APP_PATH)
+        app.session_state['db'] = db
+        app.session_state['connected'] = True
+        app.session_state['pending_migrations'] = None
+        app.run(timeout=30)
+        app.sidebar.radio[0].set_value(label)
+        first = timed_run(app)
+        reruns = [timed_run(app) for _ in range(args.reruns)]
+        report(f"first open{label}", [first], COLD_START_BUDGET_MS)
+        report(f"rerun{label}", reruns, RERUN_BUDGET_MS)
+
+    db.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -3,43 +3,271 @@ Thrift Store Management System - Database Backend
 This module handles all database connections and operations
 """
 
+import time
 import mysql.connector
-from mysql.connector import Error
-from typing import List, Dict, Optional, Tuple
+from mysql.connector import Error, errorcode
+from typing import List, Dict, Iterator, Optional, Tuple
+import numpy as np
 import pandas as pd
-from datetime import datetime
+from datetime import date, datetime
+from aging import aging_report
+from archive import ARCHIVE_DIR, read_purchase_history, read_sales_report
+from events import (CUSTOMER, DONATION, INVENTORY, ITEM, TRANSACTION, ChangeEvent,
+                    bus)
+from frames import frame_from_rows
+from cache import LRUCache
+
+try:
+    # The C extension raises this unwrapped when closing a statement on a dead connection
+    from _mysql_connector import MySQLInterfaceError
+    CLOSE_ERRORS = (Error, MySQLInterfaceError)
+except ImportError:
+    CLOSE_ERRORS = (Error,)
+
+# How long reads stay on the primary after this session writes, so the
+# writer always sees its own changes even if the replica is behind
+READ_YOUR_WRITES_SECONDS = 5.0
+# How often replica health/lag is re-checked
+REPLICA_CHECK_SECONDS = 2.0
+
+# record_sale() outcomes
+SALE_APPLIED = 'applied'
+SALE_DUPLICATE = 'duplicate'
+SALE_CONFLICT = 'conflict'
+SALE_ERROR = 'error'
+
 
 class ThriftStoreDB:
-    def __init__(self, host: str, user: str, password: str, database: str):
-        """Initialize database connection parameters"""
+    def __init__(self, host: str, user: str, password: str, database: str,
+                 replica: Optional[Dict] = None, max_replica_lag: int = 5,
+                 port: int = 3306, timeout: Optional[int] = None, use_pure: bool = False,
+                 prepare: bool = True, archive_dir: str = ARCHIVE_DIR,
+                 raise_errors: bool = False):
+        """Initialize database connection parameters
+
+        replica optionally holds host/user/password/database/port for a read
+        replica; missing keys default to the primary's values. Reports,
+        analytics and listings read from it while it is healthy and less than
+        max_replica_lag seconds behind.
+
+        timeout (seconds), when set, bounds connection attempts and, through
+        MAX_EXECUTION_TIME, plain SELECT statements on the server. SELECTs
+        inside stored procedures are not covered; callers that need a hard
+        limit kill the query (see federation.py).
+
+        Connections use mysql.connector's C extension unless use_pure is set
+        or the extension is not installed. They run in autocommit mode, so
+        every read sees the latest committed data; write methods open an
+        explicit transaction.
+
+        prepare=False runs the fixed queries as plain statements instead of
+        cached prepared statements (for proxies that do not support them, or
+        to compare the two; see benchmarks/bench_prepared.py).
+
+        archive_dir holds the Parquet files of archived years (see archive.py).
+
+        raise_errors=True makes every read raise instead of returning an
+        empty result (see fetch_query), e.g. for federated reports that must
+        report a failing store rather than show it with no rows.
+        """
         self.host = host
         self.user = user
         self.password = password
         self.database = database
+        self.port = port
+        self.timeout = timeout
+        self.use_pure = use_pure or not mysql.connector.HAVE_CEXT
+        self.prepare = prepare
+        self.raise_errors = raise_errors
+        self.archive_dir = archive_dir
         self.connection = None
+        self.replica = replica
+        self.max_replica_lag = max_replica_lag
+        self.replica_connection = None
+        self.replica_lag = None
+        self._replica_healthy = False
+        self._replica_checked_at = 0.0
+        self._last_write_at = 0.0
+        # Hot items by SKU for the till; invalidated on price and stock changes
+        self.item_cache = LRUCache(maxsize=2048)
+        # Bumped on every invalidation; a lookup that raced one is not cached
+        self._item_generation = 0
+        # connection -> {sql: (prepared cursor, sql)} for the fixed read queries
+        self._statements: Dict[object, Dict[str, tuple]] = {}
+        # Writes from any session or process drop stale lookups
+        bus.subscribe(self._on_item_change, (ITEM, INVENTORY))
     
     def connect(self) -> bool:
         """Establish database connection"""
         try:
+            options = {'connection_timeout': self.timeout} if self.timeout else {}
             self.connection = mysql.connector.connect(
                 host=self.host,
+                port=self.port,
                 user=self.user,
                 password=self.password,
-                database=self.database
+                database=self.database,
+                use_pure=self.use_pure,
+                autocommit=True,
+                **options
             )
-            return True
+            self._statements.clear()
+            if self.timeout:
+                cursor = self.connection.cursor()
+                cursor.execute("SET SESSION MAX_EXECUTION_TIME = %s", (self.timeout * 1000,))
+                cursor.close()
         except Error as e:
             print(f"Error connecting to MySQL: {e}")
             return False
+        
+        if self.replica:
+            self.connect_replica()
+        return True
+    
+    def connect_replica(self) -> bool:
+        """Connect to the read replica; on failure reads simply stay on the primary"""
+        self._statements.pop(self.replica_connection, None)
+        try:
+            self.replica_connection = mysql.connector.connect(
+                host=self.replica.get('host', self.host),
+                port=self.replica.get('port', self.port),
+                user=self.replica.get('user', self.user),
+                password=self.replica.get('password', self.password),
+                database=self.replica.get('database', self.database),
+                use_pure=self.use_pure,
+                autocommit=True
+            )
+            self._replica_checked_at = 0.0
+            return True
+        except Error as e:
+            print(f"Error connecting to read replica: {e}")
+            self.replica_connection = None
+            return False
     
     def disconnect(self):
         """Close database connection"""
+        self._close_statements()
         if self.connection and self.connection.is_connected():
             self.connection.close()
+        if self.replica_connection and self.replica_connection.is_connected():
+            self.replica_connection.close()
+    
+    # ==================== READ/WRITE ROUTING ====================
+    
+    def _mark_write(self):
+        """Pin this session's reads to the primary for a short read-your-writes window"""
+        self._last_write_at = time.monotonic()
+    
+    def _check_replica(self):
+        """Refresh replica health and replication lag (rate limited)"""
+        now = time.monotonic()
+        if now - self._replica_checked_at < REPLICA_CHECK_SECONDS:
+            return
+        self._replica_checked_at = now
+        
+        try:
+            if not self.replica_connection.is_connected():
+                self.replica_connection.reconnect(attempts=1)
+            cursor = self.replica_connection.cursor(dictionary=True)
+            try:
+                cursor.execute("SHOW REPLICA STATUS")
+            except Error:
+                # MySQL before 8.0.22
+                cursor.execute("SHOW SLAVE STATUS")
+            status = cursor.fetchone()
+            cursor.close()
+        except Error as e:
+            self._replica_failed(e)
+            return
+        
+        if status is None:
+            # Not a configured replica (e.g. a standalone read copy): no lag to track
+            self.replica_lag = 0
+        else:
+            self.replica_lag = status.get('Seconds_Behind_Source',
+                                          status.get('Seconds_Behind_Master'))
+        # NULL lag means replication is stopped
+        self._replica_healthy = (self.replica_lag is not None
+                                 and self.replica_lag <= self.max_replica_lag)
+    
+    def _replica_failed(self, error: Error):
+        """Stop routing reads to the replica until the next health check"""
+        print(f"Read replica unavailable, using primary: {error}")
+        self._replica_healthy = False
+        self._replica_checked_at = time.monotonic()
+    
+    def _reader(self):
+        """Connection for report/analytics/listing reads: replica when safe, else primary"""
+        if self.replica_connection is None:
+            return self.connection
+        if time.monotonic() - self._last_write_at < READ_YOUR_WRITES_SECONDS:
+            return self.connection
+        self._check_replica()
+        return self.replica_connection if self._replica_healthy else self.connection
+    
+    def read_target(self) -> str:
+        """Describe where routed reads currently go, for display"""
+        if self.replica_connection is None:
+            return "primary"
+        if self._reader() is self.connection:
+            return "primary (replica lagging or recently written)"
+        return f"replica (lag {self.replica_lag}s)"
+    
+    # ==================== CHANGE FEED ====================
+    
+    def _record_changes(self, cursor, events: List[ChangeEvent]):
+        """Write events to Tb_ChangeOutbox inside the caller's transaction"""
+        if not events:
+            return
+        cursor.executemany(
+            "INSERT INTO Tb_ChangeOutbox (Entity, EntityID, Fields, Origin) VALUES (%s, %s, %s, %s)",
+            [(e.entity, e.entity_id, ','.join(e.fields), e.origin) for e in events]
+        )
+    
+    def _committed(self, events: List[ChangeEvent]):
+        """After a commit: pin reads to the primary and announce the changes in-process"""
+        self._mark_write()
+        bus.publish(events)
+    
+    # ==================== PREPARED STATEMENTS ====================
+    
+    def _statement(self, connection, query: str) -> tuple:
+        """Cached server-side prepared statement for query on connection
+        
+        Returns (cursor, sql). The driver only skips re-preparing when it is
+        handed the very string object the cursor was prepared with, so
+        callers must execute the returned sql rather than their own copy.
+        """
+        statements = self._statements.setdefault(connection, {})
+        entry = statements.get(query)
+        if entry is None:
+            entry = (connection.cursor(prepared=True), query)
+            statements[query] = entry
+        return entry
+    
+    def _drop_statement(self, connection, query: str):
+        """Forget a statement after an error so the next call prepares it afresh"""
+        entry = self._statements.get(connection, {}).pop(query, None)
+        if entry is not None:
+            try:
+                entry[0].close()
+            except CLOSE_ERRORS:
+                pass
+    
+    def _close_statements(self):
+        """Deallocate every cached statement on the server"""
+        for statements in self._statements.values():
+            for cursor, _ in statements.values():
+                try:
+                    cursor.close()
+                except CLOSE_ERRORS:
+                    pass
+        self._statements.clear()
     
     def execute_query(self, query: str, params: tuple = None) -> bool:
         """Execute INSERT, UPDATE, DELETE queries"""
         try:
+            self.connection.start_transaction()
             cursor = self.connection.cursor()
             if params:
                 cursor.execute(query, params)
@@ -47,16 +275,33 @@ class ThriftStoreDB:
                 cursor.execute(query)
             self.connection.commit()
             cursor.close()
+            self._mark_write()
             return True
         except Error as e:
             print(f"Error executing query: {e}")
             self.connection.rollback()
             return False
     
-    def fetch_query(self, query: str, params: tuple = None) -> List[tuple]:
-        """Execute SELECT queries and return results"""
+    def fetch_query(self, query: str, params: tuple = None,
+                    replica: bool = False, prepared: bool = False,
+                    raise_errors: bool = False) -> List[tuple]:
+        """Execute SELECT queries and return results
+
+        replica=True allows the read to be served by the read replica.
+        prepared=True runs a fixed query as a cached server-side prepared
+        statement; leave it off for SQL that is built per call.
+        raise_errors=True raises a failed read instead of printing it and
+        returning no rows, for callers that must tell the two apart.
+        """
+        connection = self._reader() if replica else self.connection
+        prepared = prepared and self.prepare
+        raise_errors = raise_errors or self.raise_errors
         try:
-            cursor = self.connection.cursor()
+            if prepared:
+                cursor, query = self._statement(connection, query)
+                cursor.execute(query, params or ())
+                return cursor.fetchall()
+            cursor = connection.cursor()
             if params:
                 cursor.execute(query, params)
             else:
@@ -65,100 +310,184 @@ class ThriftStoreDB:
             cursor.close()
             return results
         except Error as e:
+            if prepared:
+                self._drop_statement(connection, query)
+            if connection is not self.connection:
+                self._replica_failed(e)
+                return self.fetch_query(query, params, prepared=prepared,
+                                        raise_errors=raise_errors)
+            if raise_errors:
+                raise
             print(f"Error fetching data: {e}")
             return []
     
-    def fetch_df(self, query: str, params: tuple = None) -> pd.DataFrame:
-        """Fetch query results as pandas DataFrame"""
+    def fetch_df(self, query: str, params: tuple = None,
+                 replica: bool = False, prepared: bool = False,
+                 raise_errors: bool = False) -> pd.DataFrame:
+        """Fetch query results as a typed pandas DataFrame
+
+        replica, prepared and raise_errors behave as in fetch_query.
+        """
+        connection = self._reader() if replica else self.connection
+        prepared = prepared and self.prepare
+        raise_errors = raise_errors or self.raise_errors
         try:
-            cursor = self.connection.cursor()
+            if prepared:
+                cursor, query = self._statement(connection, query)
+                cursor.execute(query, params or ())
+                return frame_from_rows(cursor.fetchall(), cursor.description)
+            cursor = connection.cursor()
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
-            columns = [desc[0] for desc in cursor.description]
             results = cursor.fetchall()
+            df = frame_from_rows(results, cursor.description)
             cursor.close()
-            return pd.DataFrame(results, columns=columns)
+            return df
         except Error as e:
+            if prepared:
+                self._drop_statement(connection, query)
+            if connection is not self.connection:
+                self._replica_failed(e)
+                return self.fetch_df(query, params, prepared=prepared,
+                                     raise_errors=raise_errors)
+            if raise_errors:
+                raise
             print(f"Error fetching dataframe: {e}")
             return pd.DataFrame()
     
+    def fetch_proc_df(self, procedure: str, args: list,
+                      replica: bool = False, raise_errors: bool = False) -> pd.DataFrame:
+        """Call a read-only stored procedure and return its last result set"""
+        connection = self._reader() if replica else self.connection
+        raise_errors = raise_errors or self.raise_errors
+        try:
+            cursor = connection.cursor()
+            cursor.callproc(procedure, args)
+            
+            df = pd.DataFrame()
+            for result in cursor.stored_results():
+                df = frame_from_rows(result.fetchall(), result.description)
+            
+            cursor.close()
+            return df if not df.empty else pd.DataFrame()
+        except Error as e:
+            if connection is not self.connection:
+                self._replica_failed(e)
+                return self.fetch_proc_df(procedure, args, raise_errors=raise_errors)
+            if raise_errors:
+                raise
+            print(f"Error: {e}")
+            return pd.DataFrame()
+    
     # ==================== CUSTOMER OPERATIONS ====================
     
     def add_customer(self, first_name: str, last_name: str, phone: str, email: str) -> Tuple[bool, str]:
         """Add new customer using stored procedure"""
         try:
+            self.connection.start_transaction()
             cursor = self.connection.cursor()
             cursor.callproc('sp_AddCustomer', [first_name, last_name, phone, email])
             
+            events = []
             for result in cursor.stored_results():
                 row = result.fetchone()
                 message = row[1] if row else "Customer added successfully"
+                if row:
+                    events = [ChangeEvent(CUSTOMER, row[0], ('FirstName', 'LastName', 'Phone', 'Email'))]
             
+            self._record_changes(cursor, events)
             self.connection.commit()
             cursor.close()
+            self._committed(events)
             return True, message
         except Error as e:
             self.connection.rollback()
             return False, f"Error: {str(e)}"
     
-    def get_all_customers(self) -> pd.DataFrame:
-        """Get all customers with their contact info"""
+    def get_all_customers(self, customer_ids: Optional[List[int]] = None,
+                          replica: bool = True) -> pd.DataFrame:
+        """Get all customers with their contact info, or just the given customers
+        
+        Specific customers are read from the primary, as they are usually
+        fetched right after a change; replica=False reads the whole list
+        from the primary too.
+        """
         query = """
         SELECT c.CustomerID, c.FirstName, c.LastName, 
                cp.Phone, ce.Email
         FROM Tb_Customer c
         LEFT JOIN Tb_CustomerPhone cp ON c.CustomerID = cp.CustomerID
         LEFT JOIN Tb_CustomerEmail ce ON c.CustomerID = ce.CustomerID
-        ORDER BY c.CustomerID DESC
         """
-        return self.fetch_df(query)
+        if customer_ids is not None:
+            where = "WHERE c.CustomerID IN ({})".format(', '.join(['%s'] * len(customer_ids)))
+            return self.fetch_df(query + where, tuple(customer_ids)) if customer_ids else pd.DataFrame()
+        return self.fetch_df(query + "ORDER BY c.CustomerID DESC", replica=replica, prepared=True)
     
     def get_customer_purchase_history(self, customer_id: int) -> pd.DataFrame:
-        """Get purchase history for a customer"""
-        try:
-            cursor = self.connection.cursor()
-            cursor.callproc('sp_CustomerPurchaseHistory', [customer_id])
-            
-            for result in cursor.stored_results():
-                columns = [desc[0] for desc in result.description]
-                data = result.fetchall()
-                df = pd.DataFrame(data, columns=columns)
-            
-            cursor.close()
-            return df if not df.empty else pd.DataFrame()
-        except Error as e:
-            print(f"Error: {e}")
-            return pd.DataFrame()
+        """Get purchase history for a customer, reading archived years from their files
+
+        Raises ArchiveUnavailable if an archived year cannot be read from
+        archive_dir.
+        """
+        hot = self.fetch_proc_df('sp_CustomerPurchaseHistory', [customer_id], replica=True)
+        archived = self.archived_years()
+        if not archived:
+            return hot
+        
+        cold = read_purchase_history(self.archive_dir, archived, customer_id, self._item_names)
+        return self._merge_archived(hot, cold, archived, ascending=False)
+    
+    def _item_names(self, item_ids: List[int]) -> Dict[int, str]:
+        if not item_ids:
+            return {}
+        rows = self.fetch_query(
+            "SELECT ItemID, Name FROM Tb_Item WHERE ItemID IN ({})".format(
+                ', '.join(['%s'] * len(item_ids))),
+            tuple(item_ids), replica=True)
+        return dict(rows)
     
     # ==================== ITEM OPERATIONS ====================
     
-    def get_all_items(self) -> pd.DataFrame:
-        """Get all items with category info"""
+    def get_all_items(self, item_ids: Optional[List[int]] = None,
+                      replica: bool = True) -> pd.DataFrame:
+        """Get all items with category info, or just the given items (from the primary)
+
+        replica=False reads the whole catalogue from the primary too.
+        """
         query = """
-        SELECT i.ItemID, i.Name, i.Condition, i.Price, 
-               c.CategoryName, inv.QuantityAvailable, inv.Location
+        SELECT i.ItemID, i.SKU, i.Name, i.Condition, i.Price, 
+               c.CategoryName, inv.QuantityAvailable, inv.Location, i.IntakeDate
         FROM Tb_Item i
         JOIN Tb_Category c ON i.CategoryID = c.CategoryID
         LEFT JOIN Tb_Inventory inv ON i.ItemID = inv.ItemID
-        ORDER BY i.ItemID DESC
         """
-        return self.fetch_df(query)
+        if item_ids is not None:
+            where = "WHERE i.ItemID IN ({})".format(', '.join(['%s'] * len(item_ids)))
+            return self.fetch_df(query + where, tuple(item_ids)) if item_ids else pd.DataFrame()
+        return self.fetch_df(query + "ORDER BY i.ItemID DESC", replica=replica, prepared=True)
     
     def add_item(self, name: str, condition: str, price: float, 
-                 category_id: int, supplier_id: int = None) -> Tuple[bool, str]:
+                 category_id: int, supplier_id: int = None,
+                 sku: str = None) -> Tuple[bool, str]:
         """Add new item"""
         query = """
-        INSERT INTO Tb_Item (Name, `Condition`, Price, CategoryID, SupplierID)
-        VALUES (%s, %s, %s, %s, %s)
+        INSERT INTO Tb_Item (SKU, Name, `Condition`, Price, CategoryID, SupplierID)
+        VALUES (%s, %s, %s, %s, %s, %s)
         """
         try:
+            self.connection.start_transaction()
             cursor = self.connection.cursor()
-            cursor.execute(query, (name, condition, price, category_id, supplier_id))
+            cursor.execute(query, (sku or None, name, condition, price, category_id, supplier_id))
             item_id = cursor.lastrowid
+            events = [ChangeEvent(ITEM, item_id, ('SKU', 'Name', 'Condition', 'Price',
+                                                  'CategoryID', 'SupplierID'))]
+            self._record_changes(cursor, events)
             self.connection.commit()
             cursor.close()
+            self._committed(events)
             return True, f"Item added successfully with ID: {item_id}"
         except Error as e:
             self.connection.rollback()
@@ -167,6 +496,7 @@ class ThriftStoreDB:
     def update_item_price(self, item_id: int, new_price: float) -> Tuple[bool, str]:
         """Update item price using stored procedure"""
         try:
+            self.connection.start_transaction()
             cursor = self.connection.cursor()
             cursor.callproc('sp_UpdateItemPrice', [item_id, new_price])
             
@@ -174,44 +504,87 @@ class ThriftStoreDB:
                 row = result.fetchone()
                 message = row[0] if row else "Price updated successfully"
             
+            events = [ChangeEvent(ITEM, item_id, ('Price',))]
+            self._record_changes(cursor, events)
             self.connection.commit()
             cursor.close()
+            self._committed(events)
             return True, message
         except Error as e:
             self.connection.rollback()
             return False, f"Error: {str(e)}"
     
+    def lookup_item(self, sku: str) -> Optional[Dict]:
+        """Find an in-catalogue item by SKU/barcode, served from the hot-item cache when possible
+
+        Returns None for an unknown SKU and raises Error if the database
+        could not be read, so the till can tell the two apart.
+        """
+        item = self.item_cache.get(sku)
+        if item is not None:
+            return item
+        
+        generation = self._item_generation
+        query = """
+        SELECT i.ItemID, i.Name, i.Price,
+               COALESCE(SUM(inv.QuantityAvailable), 0) AS QuantityAvailable
+        FROM Tb_Item i
+        LEFT JOIN Tb_Inventory inv ON i.ItemID = inv.ItemID
+        WHERE i.SKU = %s
+        GROUP BY i.ItemID, i.Name, i.Price
+        """
+        result = self.fetch_query(query, (sku,), prepared=True, raise_errors=True)
+        if not result:
+            return None
+        
+        item_id, name, price, quantity = result[0]
+        item = {
+            'ItemID': item_id,
+            'SKU': sku,
+            'Name': name,
+            'Price': float(price),
+            'QuantityAvailable': int(quantity)
+        }
+        if generation == self._item_generation:
+            self.item_cache.put(sku, item)
+        return item
+    
+    def _invalidate_item(self, item_id: int):
+        """Drop cached lookups for an item whose price or stock changed"""
+        self._item_generation += 1
+        self.item_cache.invalidate_where(lambda item: item['ItemID'] == item_id)
+    
+    def _on_item_change(self, event: ChangeEvent):
+        self._invalidate_item(event.entity_id)
+    
     def get_low_stock_items(self, threshold: int = 5) -> pd.DataFrame:
         """Get low stock items using stored procedure"""
-        try:
-            cursor = self.connection.cursor()
-            cursor.callproc('sp_LowStockAlert', [threshold])
-            
-            for result in cursor.stored_results():
-                columns = [desc[0] for desc in result.description]
-                data = result.fetchall()
-                df = pd.DataFrame(data, columns=columns)
-            
-            cursor.close()
-            return df if not df.empty else pd.DataFrame()
-        except Error as e:
-            print(f"Error: {e}")
-            return pd.DataFrame()
+        return self.fetch_proc_df('sp_LowStockAlert', [threshold], replica=True)
     
     # ==================== INVENTORY OPERATIONS ====================
     
     def add_inventory(self, item_id: int, quantity: int, location: str) -> Tuple[bool, str]:
-        """Add or update inventory"""
+        """Add or update inventory, recording the received quantity as a stock batch"""
         query = """
         INSERT INTO Tb_Inventory (ItemID, QuantityAvailable, Location)
         VALUES (%s, %s, %s)
         ON DUPLICATE KEY UPDATE QuantityAvailable = QuantityAvailable + %s
         """
         try:
+            self.connection.start_transaction()
             cursor = self.connection.cursor()
             cursor.execute(query, (item_id, quantity, location, quantity))
+            if quantity > 0:
+                # Received stock is aged from this batch (see get_inventory_aging)
+                cursor.execute(
+                    "INSERT INTO Tb_StockBatch (ItemID, Location, Quantity) VALUES (%s, %s, %s)",
+                    (item_id, location, quantity)
+                )
+            events = [ChangeEvent(INVENTORY, item_id, ('QuantityAvailable', 'Location'))]
+            self._record_changes(cursor, events)
             self.connection.commit()
             cursor.close()
+            self._committed(events)
             return True, "Inventory updated successfully"
         except Error as e:
             self.connection.rollback()
@@ -224,6 +597,7 @@ class ThriftStoreDB:
         """Create new transaction"""
         now = datetime.now()
         try:
+            self.connection.start_transaction()
             cursor = self.connection.cursor()
             cursor.callproc('sp_ProcessTransaction', 
                           [customer_id, employee_id, payment_mode, 
@@ -234,8 +608,12 @@ class ThriftStoreDB:
                 row = result.fetchone()
                 trans_id = row[0] if row else None
             
+            events = [ChangeEvent(TRANSACTION, trans_id, ('CustomerID', 'EmployeeID',
+                                                          'PaymentMode'))] if trans_id else []
+            self._record_changes(cursor, events)
             self.connection.commit()
             cursor.close()
+            self._committed(events)
             
             if trans_id:
                 return True, trans_id, "Transaction created successfully"
@@ -248,6 +626,7 @@ class ThriftStoreDB:
                             quantity: int) -> Tuple[bool, str]:
         """Add item to transaction"""
         try:
+            self.connection.start_transaction()
             cursor = self.connection.cursor()
             cursor.callproc('sp_AddTransactionItem', [transaction_id, item_id, quantity])
             
@@ -255,38 +634,150 @@ class ThriftStoreDB:
                 row = result.fetchone()
                 message = row[0] if row else "Item added to transaction"
             
+            events = [ChangeEvent(TRANSACTION, transaction_id, ('TotalAmount', 'Items')),
+                      ChangeEvent(INVENTORY, item_id, ('QuantityAvailable',))]
+            self._record_changes(cursor, events)
             self.connection.commit()
             cursor.close()
+            self._committed(events)
             return True, message
         except Error as e:
             self.connection.rollback()
             return False, f"Error: {str(e)}"
     
-    def get_sales_report(self, start_year: int, start_month: int, 
-                        end_year: int, end_month: int) -> pd.DataFrame:
-        """Get sales report for date range"""
+    def record_sale(self, idempotency_key: str, customer_id: int, employee_id: int,
+                    payment_mode: str, lines: List[Tuple[int, int]],
+                    sold_at: datetime) -> Tuple[str, int, str]:
+        """Record a whole sale (header + lines) atomically, at most once per key
+
+        Used to replay sales from a till's local queue. Returns (status,
+        transaction_id, message) where status is SALE_APPLIED, SALE_DUPLICATE
+        (the key was already recorded), SALE_CONFLICT (the database rejected
+        the sale, e.g. insufficient inventory) or SALE_ERROR (try again later).
+        """
+        cursor = None
         try:
+            self.connection.start_transaction()
+            recorded = self._idempotent_transaction(idempotency_key)
+            if recorded is not None:
+                self.connection.rollback()
+                return SALE_DUPLICATE, recorded, "Sale already recorded"
+
             cursor = self.connection.cursor()
-            cursor.callproc('sp_SalesReport', 
-                          [start_year, start_month, end_year, end_month])
-            
+            cursor.callproc('sp_ProcessTransaction',
+                            [customer_id, employee_id, payment_mode,
+                             sold_at.day, sold_at.month, sold_at.year])
+            trans_id = None
             for result in cursor.stored_results():
-                columns = [desc[0] for desc in result.description]
-                data = result.fetchall()
-                df = pd.DataFrame(data, columns=columns)
+                row = result.fetchone()
+                trans_id = row[0] if row else None
+            if not trans_id:
+                self.connection.rollback()
+                return SALE_ERROR, 0, "Failed to create transaction"
             
-            cursor.close()
-            return df if not df.empty else pd.DataFrame()
+            for item_id, quantity in lines:
+                cursor.callproc('sp_AddTransactionItem', [trans_id, item_id, quantity])
+                for result in cursor.stored_results():
+                    result.fetchall()
+            
+            cursor.execute(
+                "INSERT INTO Tb_SaleIdempotency (IdempotencyKey, TransactionID) VALUES (%s, %s)",
+                (idempotency_key, trans_id)
+            )
+            events = [ChangeEvent(TRANSACTION, trans_id, ('CustomerID', 'EmployeeID', 'PaymentMode',
+                                                          'TotalAmount', 'Items'))]
+            events += [ChangeEvent(INVENTORY, item_id, ('QuantityAvailable',))
+                       for item_id in sorted({item_id for item_id, _ in lines})]
+            self._record_changes(cursor, events)
+            self.connection.commit()
+            self._committed(events)
+            return SALE_APPLIED, trans_id, "Sale recorded"
         except Error as e:
-            print(f"Error: {e}")
+            try:
+                self.connection.rollback()
+            except Error:
+                pass
+            if e.errno == errorcode.ER_DUP_ENTRY:
+                # Only a duplicate if another replay of the same key committed
+                # first; any other unique key means the sale itself was rejected
+                try:
+                    recorded = self._idempotent_transaction(idempotency_key)
+                except Error as check:
+                    return SALE_ERROR, 0, f"Error: {str(check)}"
+                if recorded is not None:
+                    return SALE_DUPLICATE, recorded, "Sale already recorded"
+                return SALE_CONFLICT, 0, e.msg
+            if e.sqlstate == '45000' or (e.sqlstate or '').startswith('23'):
+                # Rejected by a business rule or constraint; retrying will not help
+                return SALE_CONFLICT, 0, e.msg
+            return SALE_ERROR, 0, f"Error: {str(e)}"
+        finally:
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Error:
+                    pass
+
+    def _idempotent_transaction(self, idempotency_key: str) -> Optional[int]:
+        """TransactionID recorded for an idempotency key, None if it has none"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                "SELECT TransactionID FROM Tb_SaleIdempotency WHERE IdempotencyKey = %s",
+                (idempotency_key,)
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
+        finally:
+            cursor.close()
+
+    def get_sales_report(self, start_year: int, start_month: int, 
+                        end_year: int, end_month: int) -> pd.DataFrame:
+        """Get sales report for date range, reading archived years from their files
+
+        Raises ArchiveUnavailable if an archived year in the range cannot be
+        read from archive_dir.
+        """
+        hot = self.fetch_proc_df('sp_SalesReport',
+                                 [start_year, start_month, end_year, end_month],
+                                 replica=True)
+        archived = {year: files[0] for year, files in self.archived_years().items()
+                    if start_year <= year <= end_year}
+        if not archived:
+            return hot
+        
+        cold = read_sales_report(self.archive_dir, archived, start_year, start_month,
+                                 end_year, end_month)
+        return self._merge_archived(hot, cold, archived)
+    
+    def _merge_archived(self, hot: pd.DataFrame, cold: pd.DataFrame, archived: Dict,
+                        ascending: bool = True) -> pd.DataFrame:
+        """Procedure rows and rows read from archived years, in TransactionDate order"""
+        if not hot.empty:
+            # Rows of an archived year still being deleted are served from the file
+            years = hot['TransactionDate'].astype(str).str.rsplit('-', n=1).str[-1].astype(int)
+            hot = hot[~years.isin(list(archived)).to_numpy()]
+        parts = [df for df in (cold, hot) if not df.empty]
+        if not parts:
             return pd.DataFrame()
+        report = pd.concat(parts, ignore_index=True)
+        order = pd.to_datetime(report['TransactionDate'].astype(str), format='%d-%m-%Y')
+        order = order.sort_values(ascending=ascending, kind='stable')
+        return report.loc[order.index].reset_index(drop=True)
+    
+    def archived_years(self) -> Dict[int, Tuple[str, str]]:
+        """{year: (transactions file, items file)} for years moved to the archive"""
+        rows = self.fetch_query("SELECT YY, TransactionsFile, ItemsFile FROM Tb_ArchivedYear",
+                                replica=True, prepared=True)
+        return {year: (transactions_file, items_file)
+                for year, transactions_file, items_file in rows}
     
     # ==================== CATEGORY OPERATIONS ====================
     
     def get_all_categories(self) -> pd.DataFrame:
         """Get all categories"""
         query = "SELECT CategoryID, CategoryName, Description FROM Tb_Category"
-        return self.fetch_df(query)
+        return self.fetch_df(query, replica=True, prepared=True)
     
     # ==================== EMPLOYEE OPERATIONS ====================
     
@@ -297,7 +788,7 @@ class ThriftStoreDB:
         FROM Tb_Employee e
         ORDER BY e.EmployeeID
         """
-        return self.fetch_df(query)
+        return self.fetch_df(query, replica=True, prepared=True)
     
     # ==================== DONATION OPERATIONS ====================
     
@@ -306,7 +797,9 @@ class ThriftStoreDB:
         """Add new donation"""
         now = datetime.now()
         try:
+            self.connection.start_transaction()
             cursor = self.connection.cursor()
+            events = []
             cursor.callproc('sp_AddDonation', 
                           [donor_id, employee_id, estimated_value, 
                            now.day, now.month, now.year])
@@ -314,9 +807,14 @@ class ThriftStoreDB:
             for result in cursor.stored_results():
                 row = result.fetchone()
                 message = row[1] if row else "Donation recorded successfully"
+                if row:
+                    events = [ChangeEvent(DONATION, row[0], ('DonorID', 'EmployeeID',
+                                                             'EstimatedValue'))]
             
+            self._record_changes(cursor, events)
             self.connection.commit()
             cursor.close()
+            self._committed(events)
             return True, message
         except Error as e:
             self.connection.rollback()
@@ -330,28 +828,192 @@ class ThriftStoreDB:
         LEFT JOIN Tb_DonorPhone dp ON d.DonorID = dp.DonorID
         ORDER BY d.DonorID
         """
-        return self.fetch_df(query)
+        return self.fetch_df(query, replica=True, prepared=True)
     
     # ==================== ANALYTICS FUNCTIONS ====================
     
     def get_customer_total_purchases(self, customer_id: int) -> float:
         """Get customer's total purchase amount"""
         query = "SELECT fn_CustomerTotalPurchases(%s) AS total"
-        result = self.fetch_query(query, (customer_id,))
+        result = self.fetch_query(query, (customer_id,), replica=True, prepared=True)
         return float(result[0][0]) if result else 0.0
     
     def get_category_inventory_value(self, category_id: int) -> float:
         """Get total inventory value for a category"""
         query = "SELECT fn_CategoryInventoryValue(%s) AS value"
-        result = self.fetch_query(query, (category_id,))
+        result = self.fetch_query(query, (category_id,), replica=True, prepared=True)
         return float(result[0][0]) if result else 0.0
     
     def get_employee_sales_total(self, employee_id: int) -> float:
         """Get employee's total sales processed"""
         query = "SELECT fn_EmployeeSalesTotal(%s) AS total"
-        result = self.fetch_query(query, (employee_id,))
+        result = self.fetch_query(query, (employee_id,), replica=True, prepared=True)
         return float(result[0][0]) if result else 0.0
     
+    def get_inventory_value_by_category(self) -> pd.DataFrame:
+        """Inventory value of every category in one grouped query"""
+        query = """
+        SELECT c.CategoryID, c.CategoryName,
+               COALESCE(SUM(i.Price * inv.QuantityAvailable), 0) AS InventoryValue
+        FROM Tb_Category c
+        LEFT JOIN Tb_Item i ON i.CategoryID = c.CategoryID
+        LEFT JOIN Tb_Inventory inv ON inv.ItemID = i.ItemID
+        GROUP BY c.CategoryID, c.CategoryName
+        ORDER BY c.CategoryName
+        """
+        return self.fetch_df(query, replica=True, prepared=True)
+    
+    def get_employee_performance(self) -> pd.DataFrame:
+        """Sales total of every employee in one grouped query"""
+        query = """
+        SELECT e.EmployeeID, CONCAT(e.FirstName, ' ', e.LastName) AS Employee, e.Role,
+               COALESCE(hot.Total, 0) + COALESCE(cold.Total, 0) AS TotalSales
+        FROM Tb_Employee e
+        LEFT JOIN (
+            SELECT EmployeeID, SUM(TotalAmount) AS Total
+            FROM Tb_Transaction
+            WHERE YY NOT IN (SELECT YY FROM Tb_ArchivedYear)
+            GROUP BY EmployeeID
+        ) hot ON hot.EmployeeID = e.EmployeeID
+        LEFT JOIN (
+            SELECT EmployeeID, SUM(TotalAmount) AS Total
+            FROM Tb_ArchivedSalesTotal
+            GROUP BY EmployeeID
+        ) cold ON cold.EmployeeID = e.EmployeeID
+        ORDER BY e.EmployeeID
+        """
+        return self.fetch_df(query, replica=True, prepared=True)
+    
+    def iter_transaction_lines(self, after_transaction_id: int = 0, chunk_size: int = 50000,
+                               level: str = 'item',
+                               transaction_ids: Optional[List[int]] = None) -> Iterator[np.ndarray]:
+        """Stream (TransactionID, ItemID or CategoryID) pairs in transaction order
+        
+        Yields int64 arrays of shape (n, 2) with at most chunk_size rows, so the
+        full line table never has to be materialised at once. With
+        transaction_ids, only those transactions are read. Errors are raised,
+        so a caller never mistakes a cut-off stream for the end of the table.
+        """
+        if transaction_ids is not None and not transaction_ids:
+            return
+        if transaction_ids is not None:
+            where = "ti.TransactionID IN ({})".format(', '.join(['%s'] * len(transaction_ids)))
+            params = tuple(transaction_ids)
+        else:
+            where, params = "ti.TransactionID > %s", (after_transaction_id,)
+        if level == 'category':
+            query = f"""
+            SELECT ti.TransactionID, i.CategoryID
+            FROM Tb_TransactionItem ti
+            JOIN Tb_Item i ON ti.ItemID = i.ItemID
+            WHERE {where}
+            ORDER BY ti.TransactionID
+            """
+        else:
+            query = f"""
+            SELECT ti.TransactionID, ti.ItemID
+            FROM Tb_TransactionItem ti
+            WHERE {where}
+            ORDER BY ti.TransactionID
+            """
+        connection = self._reader()
+        cursor = connection.cursor(buffered=False)
+        try:
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield np.array(rows, dtype=np.int64)
+        except Error as e:
+            if connection is not self.connection:
+                self._replica_failed(e)
+            raise
+        finally:
+            try:
+                cursor.close()
+            except Error:
+                pass
+    
+    def get_daily_item_sales(self, since: date) -> pd.DataFrame:
+        """Units sold per item per day from a date onwards, aggregated in one query
+        
+        Errors are raised, so a failed read is never mistaken for days without sales.
+        """
+        query = """
+        SELECT ti.ItemID, t.YY, t.MM, t.DD, SUM(ti.Quantity) AS Units
+        FROM Tb_TransactionItem ti
+        JOIN Tb_Transaction t ON ti.TransactionID = t.TransactionID
+        WHERE (t.YY, t.MM, t.DD) >= (%s, %s, %s)
+        GROUP BY ti.ItemID, t.YY, t.MM, t.DD
+        """
+        return self.fetch_df(query, (since.year, since.month, since.day),
+                             replica=True, prepared=True, raise_errors=True)
+    
+    def get_stock_levels(self) -> pd.DataFrame:
+        """Current stock per item summed over locations"""
+        query = """
+        SELECT i.ItemID, i.Name, c.CategoryName,
+               COALESCE(SUM(inv.QuantityAvailable), 0) AS QuantityAvailable
+        FROM Tb_Item i
+        JOIN Tb_Category c ON i.CategoryID = c.CategoryID
+        LEFT JOIN Tb_Inventory inv ON i.ItemID = inv.ItemID
+        GROUP BY i.ItemID, i.Name, c.CategoryName
+        """
+        return self.fetch_df(query, replica=True, prepared=True)
+    
+    def get_stock_batches(self, today: Optional[date] = None) -> pd.DataFrame:
+        """Received units per item, location and receiving day, with current stock
+        
+        One grouped query over Tb_StockBatch; AgeDays counts from today.
+        """
+        today = today or date.today()
+        query = """
+        SELECT b.ItemID, c.CategoryName, b.Location,
+               DATEDIFF(%s, b.ReceivedAt) AS AgeDays,
+               SUM(b.Quantity) AS Received,
+               COALESCE(MAX(inv.QuantityAvailable), 0) AS OnHand
+        FROM Tb_StockBatch b
+        JOIN Tb_Item i ON b.ItemID = i.ItemID
+        JOIN Tb_Category c ON i.CategoryID = c.CategoryID
+        LEFT JOIN Tb_Inventory inv ON inv.ItemID = b.ItemID AND inv.Location = b.Location
+        GROUP BY b.ItemID, c.CategoryName, b.Location, AgeDays
+        """
+        return self.fetch_df(query, (today,), replica=True, prepared=True)
+    
+    def get_inventory_aging(self, by: Tuple[str, ...] = ('CategoryName', 'Location'),
+                            today: Optional[date] = None) -> pd.DataFrame:
+        """Days-on-shelf buckets, sell-through and turnover per category and/or location
+        
+        by is any of 'CategoryName' and 'Location'; see aging.aging_report.
+        """
+        return aging_report(self.get_stock_batches(today), by)
+    
+    def get_names(self, level: str, ids: List[int]) -> Dict[int, str]:
+        """Display names for item or category IDs"""
+        if not ids:
+            return {}
+        if level == 'category':
+            query = "SELECT CategoryID, CategoryName FROM Tb_Category WHERE CategoryID IN ({})"
+        else:
+            query = "SELECT ItemID, Name FROM Tb_Item WHERE ItemID IN ({})"
+        rows = self.fetch_query(query.format(', '.join(['%s'] * len(ids))),
+                                tuple(ids), replica=True)
+        return dict(rows)
+    
+    # ==================== SCHEDULED JOBS ====================
+    
+    def get_job_runs(self, limit: int = 200) -> pd.DataFrame:
+        """Most recent scheduled/manual job runs (scheduler.py)"""
+        query = """
+        SELECT RunID, JobName, ScheduledFor, StartedAt, FinishedAt, DurationMs,
+               Status, Detail, Host
+        FROM Tb_JobRun
+        ORDER BY RunID DESC
+        LIMIT %s
+        """
+        return self.fetch_df(query, (limit,), prepared=True)
+    
     # ==================== DASHBOARD ANALYTICS ====================
     
     def get_dashboard_stats(self) -> Dict:
@@ -359,23 +1021,28 @@ class ThriftStoreDB:
         stats = {}
         
         # Total Customers
-        result = self.fetch_query("SELECT COUNT(*) FROM Tb_Customer")
+        result = self.fetch_query("SELECT COUNT(*) FROM Tb_Customer", replica=True, prepared=True)
         stats['total_customers'] = result[0][0] if result else 0
         
         # Total Items
-        result = self.fetch_query("SELECT COUNT(*) FROM Tb_Item")
+        result = self.fetch_query("SELECT COUNT(*) FROM Tb_Item", replica=True, prepared=True)
         stats['total_items'] = result[0][0] if result else 0
         
-        # Total Transactions
-        result = self.fetch_query("SELECT COUNT(*) FROM Tb_Transaction")
-        stats['total_transactions'] = result[0][0] if result else 0
-        
-        # Total Revenue
-        result = self.fetch_query("SELECT COALESCE(SUM(TotalAmount), 0) FROM Tb_Transaction")
-        stats['total_revenue'] = float(result[0][0]) if result else 0.0
+        # Total Transactions and Revenue, including archived years
+        result = self.fetch_query("""
+        SELECT hot.Transactions + cold.Transactions, hot.Revenue + cold.Revenue
+        FROM (SELECT COUNT(*) AS Transactions, COALESCE(SUM(TotalAmount), 0) AS Revenue
+              FROM Tb_Transaction
+              WHERE YY NOT IN (SELECT YY FROM Tb_ArchivedYear)) hot,
+             (SELECT COALESCE(SUM(TransactionCount), 0) AS Transactions,
+                     COALESCE(SUM(TotalAmount), 0) AS Revenue
+              FROM Tb_ArchivedYear) cold
+        """, replica=True, prepared=True)
+        stats['total_transactions'] = int(result[0][0]) if result else 0
+        stats['total_revenue'] = float(result[0][1]) if result else 0.0
         
         # Low Stock Count
-        result = self.fetch_query("SELECT COUNT(*) FROM Tb_Inventory WHERE QuantityAvailable <= 5")
+        result = self.fetch_query("SELECT COUNT(*) FROM Tb_Inventory WHERE QuantityAvailable <= 5", replica=True, prepared=True)
         stats['low_stock_count'] = result[0][0] if result else 0
         
         return stats
@@ -0,0 +1,64 @@
+-- =====================================================
+-- THRIFT STORE MANAGEMENT SYSTEM - DEMO QUERIES
+-- =====================================================
+-- Run against a database prepared with `python migrate.py bootstrap`.
+-- These statements are for manual exploration only and are not applied
+-- by the migration runner.
+
+USE MINIPROJECT_DBMS;
+
+-- =====================================================
+-- TESTING & DEMONSTRATION QUERIES
+-- =====================================================
+
+-- Test Functions
+SELECT fn_CustomerTotalPurchases(1) AS 'Customer 1 Total Purchases';
+SELECT fn_CategoryInventoryValue(1) AS 'Clothing Category Value';
+SELECT fn_EmployeeSalesTotal(2) AS 'Employee 2 Sales Total';
+SELECT fn_DonorTotalValue(1) AS 'Donor 1 Total Donations';
+SELECT fn_CategoryAvgPrice(1) AS 'Clothing Avg Price';
+SELECT fn_CountItemsByCondition('Good') AS 'Items in Good Condition';
+
+-- Test Procedures
+CALL sp_AddCustomer('Test', 'User', '9999999999', 'test@email.com');
+CALL sp_LowStockAlert(5);
+CALL sp_SalesReport(2024, 9, 2024, 10);
+CALL sp_CustomerPurchaseHistory(1);
+
+-- View trigger effects
+SELECT * FROM Tb_InventoryLog;
+
+-- =====================================================
+-- DROP STATEMENTS (for cleanup/reset if needed)
+-- =====================================================
+
+/*
+-- Drop Functions
+DROP FUNCTION IF EXISTS fn_CustomerTotalPurchases;
+DROP FUNCTION IF EXISTS fn_CategoryInventoryValue;
+DROP FUNCTION IF EXISTS fn_EmployeeSalesTotal;
+DROP FUNCTION IF EXISTS fn_DonorTotalValue;
+DROP FUNCTION IF EXISTS fn_CategoryAvgPrice;
+DROP FUNCTION IF EXISTS fn_CountItemsByCondition;
+
+-- Drop Procedures
+DROP PROCEDURE IF EXISTS sp_AddCustomer;
+DROP PROCEDURE IF EXISTS sp_ProcessTransaction;
+DROP PROCEDURE IF EXISTS sp_AddTransactionItem;
+DROP PROCEDURE IF EXISTS sp_SalesReport;
+DROP PROCEDURE IF EXISTS sp_LowStockAlert;
+DROP PROCEDURE IF EXISTS sp_AddDonation;
+DROP PROCEDURE IF EXISTS sp_UpdateItemPrice;
+DROP PROCEDURE IF EXISTS sp_CustomerPurchaseHistory;
+
+-- Drop Triggers
+DROP TRIGGER IF EXISTS tr_ValidateTransactionDate;
+DROP TRIGGER IF EXISTS tr_PreventCategoryDelete;
+DROP TRIGGER IF EXISTS tr_UpdateTransactionTotal;
+DROP TRIGGER IF EXISTS tr_LogInventoryUpdate;
+DROP TRIGGER IF EXISTS tr_PreventNegativeInventory;
+DROP TRIGGER IF EXISTS tr_ValidateDonationDate;
+
+-- Drop Log Table
+DROP TABLE IF EXISTS Tb_InventoryLog;
+*/
@@ -0,0 +1,210 @@
+"""
+Thrift Store Management System - Change Feed
+Write methods publish a ChangeEvent per changed row to an in-process bus
+and record it in Tb_ChangeOutbox in the same transaction. An OutboxPoller
+replays rows written by other app processes onto the local bus, so caches
+and open pages can refresh just the affected rows.
+"""
+
+import os
+import socket
+import threading
+import time
+import uuid
+import weakref
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from mysql.connector import Error
+
+# Identifies this process's rows in Tb_ChangeOutbox
+ORIGIN = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"[-64:]
+
+# Entities published by ThriftStoreDB; IDs are the entity's primary key
+# (inventory events carry the ItemID)
+CUSTOMER = 'customer'
+ITEM = 'item'
+INVENTORY = 'inventory'
+TRANSACTION = 'transaction'
+DONATION = 'donation'
+
+# Outbox IDs can commit out of order; a skipped ID is re-checked for this
+# long before it is taken to be a rolled-back write
+GAP_TIMEOUT_SECONDS = 10.0
+MAX_GAPS = 1000
+# Longest wait between polls while the database is unreachable
+MAX_BACKOFF_SECONDS = 60.0
+
+
+class ChangeEvent(NamedTuple):
+    entity: str
+    entity_id: int
+    fields: Tuple[str, ...]
+    origin: str = ORIGIN
+
+
+class EventBus:
+    def __init__(self):
+        """Thread-safe publish/subscribe; callbacks run in the publishing thread
+
+        Bound methods are held weakly, so a subscriber object (a session's
+        ThriftStoreDB, a page's ChangeTracker) can be garbage collected
+        without unsubscribing.
+        """
+        self._lock = threading.Lock()
+        self._subscribers: List[Tuple[Callable[[], Optional[Callable]], Optional[Set[str]]]] = []
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None],
+                  entities: Optional[Iterable[str]] = None):
+        """Call callback(event) for events of the given entities (all when None)"""
+        if hasattr(callback, '__self__'):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback  # noqa: E731
+        with self._lock:
+            self._subscribers.append((ref, set(entities) if entities is not None else None))
+
+    def publish(self, events: Iterable[ChangeEvent]):
+        with self._lock:
+            self._subscribers = [(ref, entities) for ref, entities in self._subscribers
+                                 if ref() is not None]
+            subscribers = list(self._subscribers)
+        for event in events:
+            for ref, entities in subscribers:
+                callback = ref()
+                if callback is None or (entities is not None and event.entity not in entities):
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"Change subscriber failed on {event}: {e}")
+
+
+# Shared by every session in this process
+bus = EventBus()
+
+
+class ChangeTracker:
+    def __init__(self, entities: Iterable[str], event_bus: EventBus = bus, limit: int = 500):
+        """Collect IDs of changed rows until drained
+
+        After more than limit changes, overflowed is set and the caller
+        should reload everything instead of patching row by row.
+        """
+        self.limit = limit
+        self.overflowed = False
+        self._ids: Set[int] = set()
+        self._lock = threading.Lock()
+        event_bus.subscribe(self._on_change, entities)
+
+    def _on_change(self, event: ChangeEvent):
+        with self._lock:
+            if len(self._ids) < self.limit:
+                self._ids.add(event.entity_id)
+            else:
+                self.overflowed = True
+
+    def drain(self) -> Tuple[Set[int], bool]:
+        """Changed IDs since the last drain, and whether the tracker overflowed"""
+        with self._lock:
+            ids, overflowed = self._ids, self.overflowed
+            self._ids, self.overflowed = set(), False
+        return ids, overflowed
+
+
+class OutboxPoller(threading.Thread):
+    def __init__(self, connect: Callable, event_bus: EventBus = bus,
+                 interval: float = 1.0, batch_size: int = 500):
+        """Background thread publishing other processes' outbox rows on the local bus
+
+        connect returns a new, unconnected ThriftStoreDB. Polling starts
+        from the newest row present when the poller first connects.
+        """
+        super().__init__(name='change-outbox-poller', daemon=True)
+        self.bus = event_bus
+        self.interval = interval
+        self.batch_size = batch_size
+        self.last_id: Optional[int] = None
+        self._gaps: Dict[int, float] = {}  # missing OutboxID -> when it was noticed
+        self._connect = connect
+        self._db = None
+        self._stopping = threading.Event()
+
+    def stop(self):
+        self._stopping.set()
+
+    def run(self):
+        backoff = self.interval
+        while not self._stopping.is_set():
+            try:
+                while self.poll_once() == self.batch_size:
+                    pass
+            except Error as e:
+                print(f"Change outbox poll failed: {e}")
+                self._drop_connection()
+            if self._db is None:
+                # Unreachable: reconnect on the next poll, backing off meanwhile
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+            else:
+                backoff = self.interval
+            self._stopping.wait(backoff)
+
+    def _drop_connection(self):
+        db, self._db = self._db, None
+        if db is not None:
+            try:
+                db.disconnect()
+            except Error:
+                pass
+
+    def _database(self):
+        if self._db is not None and self._db.connection is not None \
+                and self._db.connection.is_connected():
+            return self._db
+        db = self._connect()
+        if not db.connect():
+            return None
+        self._db = db
+        return db
+
+    def poll_once(self) -> int:
+        """Publish one batch of new foreign outbox rows; returns rows read"""
+        db = self._database()
+        if db is None:
+            return 0
+        if self.last_id is None:
+            rows = db.fetch_query("SELECT COALESCE(MAX(OutboxID), 0) FROM Tb_ChangeOutbox")
+            if not rows:
+                return 0
+            self.last_id = rows[0][0]
+            return 0
+
+        now = time.monotonic()
+        self._gaps = {i: seen for i, seen in self._gaps.items()
+                      if now - seen < GAP_TIMEOUT_SECONDS}
+        late = []
+        if self._gaps:
+            gaps = sorted(self._gaps)
+            late = db.fetch_query(
+                "SELECT OutboxID, Entity, EntityID, Fields, Origin FROM Tb_ChangeOutbox "
+                "WHERE OutboxID IN ({})".format(', '.join(['%s'] * len(gaps))), tuple(gaps)
+            )
+            for row in late:
+                self._gaps.pop(row[0], None)
+
+        rows = db.fetch_query(
+            "SELECT OutboxID, Entity, EntityID, Fields, Origin FROM Tb_ChangeOutbox "
+            "WHERE OutboxID > %s ORDER BY OutboxID LIMIT %s",
+            (self.last_id, self.batch_size), prepared=True
+        )
+        if rows:
+            present = {row[0] for row in rows}
+            for missing in range(self.last_id + 1, rows[-1][0]):
+                if missing not in present and len(self._gaps) < MAX_GAPS:
+                    self._gaps[missing] = now
+            self.last_id = rows[-1][0]
+
+        self.bus.publish(ChangeEvent(entity, entity_id, tuple(fields.split(',')) if fields else (),
+                                     origin)
+                         for _, entity, entity_id, fields, origin in late + rows
+                         if origin != ORIGIN)
+        return len(rows)
@@ -0,0 +1,194 @@
+"""
+Thrift Store Management System - Multi-Store Federation
+Runs report methods concurrently against every branch database and merges
+the results into one DataFrame with a Store column
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Tuple
+
+import pandas as pd
+from mysql.connector import Error
+
+from archive import ARCHIVE_DIR
+from database import ThriftStoreDB
+
+# Extra time a store gets to return after its query was killed
+KILL_GRACE_SECONDS = 5
+
+
+class StoreRegistry:
+    def __init__(self, stores: Dict[str, Dict]):
+        """Map store name -> connection settings (host, port, user, password, database)"""
+        self.stores = stores
+
+    @classmethod
+    def from_json(cls, path: str) -> 'StoreRegistry':
+        """Load a registry file; see stores.example.json
+
+        A store may give password_env instead of password to read the
+        password from an environment variable.
+        """
+        with open(path, encoding='utf-8') as f:
+            config = json.load(f)
+        defaults = config.get('defaults', {})
+        stores = {}
+        for entry in config['stores']:
+            settings = {**defaults, **entry}
+            if 'password_env' in settings:
+                settings['password'] = os.environ.get(settings.pop('password_env'), '')
+            stores[settings.pop('name')] = settings
+        return cls(stores)
+
+    def names(self) -> List[str]:
+        return list(self.stores)
+
+
+class FederatedReports:
+    def __init__(self, registry: StoreRegistry, max_workers: int = 8, timeout: int = 10):
+        """Fan report calls out over a bounded thread pool
+
+        Each store keeps one connection, used by one worker at a time.
+        timeout (seconds) is each store's own deadline, counted from when a
+        worker picks it up: a report still running then has its query
+        killed on the server (stored procedure calls included) and is
+        reported as timed out, which frees the worker for the next store.
+        """
+        self.registry = registry
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='store-report')
+        self._connections: Dict[str, ThriftStoreDB] = {}
+        self._locks = {name: threading.Lock() for name in registry.names()}
+
+    def _connect(self, name: str) -> ThriftStoreDB:
+        settings = self.registry.stores[name]
+        db = ThriftStoreDB(settings.get('host', 'localhost'), settings.get('user', 'root'),
+                           settings.get('password', ''), settings['database'],
+                           port=int(settings.get('port', 3306)), timeout=self.timeout,
+                           archive_dir=settings.get('archive_dir', ARCHIVE_DIR),
+                           raise_errors=True)
+        if not db.connect():
+            raise ConnectionError(f"could not connect to {settings['database']}")
+        return db
+
+    def _store_db(self, name: str) -> ThriftStoreDB:
+        """Cached connection for a store, (re)connecting when needed"""
+        db = self._connections.get(name)
+        if db is not None and db.connection is not None and db.connection.is_connected():
+            return db
+        db = self._connect(name)
+        self._connections[name] = db
+        return db
+
+    def _kill_query(self, name: str, db: ThriftStoreDB, expired: threading.Event):
+        """Abort whatever the store's connection is running, from a second connection"""
+        expired.set()
+        try:
+            killer = self._connect(name)
+        except ConnectionError as e:
+            print(f"Could not interrupt {name}: {e}")
+            return
+        try:
+            killer.execute_query(f"KILL QUERY {int(db.connection.connection_id)}")
+        finally:
+            killer.disconnect()
+
+    def _run_one(self, name: str, report: Callable[[ThriftStoreDB], pd.DataFrame],
+                 started: Dict[str, float]) -> pd.DataFrame:
+        started[name] = time.monotonic()
+        lock = self._locks[name]
+        if not lock.acquire(timeout=self.timeout):
+            raise TimeoutError("previous request still running")
+        try:
+            db = self._store_db(name)
+            remaining = self.timeout - (time.monotonic() - started[name])
+            expired = threading.Event()
+            timer = threading.Timer(max(remaining, 0), self._kill_query, (name, db, expired))
+            timer.daemon = True
+            timer.start()
+            try:
+                df = report(db)
+            except Error:
+                if not expired.is_set():
+                    raise
+            finally:
+                timer.cancel()
+                # A kill already under way must land before the next report
+                # can use this connection
+                timer.join()
+            if expired.is_set():
+                # A kill that found the connection idle could still abort its
+                # next statement, so the connection is not reused
+                self._connections.pop(name, None)
+                db.disconnect()
+                raise TimeoutError(f"timed out after {self.timeout}s")
+            return df
+        finally:
+            lock.release()
+
+    def run(self, report: Callable[[ThriftStoreDB], pd.DataFrame]) -> Tuple[pd.DataFrame, Dict[str, str]]:
+        """Run report(db) for every store concurrently
+
+        Returns the merged frame (stores that failed or timed out are left
+        out) and a {store: error message} dict for those stores. Store
+        connections raise on query errors, so a failing store is reported
+        rather than shown with no rows.
+        """
+        names = self.registry.names()
+        started: Dict[str, float] = {}
+        futures = {self._executor.submit(self._run_one, name, report, started): name
+                   for name in names}
+        # Stores enforce their own deadlines; this only stops waiting on a
+        # store that could not even be interrupted
+        rounds = max(-(-len(names) // self.max_workers), 1)
+        done, not_done = wait(futures, timeout=rounds * (self.timeout + KILL_GRACE_SECONDS))
+        order = {name: i for i, name in enumerate(names)}
+
+        frames, errors = [], {}
+        for future in not_done:
+            future.cancel()
+            name = futures[future]
+            errors[name] = (f"timed out after {self.timeout}s" if name in started
+                            else "not started: every worker was busy")
+        for future in sorted(done, key=lambda f: order[futures[f]]):
+            name = futures[future]
+            try:
+                df = future.result()
+            except Exception as e:
+                errors[name] = str(e)
+                continue
+            if not df.empty:
+                frames.append(df.assign(Store=name))
+
+        if not frames:
+            return pd.DataFrame(), errors
+        merged = pd.concat(frames, ignore_index=True)
+        return merged[['Store'] + [c for c in merged.columns if c != 'Store']], errors
+
+    # ==================== CHAIN-WIDE REPORTS ====================
+
+    def sales_report(self, start_year: int, start_month: int,
+                     end_year: int, end_month: int) -> Tuple[pd.DataFrame, Dict[str, str]]:
+        return self.run(lambda db: db.get_sales_report(start_year, start_month,
+                                                       end_year, end_month))
+
+    def low_stock(self, threshold: int = 5) -> Tuple[pd.DataFrame, Dict[str, str]]:
+        return self.run(lambda db: db.get_low_stock_items(threshold))
+
+    def inventory_value(self) -> Tuple[pd.DataFrame, Dict[str, str]]:
+        return self.run(lambda db: db.get_inventory_value_by_category())
+
+    def employee_performance(self) -> Tuple[pd.DataFrame, Dict[str, str]]:
+        return self.run(lambda db: db.get_employee_performance())
+
+    def close(self):
+        """Stop the pool and close every store connection"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for db in self._connections.values():
+            db.disconnect()
@@ -0,0 +1,128 @@
+"""
+Thrift Store Management System - Demand Forecasting
+Sales velocity, days-until-stockout and reorder suggestions from daily
+per-item sales aggregates
+"""
+
+import threading
+from datetime import date, timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+SHORT_WINDOW_DAYS = 7
+LONG_WINDOW_DAYS = 28
+# Weight of the short window in the blended velocity; the rest goes to the long one
+SHORT_WINDOW_WEIGHT = 0.6
+
+
+def _epoch_days(years, months, days) -> np.ndarray:
+    """Vectorised (YY, MM, DD) columns -> days since 1970-01-01"""
+    dates = pd.to_datetime(pd.DataFrame({'year': years, 'month': months, 'day': days}))
+    return dates.to_numpy().astype('datetime64[D]').astype(np.int64)
+
+
+class SalesHistory:
+    def __init__(self, history_days: int = LONG_WINDOW_DAYS * 3):
+        """Cached daily units sold per item, refreshed incrementally"""
+        self.history_days = history_days
+        self.item_ids = np.empty(0, dtype=np.int64)
+        self.days = np.empty(0, dtype=np.int64)
+        self.units = np.empty(0, dtype=np.float64)
+        self.loaded_through: Optional[date] = None
+        self._lock = threading.Lock()
+
+    def refresh(self, db, today: Optional[date] = None):
+        """Load the history once, then only re-read from the last loaded day onwards
+
+        A database error is raised with the history left as it was, so the
+        same days are read again on the next refresh.
+        """
+        today = today or date.today()
+        with self._lock:
+            start = self.loaded_through or today - timedelta(days=self.history_days)
+            sales = db.get_daily_item_sales(start)
+            start_day = (start - date(1970, 1, 1)).days
+            horizon = (today - date(1970, 1, 1)).days - self.history_days
+
+            # The last loaded day may have gained sales since, so it is replaced
+            keep = (self.days < start_day) & (self.days >= horizon)
+            item_ids, days, units = self.item_ids[keep], self.days[keep], self.units[keep]
+            if not sales.empty:
+                item_ids = np.concatenate([item_ids, sales['ItemID'].to_numpy(dtype=np.int64)])
+                days = np.concatenate([days, _epoch_days(sales['YY'], sales['MM'], sales['DD'])])
+                units = np.concatenate([units, sales['Units'].to_numpy(dtype=np.float64)])
+            self.item_ids, self.days, self.units = item_ids, days, units
+            self.loaded_through = today
+
+    def velocities(self, items, today: Optional[date] = None) -> pd.DataFrame:
+        """Units/day over the short and long windows for every ItemID in items"""
+        today = today or date.today()
+        with self._lock:
+            item_ids, days, units = self.item_ids, self.days, self.units
+
+        item_index = pd.Index(np.asarray(items, dtype=np.int64))
+        age = (today - date(1970, 1, 1)).days - days
+        positions = item_index.get_indexer(item_ids)
+        known = positions >= 0
+        n = len(item_index)
+
+        result = {'ItemID': item_index.to_numpy()}
+        for label, window in (('Velocity7', SHORT_WINDOW_DAYS), ('Velocity28', LONG_WINDOW_DAYS)):
+            in_window = known & (age >= 0) & (age < window)
+            result[label] = np.bincount(positions[in_window], weights=units[in_window],
+                                        minlength=n) / window
+        return pd.DataFrame(result)
+
+
+def _with_velocity(stock: pd.DataFrame, velocities: pd.DataFrame) -> pd.DataFrame:
+    """Attach velocity columns to stock rows by ItemID"""
+    stock = stock.assign(ItemID=stock['ItemID'].astype(np.int64),
+                         QuantityAvailable=stock['QuantityAvailable'].fillna(0).astype(np.int64))
+    return stock.merge(velocities, on='ItemID', how='left').fillna(
+        {'Velocity7': 0.0, 'Velocity28': 0.0})
+
+
+def reorder_suggestions(stock: pd.DataFrame, velocities: pd.DataFrame,
+                        lead_days: int = 7, cover_days: int = 14) -> pd.DataFrame:
+    """Rank items by projected days until stockout
+
+    stock has ItemID, Name, CategoryName, QuantityAvailable; velocities comes
+    from SalesHistory.velocities. Items are suggested when they would run out
+    before a reorder placed today arrives plus cover_days of selling.
+    """
+    frame = _with_velocity(stock, velocities)
+    on_hand = frame['QuantityAvailable'].to_numpy(dtype=np.float64)
+    v_short = frame['Velocity7'].to_numpy(dtype=np.float64)
+    v_long = frame['Velocity28'].to_numpy(dtype=np.float64)
+    velocity = SHORT_WINDOW_WEIGHT * v_short + (1 - SHORT_WINDOW_WEIGHT) * v_long
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        days_left = np.where(velocity > 0, on_hand / velocity, np.inf)
+    target = velocity * (lead_days + cover_days)
+    reorder = np.ceil(np.clip(target - on_hand, 0, None))
+
+    frame = frame.assign(**{
+        'Velocity': velocity,
+        'DaysUntilStockout': days_left,
+        'ReorderQty': reorder.astype(np.int64),
+    })
+    due = (velocity > 0) & (days_left <= lead_days + cover_days)
+    return (frame[due]
+            .sort_values(['DaysUntilStockout', 'Velocity'], ascending=[True, False])
+            .reset_index(drop=True))
+
+
+def category_velocity(stock: pd.DataFrame, velocities: pd.DataFrame) -> pd.DataFrame:
+    """Roll item velocities and stock up to categories"""
+    frame = _with_velocity(stock, velocities)
+    grouped = frame.groupby('CategoryName').agg(
+        QuantityAvailable=('QuantityAvailable', 'sum'),
+        Velocity7=('Velocity7', 'sum'),
+        Velocity28=('Velocity28', 'sum'),
+    )
+    velocity = (SHORT_WINDOW_WEIGHT * grouped['Velocity7']
+                + (1 - SHORT_WINDOW_WEIGHT) * grouped['Velocity28'])
+    days_left = (grouped['QuantityAvailable'] / velocity).where(velocity > 0)
+    return grouped.assign(Velocity=velocity, DaysUntilStockout=days_left).reset_index()
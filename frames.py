@@ -0,0 +1,87 @@
+"""
+Thrift Store Management System - DataFrame Helpers
+Typed result frames and vectorized construction of widget options
+"""
+
+from string import Formatter
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+import pandas as pd
+from mysql.connector import FieldType
+
+# Arrow-backed columns when pyarrow is installed, pandas nullable dtypes otherwise
+try:
+    import pyarrow  # noqa: F401
+    DTYPE_BACKEND = 'pyarrow'
+    FLOAT_DTYPE = 'double[pyarrow]'
+except ImportError:
+    DTYPE_BACKEND = 'numpy_nullable'
+    FLOAT_DTYPE = 'Float64'
+
+DECIMAL_TYPES = {FieldType.DECIMAL, FieldType.NEWDECIMAL}
+
+
+def frame_from_rows(rows: List[tuple], description: Sequence[tuple]) -> pd.DataFrame:
+    """Build a typed DataFrame from cursor rows and cursor.description
+
+    DECIMAL columns become floats; every other column gets a concrete
+    nullable dtype instead of object.
+    """
+    columns = [desc[0] for desc in description]
+    df = pd.DataFrame.from_records(rows, columns=columns)
+    if df.empty:
+        return df
+
+    decimal_columns = [desc[0] for desc in description if desc[1] in DECIMAL_TYPES]
+    for column in decimal_columns:
+        df[column] = pd.to_numeric(df[column], errors='coerce').astype(FLOAT_DTYPE)
+
+    other_columns = [c for c in columns if c not in decimal_columns]
+    if other_columns:
+        df[other_columns] = df[other_columns].convert_dtypes(dtype_backend=DTYPE_BACKEND)
+    return df
+
+
+def options_from_columns(df: pd.DataFrame, label: str,
+                         value: Union[str, Tuple[str, ...]]) -> Dict[str, object]:
+    """Build {label: value} selectbox options from whole columns
+
+    label is a format template over column names, e.g.
+    "{FirstName} {LastName} (ID: {CustomerID})" or "{Name} - ₹{Price:.2f}".
+    value is a column name, or a tuple of column names for tuple values.
+    Values are plain Python scalars so they can be passed straight to the
+    database driver.
+    """
+    labels = pd.Series('', index=df.index, dtype=object)
+    for literal, field, spec, _ in Formatter().parse(label):
+        if literal:
+            labels = labels + literal
+        if field is None:
+            continue
+        text = df[field].map(('{:' + spec + '}').format, na_action='ignore')
+        labels = labels + text.astype(object).fillna('').to_numpy()
+
+    if isinstance(value, str):
+        values = df[value].tolist()
+    else:
+        values = list(zip(*(df[column].tolist() for column in value)))
+    return dict(zip(labels.tolist(), values))
+
+
+def patch_rows(df: pd.DataFrame, fresh: pd.DataFrame, key: str, ids: Iterable,
+               ascending: bool = False) -> pd.DataFrame:
+    """Replace the rows of df whose key is in ids with the rows of fresh
+
+    IDs missing from fresh are dropped (deleted rows). The result is sorted
+    by key, like the listing queries.
+    """
+    kept = df[~df[key].isin(list(ids))]
+    if fresh.empty:
+        return kept.reset_index(drop=True)
+    if not kept.empty:
+        try:
+            fresh = fresh.astype(kept.dtypes.to_dict())
+        except (TypeError, ValueError):
+            pass
+    merged = pd.concat([kept, fresh], ignore_index=True) if not kept.empty else fresh
+    return merged.sort_values(key, ascending=ascending, kind='stable').reset_index(drop=True)
@@ -0,0 +1,253 @@
+"""
+Thrift Store Management System - Schema Migrations
+This module applies the versioned scripts in migrations/ (and optionally
+seeds/) and records each one in Tb_SchemaVersion
+"""
+
+import argparse
+import getpass
+import hashlib
+import os
+import re
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+import mysql.connector
+from mysql.connector import Error
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+MIGRATIONS_DIR = os.path.join(BASE_DIR, 'migrations')
+SEEDS_DIR = os.path.join(BASE_DIR, 'seeds')
+
+SCRIPT_PATTERN = re.compile(r'^([VS])(\d+)__(\w+)\.sql$')
+
+VERSION_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS Tb_SchemaVersion (
+    Kind VARCHAR(10) NOT NULL,
+    Version INT NOT NULL,
+    Description VARCHAR(200) NOT NULL,
+    Checksum CHAR(64) NOT NULL,
+    AppliedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    DurationMs INT NOT NULL,
+    PRIMARY KEY (Kind, Version)
+)
+"""
+
+
+class Script(NamedTuple):
+    kind: str
+    version: int
+    description: str
+    path: str
+    checksum: str
+
+
+def discover_scripts(directory: str, kind: str) -> List[Script]:
+    """List versioned scripts in a directory, ordered by version"""
+    scripts = []
+    if not os.path.isdir(directory):
+        return scripts
+    for filename in os.listdir(directory):
+        match = SCRIPT_PATTERN.match(filename)
+        if not match:
+            continue
+        path = os.path.join(directory, filename)
+        with open(path, 'rb') as f:
+            checksum = hashlib.sha256(f.read()).hexdigest()
+        scripts.append(Script(kind, int(match.group(2)),
+                              match.group(3).replace('_', ' '), path, checksum))
+    scripts.sort(key=lambda s: s.version)
+    return scripts
+
+
+def split_statements(sql: str) -> List[str]:
+    """Split a script into statements, honouring the client-side DELIMITER command"""
+    statements = []
+    delimiter = ';'
+    buffer = []
+    for line in sql.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('--') or (not buffer and not stripped):
+            continue
+        if stripped.upper().startswith('DELIMITER '):
+            delimiter = stripped.split(None, 1)[1]
+            continue
+        if stripped.endswith(delimiter):
+            buffer.append(line.rstrip()[:-len(delimiter)])
+            statement = '\n'.join(buffer).strip()
+            if statement:
+                statements.append(statement)
+            buffer = []
+        else:
+            buffer.append(line)
+    leftover = '\n'.join(buffer).strip()
+    if leftover:
+        statements.append(leftover)
+    return statements
+
+
+class MigrationRunner:
+    def __init__(self, host: str, user: str, password: str, database: str,
+                 port: int = 3306):
+        """Initialize migration runner connection parameters"""
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.database = database
+        self.connection = None
+
+    def connect(self, create_database: bool = False) -> bool:
+        """Open the single session used for a whole migration run"""
+        try:
+            self.connection = mysql.connector.connect(
+                host=self.host,
+                port=self.port,
+                user=self.user,
+                password=self.password,
+                autocommit=True
+            )
+            cursor = self.connection.cursor()
+            if create_database:
+                cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{self.database}`")
+            cursor.execute(f"USE `{self.database}`")
+            cursor.execute(VERSION_TABLE_DDL)
+            cursor.close()
+            return True
+        except Error as e:
+            print(f"Error connecting to MySQL: {e}")
+            return False
+
+    def disconnect(self):
+        """Close the migration session"""
+        if self.connection and self.connection.is_connected():
+            self.connection.close()
+
+    def applied(self) -> Dict[tuple, str]:
+        """Map (kind, version) of every applied script to its recorded checksum"""
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT Kind, Version, Checksum FROM Tb_SchemaVersion")
+        rows = cursor.fetchall()
+        cursor.close()
+        return {(kind, version): checksum for kind, version, checksum in rows}
+
+    def scripts(self, include_seeds: bool = False) -> List[Script]:
+        """All known scripts: schema migrations first, then seeds"""
+        scripts = discover_scripts(MIGRATIONS_DIR, 'schema')
+        if include_seeds:
+            scripts += discover_scripts(SEEDS_DIR, 'seed')
+        return scripts
+
+    def pending(self, include_seeds: bool = False) -> List[Script]:
+        """Scripts that have not been applied yet"""
+        applied = self.applied()
+        return [s for s in self.scripts(include_seeds)
+                if (s.kind, s.version) not in applied]
+
+    def drifted(self) -> List[Script]:
+        """Applied scripts whose file has changed since they ran"""
+        applied = self.applied()
+        return [s for s in self.scripts(include_seeds=True)
+                if (s.kind, s.version) in applied
+                and applied[(s.kind, s.version)] != s.checksum]
+
+    def apply(self, script: Script):
+        """Run one script and record it; stops at the first failing statement"""
+        with open(script.path, encoding='utf-8') as f:
+            statements = split_statements(f.read())
+
+        started = time.perf_counter()
+        cursor = self.connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+                if cursor.with_rows:
+                    cursor.fetchall()
+            duration_ms = int((time.perf_counter() - started) * 1000)
+            cursor.execute(
+                "INSERT INTO Tb_SchemaVersion "
+                "(Kind, Version, Description, Checksum, DurationMs) "
+                "VALUES (%s, %s, %s, %s, %s)",
+                (script.kind, script.version, script.description,
+                 script.checksum, duration_ms)
+            )
+        finally:
+            cursor.close()
+
+    def upgrade(self, include_seeds: bool = False) -> List[Script]:
+        """Apply every pending script in order and return the ones applied"""
+        for script in self.drifted():
+            print(f"Warning: {os.path.basename(script.path)} changed after it was applied")
+
+        done = []
+        for script in self.pending(include_seeds):
+            try:
+                self.apply(script)
+            except Error as e:
+                raise RuntimeError(
+                    f"Migration {os.path.basename(script.path)} failed: {e}"
+                ) from e
+            done.append(script)
+        return done
+
+
+def check_pending(host: str, user: str, password: str, database: str,
+                  port: int = 3306) -> Optional[List[Script]]:
+    """Return pending schema migrations, or None if the check could not run"""
+    runner = MigrationRunner(host, user, password, database, port)
+    if not runner.connect():
+        return None
+    try:
+        return runner.pending()
+    except Error as e:
+        print(f"Error checking migrations: {e}")
+        return None
+    finally:
+        runner.disconnect()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Thrift store schema migrations")
+    parser.add_argument('command', choices=['status', 'upgrade', 'bootstrap'],
+                        help="status: list scripts; upgrade: apply pending migrations; "
+                             "bootstrap: create the database, apply migrations and seeds")
+    parser.add_argument('--host', default=os.environ.get('MYSQL_HOST', 'localhost'))
+    parser.add_argument('--port', type=int, default=int(os.environ.get('MYSQL_PORT', 3306)))
+    parser.add_argument('--user', default=os.environ.get('MYSQL_USER', 'root'))
+    parser.add_argument('--password', default=os.environ.get('MYSQL_PWD'))
+    parser.add_argument('--database', default=os.environ.get('MYSQL_DATABASE', 'MINIPROJECT_DBMS'))
+    parser.add_argument('--seed', action='store_true', help="also apply seed scripts")
+    args = parser.parse_args(argv)
+
+    password = args.password if args.password is not None else getpass.getpass("MySQL password: ")
+    runner = MigrationRunner(args.host, args.user, password, args.database, args.port)
+    if not runner.connect(create_database=args.command == 'bootstrap'):
+        return 1
+
+    try:
+        include_seeds = args.seed or args.command == 'bootstrap'
+        if args.command == 'status':
+            applied = runner.applied()
+            drifted = {(s.kind, s.version) for s in runner.drifted()}
+            for script in runner.scripts(include_seeds=True):
+                key = (script.kind, script.version)
+                state = 'changed' if key in drifted else 'applied' if key in applied else 'pending'
+                print(f"{state:8} {os.path.basename(script.path)}")
+            return 0
+
+        started = time.perf_counter()
+        done = runner.upgrade(include_seeds)
+        for script in done:
+            print(f"applied  {os.path.basename(script.path)}")
+        print(f"{len(done)} script(s) applied in {time.perf_counter() - started:.2f}s")
+        return 0
+    except RuntimeError as e:
+        print(e)
+        return 1
+    finally:
+        runner.disconnect()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,248 @@
+-- =====================================================
+-- THRIFT STORE MANAGEMENT SYSTEM - DDL STATEMENTS
+-- =====================================================
+
+-- 1. CUSTOMER TABLE
+CREATE TABLE IF NOT EXISTS Tb_Customer (
+    CustomerID INT PRIMARY KEY AUTO_INCREMENT,
+    FirstName VARCHAR(50) NOT NULL,
+    LastName VARCHAR(50) NOT NULL,
+    CONSTRAINT chk_customer_name CHECK (LENGTH(FirstName) > 0 AND LENGTH(LastName) > 0),
+    INDEX idx_customer_name (LastName, FirstName)
+);
+
+-- 2. CUSTOMER PHONE TABLE (Multi-valued attribute)
+CREATE TABLE IF NOT EXISTS Tb_CustomerPhone (
+    CustomerID INT,
+    Phone VARCHAR(15) NOT NULL,
+    PRIMARY KEY (CustomerID, Phone),
+    CONSTRAINT fk_custphone_customer FOREIGN KEY (CustomerID)
+        REFERENCES Tb_Customer(CustomerID)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    CONSTRAINT chk_phone_format CHECK (Phone REGEXP '^[0-9+()-]+$')
+);
+
+-- 3. CUSTOMER EMAIL TABLE (Multi-valued attribute)
+CREATE TABLE IF NOT EXISTS Tb_CustomerEmail (
+    CustomerID INT,
+    Email VARCHAR(100) NOT NULL,
+    PRIMARY KEY (CustomerID, Email),
+    CONSTRAINT fk_custemail_customer FOREIGN KEY (CustomerID)
+        REFERENCES Tb_Customer(CustomerID)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    CONSTRAINT chk_email_format CHECK (Email LIKE '%@%.%')
+);
+
+-- 4. EMPLOYEE TABLE
+CREATE TABLE IF NOT EXISTS Tb_Employee (
+    EmployeeID INT PRIMARY KEY AUTO_INCREMENT,
+    FirstName VARCHAR(50) NOT NULL,
+    LastName VARCHAR(50) NOT NULL,
+    Role VARCHAR(50) NOT NULL,
+    Salary DECIMAL(10,2) NOT NULL,
+    CONSTRAINT chk_salary CHECK (Salary > 0),
+    CONSTRAINT chk_role CHECK (Role IN ('Manager', 'Cashier', 'Stock Clerk', 'Donation Handler', 'Sales Associate')),
+    INDEX idx_employee_role (Role)
+);
+
+-- 5. EMPLOYEE PHONE TABLE
+CREATE TABLE IF NOT EXISTS Tb_EmployeePhone (
+    EmployeeID INT,
+    Phone VARCHAR(15) NOT NULL,
+    PRIMARY KEY (EmployeeID, Phone),
+    CONSTRAINT fk_empphone_employee FOREIGN KEY (EmployeeID)
+        REFERENCES Tb_Employee(EmployeeID)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    CONSTRAINT chk_emp_phone_format CHECK (Phone REGEXP '^[0-9+()-]+$')
+);
+
+-- 6. EMPLOYEE EMAIL TABLE
+CREATE TABLE IF NOT EXISTS Tb_EmployeeEmail (
+    EmployeeID INT,
+    Email VARCHAR(100) NOT NULL,
+    PRIMARY KEY (EmployeeID, Email),
+    CONSTRAINT fk_empemail_employee FOREIGN KEY (EmployeeID)
+        REFERENCES Tb_Employee(EmployeeID)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    CONSTRAINT chk_emp_email_format CHECK (Email LIKE '%@%.%')
+);
+
+-- 7. SUPPLIER TABLE
+CREATE TABLE IF NOT EXISTS Tb_Supplier (
+    SupplierID INT PRIMARY KEY AUTO_INCREMENT,
+    FirstName VARCHAR(50) NOT NULL,
+    LastName VARCHAR(50) NOT NULL,
+    CONSTRAINT chk_supplier_name CHECK (LENGTH(FirstName) > 0 AND LENGTH(LastName) > 0)
+);
+
+-- 8. SUPPLIER PHONE TABLE
+CREATE TABLE IF NOT EXISTS Tb_SupplierPhone (
+    SupplierID INT,
+    Phone VARCHAR(15) NOT NULL,
+    PRIMARY KEY (SupplierID, Phone),
+    CONSTRAINT fk_suppphone_supplier FOREIGN KEY (SupplierID)
+        REFERENCES Tb_Supplier(SupplierID)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    CONSTRAINT chk_supp_phone_format CHECK (Phone REGEXP '^[0-9+()-]+$')
+);
+
+-- 9. SUPPLIER EMAIL TABLE
+CREATE TABLE IF NOT EXISTS Tb_SupplierEmail (
+    SupplierID INT,
+    Email VARCHAR(100) NOT NULL,
+    PRIMARY KEY (SupplierID, Email),
+    CONSTRAINT fk_suppemail_supplier FOREIGN KEY (SupplierID)
+        REFERENCES Tb_Supplier(SupplierID)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    CONSTRAINT chk_supp_email_format CHECK (Email LIKE '%@%.%')
+);
+
+-- 10. DONOR TABLE
+CREATE TABLE IF NOT EXISTS Tb_Donor (
+    DonorID INT PRIMARY KEY AUTO_INCREMENT,
+    FirstName VARCHAR(50) NOT NULL,
+    LastName VARCHAR(50) NOT NULL,
+    CONSTRAINT chk_donor_name CHECK (LENGTH(FirstName) > 0 AND LENGTH(LastName) > 0)
+);
+
+-- 11. DONOR PHONE TABLE
+CREATE TABLE IF NOT EXISTS Tb_DonorPhone (
+    DonorID INT,
+    Phone VARCHAR(15) NOT NULL,
+    PRIMARY KEY (DonorID, Phone),
+    CONSTRAINT fk_donorphone_donor FOREIGN KEY (DonorID)
+        REFERENCES Tb_Donor(DonorID)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    CONSTRAINT chk_donor_phone_format CHECK (Phone REGEXP '^[0-9+()-]+$')
+);
+
+-- 12. CATEGORY TABLE
+CREATE TABLE IF NOT EXISTS Tb_Category (
+    CategoryID INT PRIMARY KEY AUTO_INCREMENT,
+    CategoryName VARCHAR(50) NOT NULL UNIQUE,
+    Description TEXT,
+    CONSTRAINT chk_category_name CHECK (LENGTH(CategoryName) > 0)
+);
+
+-- 13. ITEM TABLE
+CREATE TABLE IF NOT EXISTS Tb_Item (
+    ItemID INT PRIMARY KEY AUTO_INCREMENT,
+    Name VARCHAR(100) NOT NULL,
+    `Condition` ENUM('New', 'Like New', 'Good', 'Fair', 'Poor') NOT NULL,
+    Price DECIMAL(10,2) NOT NULL,
+    CategoryID INT NOT NULL,
+    SupplierID INT,
+    CONSTRAINT fk_item_category FOREIGN KEY (CategoryID)
+        REFERENCES Tb_Category(CategoryID)
+        ON DELETE RESTRICT
+        ON UPDATE CASCADE,
+    CONSTRAINT fk_item_supplier FOREIGN KEY (SupplierID)
+        REFERENCES Tb_Supplier(SupplierID)
+        ON DELETE SET NULL
+        ON UPDATE CASCADE,
+    CONSTRAINT chk_price CHECK (Price >= 0),
+    CONSTRAINT chk_item_name CHECK (LENGTH(Name) > 0),
+    INDEX idx_item_category (CategoryID),
+    INDEX idx_item_price (Price)
+);
+
+-- 14. INVENTORY TABLE
+CREATE TABLE IF NOT EXISTS Tb_Inventory (
+    InventoryID INT PRIMARY KEY AUTO_INCREMENT,
+    ItemID INT NOT NULL,
+    QuantityAvailable INT NOT NULL DEFAULT 0,
+    Location VARCHAR(100) NOT NULL,
+    CONSTRAINT fk_inventory_item FOREIGN KEY (ItemID)
+        REFERENCES Tb_Item(ItemID)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    CONSTRAINT chk_quantity CHECK (QuantityAvailable >= 0),
+    CONSTRAINT chk_location CHECK (LENGTH(Location) > 0),
+    CONSTRAINT uq_item_location UNIQUE (ItemID, Location),
+    INDEX idx_inventory_item (ItemID)
+);
+
+-- 15. DONATION TABLE
+CREATE TABLE IF NOT EXISTS Tb_Donation (
+    DonationID INT PRIMARY KEY AUTO_INCREMENT,
+    DD INT NOT NULL,
+    MM INT NOT NULL,
+    YY INT NOT NULL,
+    EstimatedValue DECIMAL(10,2),
+    EmployeeID INT NOT NULL,
+    DonorID INT NOT NULL,
+    CONSTRAINT fk_donation_employee FOREIGN KEY (EmployeeID)
+        REFERENCES Tb_Employee(EmployeeID)
+        ON DELETE RESTRICT
+        ON UPDATE CASCADE,
+    CONSTRAINT fk_donation_donor FOREIGN KEY (DonorID)
+        REFERENCES Tb_Donor(DonorID)
+        ON DELETE RESTRICT
+        ON UPDATE CASCADE,
+    CONSTRAINT chk_donation_date CHECK (DD BETWEEN 1 AND 31 AND MM BETWEEN 1 AND 12 AND YY > 1900),
+    CONSTRAINT chk_estimated_value CHECK (EstimatedValue >= 0),
+    INDEX idx_donation_date (YY, MM, DD)
+);
+
+-- 16. TRANSACTION TABLE
+CREATE TABLE IF NOT EXISTS Tb_Transaction (
+    TransactionID INT PRIMARY KEY AUTO_INCREMENT,
+    DD INT NOT NULL,
+    MM INT NOT NULL,
+    YY INT NOT NULL,
+    TotalAmount DECIMAL(10,2) NOT NULL,
+    PaymentMode ENUM('Cash', 'Card', 'UPI', 'Check') NOT NULL,
+    CustomerID INT NOT NULL,
+    EmployeeID INT NOT NULL,
+    CONSTRAINT fk_transaction_customer FOREIGN KEY (CustomerID)
+        REFERENCES Tb_Customer(CustomerID)
+        ON DELETE RESTRICT
+        ON UPDATE CASCADE,
+    CONSTRAINT fk_transaction_employee FOREIGN KEY (EmployeeID)
+        REFERENCES Tb_Employee(EmployeeID)
+        ON DELETE RESTRICT
+        ON UPDATE CASCADE,
+    CONSTRAINT chk_transaction_date CHECK (DD BETWEEN 1 AND 31 AND MM BETWEEN 1 AND 12 AND YY > 1900),
+    CONSTRAINT chk_total_amount CHECK (TotalAmount >= 0),
+    INDEX idx_transaction_date (YY, MM, DD)
+);
+
+-- 17. TRANSACTION ITEM TABLE (Weak Entity - Bridge Table)
+CREATE TABLE IF NOT EXISTS Tb_TransactionItem (
+    TransactionID INT,
+    LineNumber INT,  -- Discriminator attribute (partial key)
+    ItemID INT NOT NULL,
+    Quantity INT NOT NULL,
+    UnitPrice DECIMAL(10,2) NOT NULL,
+    LineTotal DECIMAL(10,2) NOT NULL,
+    PRIMARY KEY (TransactionID, LineNumber),  -- Composite key: owner PK + discriminator
+    CONSTRAINT fk_transitem_transaction FOREIGN KEY (TransactionID)
+        REFERENCES Tb_Transaction(TransactionID)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    CONSTRAINT fk_transitem_item FOREIGN KEY (ItemID)
+        REFERENCES Tb_Item(ItemID)
+        ON DELETE RESTRICT
+        ON UPDATE CASCADE,
+    CONSTRAINT chk_quantity_positive CHECK (Quantity > 0),
+    CONSTRAINT chk_unitprice CHECK (UnitPrice >= 0),
+    CONSTRAINT chk_linetotal CHECK (LineTotal >= 0),
+    CONSTRAINT chk_linenumber CHECK (LineNumber > 0)
+);
+
+-- 18. INVENTORY LOG TABLE (written by tr_LogInventoryUpdate)
+CREATE TABLE IF NOT EXISTS Tb_InventoryLog (
+    LogID INT PRIMARY KEY AUTO_INCREMENT,
+    ItemID INT,
+    OldQuantity INT,
+    NewQuantity INT,
+    ChangeDate TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ChangeType VARCHAR(20)
+);
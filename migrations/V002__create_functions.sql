@@ -0,0 +1,106 @@
+-- =====================================================
+-- FUNCTIONS
+-- =====================================================
+
+-- Function 1: Calculate total sales for a specific customer
+DROP FUNCTION IF EXISTS fn_CustomerTotalPurchases;
+
+DELIMITER //
+CREATE FUNCTION fn_CustomerTotalPurchases(cust_id INT)
+RETURNS DECIMAL(10,2)
+DETERMINISTIC
+READS SQL DATA
+BEGIN
+    DECLARE total DECIMAL(10,2);
+    SELECT COALESCE(SUM(TotalAmount), 0) INTO total
+    FROM Tb_Transaction
+    WHERE CustomerID = cust_id;
+    RETURN total;
+END //
+DELIMITER ;
+
+-- Function 2: Get inventory value for a specific category
+DROP FUNCTION IF EXISTS fn_CategoryInventoryValue;
+
+DELIMITER //
+CREATE FUNCTION fn_CategoryInventoryValue(cat_id INT)
+RETURNS DECIMAL(10,2)
+DETERMINISTIC
+READS SQL DATA
+BEGIN
+    DECLARE total_value DECIMAL(10,2);
+    SELECT COALESCE(SUM(i.Price * inv.QuantityAvailable), 0) INTO total_value
+    FROM Tb_Item i
+    JOIN Tb_Inventory inv ON i.ItemID = inv.ItemID
+    WHERE i.CategoryID = cat_id;
+    RETURN total_value;
+END //
+DELIMITER ;
+
+-- Function 3: Calculate employee's total transaction amount processed
+DROP FUNCTION IF EXISTS fn_EmployeeSalesTotal;
+
+DELIMITER //
+CREATE FUNCTION fn_EmployeeSalesTotal(emp_id INT)
+RETURNS DECIMAL(10,2)
+DETERMINISTIC
+READS SQL DATA
+BEGIN
+    DECLARE total DECIMAL(10,2);
+    SELECT COALESCE(SUM(TotalAmount), 0) INTO total
+    FROM Tb_Transaction
+    WHERE EmployeeID = emp_id;
+    RETURN total;
+END //
+DELIMITER ;
+
+-- Function 4: Get donor's total donation value
+DROP FUNCTION IF EXISTS fn_DonorTotalValue;
+
+DELIMITER //
+CREATE FUNCTION fn_DonorTotalValue(donor_id INT)
+RETURNS DECIMAL(10,2)
+DETERMINISTIC
+READS SQL DATA
+BEGIN
+    DECLARE total DECIMAL(10,2);
+    SELECT COALESCE(SUM(EstimatedValue), 0) INTO total
+    FROM Tb_Donation
+    WHERE DonorID = donor_id;
+    RETURN total;
+END //
+DELIMITER ;
+
+-- Function 5: Calculate average item price in a category
+DROP FUNCTION IF EXISTS fn_CategoryAvgPrice;
+
+DELIMITER //
+CREATE FUNCTION fn_CategoryAvgPrice(cat_id INT)
+RETURNS DECIMAL(10,2)
+DETERMINISTIC
+READS SQL DATA
+BEGIN
+    DECLARE avg_price DECIMAL(10,2);
+    SELECT COALESCE(AVG(Price), 0) INTO avg_price
+    FROM Tb_Item
+    WHERE CategoryID = cat_id;
+    RETURN avg_price;
+END //
+DELIMITER ;
+
+-- Function 6: Count items by condition
+DROP FUNCTION IF EXISTS fn_CountItemsByCondition;
+
+DELIMITER //
+CREATE FUNCTION fn_CountItemsByCondition(item_condition VARCHAR(20))
+RETURNS INT
+DETERMINISTIC
+READS SQL DATA
+BEGIN
+    DECLARE item_count INT;
+    SELECT COUNT(*) INTO item_count
+    FROM Tb_Item
+    WHERE `Condition` = item_condition;
+    RETURN item_count;
+END //
+DELIMITER ;
@@ -0,0 +1,209 @@
+-- =====================================================
+-- STORED PROCEDURES
+-- =====================================================
+
+-- Procedure 1: Add new customer with phone and email
+DROP PROCEDURE IF EXISTS sp_AddCustomer;
+
+DELIMITER //
+CREATE PROCEDURE sp_AddCustomer(
+    IN p_FirstName VARCHAR(50),
+    IN p_LastName VARCHAR(50),
+    IN p_Phone VARCHAR(15),
+    IN p_Email VARCHAR(100)
+)
+BEGIN
+    DECLARE new_cust_id INT;
+
+    INSERT INTO Tb_Customer (FirstName, LastName)
+    VALUES (p_FirstName, p_LastName);
+
+    SET new_cust_id = LAST_INSERT_ID();
+
+    INSERT INTO Tb_CustomerPhone (CustomerID, Phone)
+    VALUES (new_cust_id, p_Phone);
+
+    INSERT INTO Tb_CustomerEmail (CustomerID, Email)
+    VALUES (new_cust_id, p_Email);
+
+    SELECT new_cust_id AS CustomerID, 'Customer added successfully' AS Message;
+END //
+DELIMITER ;
+
+-- Procedure 2: Process a new transaction
+DROP PROCEDURE IF EXISTS sp_ProcessTransaction;
+
+DELIMITER //
+CREATE PROCEDURE sp_ProcessTransaction(
+    IN p_CustomerID INT,
+    IN p_EmployeeID INT,
+    IN p_PaymentMode VARCHAR(10),
+    IN p_DD INT,
+    IN p_MM INT,
+    IN p_YY INT
+)
+BEGIN
+    DECLARE new_trans_id INT;
+
+    INSERT INTO Tb_Transaction (DD, MM, YY, TotalAmount, PaymentMode, CustomerID, EmployeeID)
+    VALUES (p_DD, p_MM, p_YY, 0.00, p_PaymentMode, p_CustomerID, p_EmployeeID);
+
+    SET new_trans_id = LAST_INSERT_ID();
+
+    SELECT new_trans_id AS TransactionID, 'Transaction created. Add items using sp_AddTransactionItem' AS Message;
+END //
+DELIMITER ;
+
+-- Procedure 3: Add item to transaction and update inventory
+DROP PROCEDURE IF EXISTS sp_AddTransactionItem;
+
+DELIMITER //
+CREATE PROCEDURE sp_AddTransactionItem(
+    IN p_TransactionID INT,
+    IN p_ItemID INT,
+    IN p_Quantity INT
+)
+BEGIN
+    DECLARE item_price DECIMAL(10,2);
+    DECLARE line_total DECIMAL(10,2);
+    DECLARE available_qty INT;
+
+    -- Get item price
+    SELECT Price INTO item_price FROM Tb_Item WHERE ItemID = p_ItemID;
+
+    -- Check inventory
+    SELECT QuantityAvailable INTO available_qty
+    FROM Tb_Inventory
+    WHERE ItemID = p_ItemID
+    LIMIT 1;
+
+    IF available_qty < p_Quantity THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Insufficient inventory';
+    END IF;
+
+    -- Calculate line total
+    SET line_total = item_price * p_Quantity;
+
+    -- Add transaction item
+    INSERT INTO Tb_TransactionItem (TransactionID, ItemID, Quantity, UnitPrice, LineTotal)
+    VALUES (p_TransactionID, p_ItemID, p_Quantity, item_price, line_total);
+
+    -- Update transaction total
+    UPDATE Tb_Transaction
+    SET TotalAmount = TotalAmount + line_total
+    WHERE TransactionID = p_TransactionID;
+
+    -- Update inventory
+    UPDATE Tb_Inventory
+    SET QuantityAvailable = QuantityAvailable - p_Quantity
+    WHERE ItemID = p_ItemID;
+
+    SELECT 'Item added to transaction successfully' AS Message;
+END //
+DELIMITER ;
+
+-- Procedure 4: Generate sales report for a date range
+DROP PROCEDURE IF EXISTS sp_SalesReport;
+
+DELIMITER //
+CREATE PROCEDURE sp_SalesReport(
+    IN p_StartYear INT,
+    IN p_StartMonth INT,
+    IN p_EndYear INT,
+    IN p_EndMonth INT
+)
+BEGIN
+    SELECT
+        t.TransactionID,
+        CONCAT(c.FirstName, ' ', c.LastName) AS Customer,
+        CONCAT(e.FirstName, ' ', e.LastName) AS Employee,
+        CONCAT(t.DD, '-', t.MM, '-', t.YY) AS TransactionDate,
+        t.TotalAmount,
+        t.PaymentMode
+    FROM Tb_Transaction t
+    JOIN Tb_Customer c ON t.CustomerID = c.CustomerID
+    JOIN Tb_Employee e ON t.EmployeeID = e.EmployeeID
+    WHERE (t.YY > p_StartYear OR (t.YY = p_StartYear AND t.MM >= p_StartMonth))
+      AND (t.YY < p_EndYear OR (t.YY = p_EndYear AND t.MM <= p_EndMonth))
+    ORDER BY t.YY, t.MM, t.DD;
+END //
+DELIMITER ;
+
+-- Procedure 5: Get low stock items
+DROP PROCEDURE IF EXISTS sp_LowStockAlert;
+
+DELIMITER //
+CREATE PROCEDURE sp_LowStockAlert(IN p_Threshold INT)
+BEGIN
+    SELECT
+        i.ItemID,
+        i.Name,
+        cat.CategoryName,
+        inv.QuantityAvailable,
+        inv.Location
+    FROM Tb_Item i
+    JOIN Tb_Category cat ON i.CategoryID = cat.CategoryID
+    JOIN Tb_Inventory inv ON i.ItemID = inv.ItemID
+    WHERE inv.QuantityAvailable <= p_Threshold
+    ORDER BY inv.QuantityAvailable ASC;
+END //
+DELIMITER ;
+
+-- Procedure 6: Add new donation
+DROP PROCEDURE IF EXISTS sp_AddDonation;
+
+DELIMITER //
+CREATE PROCEDURE sp_AddDonation(
+    IN p_DonorID INT,
+    IN p_EmployeeID INT,
+    IN p_EstimatedValue DECIMAL(10,2),
+    IN p_DD INT,
+    IN p_MM INT,
+    IN p_YY INT
+)
+BEGIN
+    INSERT INTO Tb_Donation (DD, MM, YY, EstimatedValue, EmployeeID, DonorID)
+    VALUES (p_DD, p_MM, p_YY, p_EstimatedValue, p_EmployeeID, p_DonorID);
+
+    SELECT LAST_INSERT_ID() AS DonationID, 'Donation recorded successfully' AS Message;
+END //
+DELIMITER ;
+
+-- Procedure 7: Update item price
+DROP PROCEDURE IF EXISTS sp_UpdateItemPrice;
+
+DELIMITER //
+CREATE PROCEDURE sp_UpdateItemPrice(
+    IN p_ItemID INT,
+    IN p_NewPrice DECIMAL(10,2)
+)
+BEGIN
+    UPDATE Tb_Item
+    SET Price = p_NewPrice
+    WHERE ItemID = p_ItemID;
+
+    SELECT 'Item price updated successfully' AS Message;
+END //
+DELIMITER ;
+
+-- Procedure 8: Get customer purchase history
+DROP PROCEDURE IF EXISTS sp_CustomerPurchaseHistory;
+
+DELIMITER //
+CREATE PROCEDURE sp_CustomerPurchaseHistory(IN p_CustomerID INT)
+BEGIN
+    SELECT
+        t.TransactionID,
+        CONCAT(t.DD, '-', t.MM, '-', t.YY) AS TransactionDate,
+        t.TotalAmount,
+        t.PaymentMode,
+        GROUP_CONCAT(CONCAT(i.Name, ' (', ti.Quantity, ')') SEPARATOR ', ') AS Items
+    FROM Tb_Transaction t
+    JOIN Tb_TransactionItem ti ON t.TransactionID = ti.TransactionID
+    JOIN Tb_Item i ON ti.ItemID = i.ItemID
+    WHERE t.CustomerID = p_CustomerID
+    GROUP BY t.TransactionID
+    ORDER BY t.YY DESC, t.MM DESC, t.DD DESC;
+END //
+DELIMITER ;
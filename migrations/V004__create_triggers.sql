@@ -0,0 +1,109 @@
+-- =====================================================
+-- TRIGGERS
+-- =====================================================
+
+-- Trigger 1: Validate transaction date before insert
+DROP TRIGGER IF EXISTS tr_ValidateTransactionDate;
+
+DELIMITER //
+CREATE TRIGGER tr_ValidateTransactionDate
+BEFORE INSERT ON Tb_Transaction
+FOR EACH ROW
+BEGIN
+    IF NEW.MM = 2 AND NEW.DD > 29 THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Invalid date for February';
+    END IF;
+
+    IF NEW.MM IN (4, 6, 9, 11) AND NEW.DD > 30 THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Invalid date for this month';
+    END IF;
+END //
+DELIMITER ;
+
+-- Trigger 2: Prevent deletion of category with items
+DROP TRIGGER IF EXISTS tr_PreventCategoryDelete;
+
+DELIMITER //
+CREATE TRIGGER tr_PreventCategoryDelete
+BEFORE DELETE ON Tb_Category
+FOR EACH ROW
+BEGIN
+    DECLARE item_count INT;
+    SELECT COUNT(*) INTO item_count
+    FROM Tb_Item
+    WHERE CategoryID = OLD.CategoryID;
+
+    IF item_count > 0 THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Cannot delete category with existing items';
+    END IF;
+END //
+DELIMITER ;
+
+-- Trigger 3: Auto-update transaction total when item is added
+DROP TRIGGER IF EXISTS tr_UpdateTransactionTotal;
+
+DELIMITER //
+CREATE TRIGGER tr_UpdateTransactionTotal
+AFTER INSERT ON Tb_TransactionItem
+FOR EACH ROW
+BEGIN
+    UPDATE Tb_Transaction
+    SET TotalAmount = (
+        SELECT SUM(LineTotal)
+        FROM Tb_TransactionItem
+        WHERE TransactionID = NEW.TransactionID
+    )
+    WHERE TransactionID = NEW.TransactionID;
+END //
+DELIMITER ;
+
+-- Trigger 4: Log inventory changes
+DROP TRIGGER IF EXISTS tr_LogInventoryUpdate;
+
+DELIMITER //
+CREATE TRIGGER tr_LogInventoryUpdate
+AFTER UPDATE ON Tb_Inventory
+FOR EACH ROW
+BEGIN
+    INSERT INTO Tb_InventoryLog (ItemID, OldQuantity, NewQuantity, ChangeType)
+    VALUES (NEW.ItemID, OLD.QuantityAvailable, NEW.QuantityAvailable, 'UPDATE');
+END //
+DELIMITER ;
+
+-- Trigger 5: Prevent negative inventory
+DROP TRIGGER IF EXISTS tr_PreventNegativeInventory;
+
+DELIMITER //
+CREATE TRIGGER tr_PreventNegativeInventory
+BEFORE UPDATE ON Tb_Inventory
+FOR EACH ROW
+BEGIN
+    IF NEW.QuantityAvailable < 0 THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Inventory cannot be negative';
+    END IF;
+END //
+DELIMITER ;
+
+-- Trigger 6: Validate donation date
+DROP TRIGGER IF EXISTS tr_ValidateDonationDate;
+
+DELIMITER //
+CREATE TRIGGER tr_ValidateDonationDate
+BEFORE INSERT ON Tb_Donation
+FOR EACH ROW
+BEGIN
+    IF NEW.MM = 2 AND NEW.DD > 29 THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Invalid donation date for February';
+    END IF;
+
+    IF NEW.MM IN (4, 6, 9, 11) AND NEW.DD > 30 THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Invalid donation date for this month';
+    END IF;
+END //
+DELIMITER ;
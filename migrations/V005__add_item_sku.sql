@@ -0,0 +1,17 @@
+-- =====================================================
+-- ITEM SKU / BARCODE
+-- =====================================================
+
+-- Scanned at the till; NULL for items that have not been labelled yet.
+-- MySQL has no ADD COLUMN IF NOT EXISTS, so the ALTER only runs when
+-- information_schema shows the column missing (safe to re-run).
+SET @ddl = (
+    SELECT IF(COUNT(*) = 0,
+              'ALTER TABLE Tb_Item ADD COLUMN SKU VARCHAR(32) NULL AFTER ItemID, ADD CONSTRAINT uq_item_sku UNIQUE (SKU)',
+              'DO 0')
+    FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'Tb_Item' AND COLUMN_NAME = 'SKU'
+);
+PREPARE add_column FROM @ddl;
+EXECUTE add_column;
+DEALLOCATE PREPARE add_column;
@@ -0,0 +1,15 @@
+-- =====================================================
+-- SALE IDEMPOTENCY KEYS
+-- =====================================================
+
+-- One row per sale replayed from a till's local queue, written in the same
+-- transaction as the sale so a retried replay can never record it twice
+CREATE TABLE IF NOT EXISTS Tb_SaleIdempotency (
+    IdempotencyKey CHAR(36) PRIMARY KEY,
+    TransactionID INT NOT NULL,
+    RecordedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT fk_saleidem_transaction FOREIGN KEY (TransactionID)
+        REFERENCES Tb_Transaction(TransactionID)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
@@ -0,0 +1,76 @@
+-- =====================================================
+-- SALES ARCHIVE
+-- =====================================================
+
+-- Closed years moved out of Tb_Transaction/Tb_TransactionItem into Parquet
+-- files (see archive.py). Hot rows of a year listed here are ignored by
+-- reports even before they have all been deleted.
+CREATE TABLE IF NOT EXISTS Tb_ArchivedYear (
+    YY INT PRIMARY KEY,
+    TransactionsFile VARCHAR(255) NOT NULL,
+    ItemsFile VARCHAR(255) NOT NULL,
+    TransactionCount INT NOT NULL,
+    LineCount INT NOT NULL,
+    TotalAmount DECIMAL(14,2) NOT NULL,
+    Status ENUM('pruning', 'archived') NOT NULL DEFAULT 'pruning',
+    ArchivedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Per customer/employee sales of archived years, so lifetime totals stay
+-- single indexed lookups without reading the archive files
+CREATE TABLE IF NOT EXISTS Tb_ArchivedSalesTotal (
+    YY INT NOT NULL,
+    CustomerID INT NOT NULL,
+    EmployeeID INT NOT NULL,
+    TransactionCount INT NOT NULL,
+    TotalAmount DECIMAL(14,2) NOT NULL,
+    PRIMARY KEY (YY, CustomerID, EmployeeID),
+    CONSTRAINT fk_archivedtotal_year FOREIGN KEY (YY)
+        REFERENCES Tb_ArchivedYear(YY)
+        ON DELETE CASCADE,
+    INDEX idx_archivedtotal_customer (CustomerID),
+    INDEX idx_archivedtotal_employee (EmployeeID)
+);
+
+-- Lifetime totals now add archived years to the hot rows of other years
+DROP FUNCTION IF EXISTS fn_CustomerTotalPurchases;
+
+DELIMITER //
+CREATE FUNCTION fn_CustomerTotalPurchases(cust_id INT)
+RETURNS DECIMAL(10,2)
+DETERMINISTIC
+READS SQL DATA
+BEGIN
+    DECLARE hot DECIMAL(10,2);
+    DECLARE cold DECIMAL(10,2);
+    SELECT COALESCE(SUM(TotalAmount), 0) INTO hot
+    FROM Tb_Transaction
+    WHERE CustomerID = cust_id
+      AND YY NOT IN (SELECT YY FROM Tb_ArchivedYear);
+    SELECT COALESCE(SUM(TotalAmount), 0) INTO cold
+    FROM Tb_ArchivedSalesTotal
+    WHERE CustomerID = cust_id;
+    RETURN hot + cold;
+END //
+DELIMITER ;
+
+DROP FUNCTION IF EXISTS fn_EmployeeSalesTotal;
+
+DELIMITER //
+CREATE FUNCTION fn_EmployeeSalesTotal(emp_id INT)
+RETURNS DECIMAL(10,2)
+DETERMINISTIC
+READS SQL DATA
+BEGIN
+    DECLARE hot DECIMAL(10,2);
+    DECLARE cold DECIMAL(10,2);
+    SELECT COALESCE(SUM(TotalAmount), 0) INTO hot
+    FROM Tb_Transaction
+    WHERE EmployeeID = emp_id
+      AND YY NOT IN (SELECT YY FROM Tb_ArchivedYear);
+    SELECT COALESCE(SUM(TotalAmount), 0) INTO cold
+    FROM Tb_ArchivedSalesTotal
+    WHERE EmployeeID = emp_id;
+    RETURN hot + cold;
+END //
+DELIMITER ;
@@ -0,0 +1,41 @@
+-- =====================================================
+-- INTAKE DATES AND STOCK BATCHES
+-- =====================================================
+
+-- When the item was taken in; items that predate this column get the
+-- migration time. MySQL has no ADD COLUMN IF NOT EXISTS, so the ALTER only
+-- runs when information_schema shows the column missing (safe to re-run).
+SET @ddl = (
+    SELECT IF(COUNT(*) = 0,
+              'ALTER TABLE Tb_Item ADD COLUMN IntakeDate TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP AFTER SupplierID',
+              'DO 0')
+    FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'Tb_Item' AND COLUMN_NAME = 'IntakeDate'
+);
+PREPARE add_column FROM @ddl;
+EXECUTE add_column;
+DEALLOCATE PREPARE add_column;
+
+-- One row per quantity received at a location (add_inventory), used to age
+-- stock on hand
+CREATE TABLE IF NOT EXISTS Tb_StockBatch (
+    BatchID INT PRIMARY KEY AUTO_INCREMENT,
+    ItemID INT NOT NULL,
+    Location VARCHAR(100) NOT NULL,
+    Quantity INT NOT NULL,
+    ReceivedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT fk_stockbatch_item FOREIGN KEY (ItemID)
+        REFERENCES Tb_Item(ItemID)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+    CONSTRAINT chk_stockbatch_quantity CHECK (Quantity > 0),
+    INDEX idx_stockbatch_item_location (ItemID, Location)
+);
+
+-- Stock already on hand becomes one batch per item and location
+INSERT INTO Tb_StockBatch (ItemID, Location, Quantity, ReceivedAt)
+SELECT inv.ItemID, inv.Location, inv.QuantityAvailable, i.IntakeDate
+FROM Tb_Inventory inv
+JOIN Tb_Item i ON inv.ItemID = i.ItemID
+WHERE inv.QuantityAvailable > 0
+  AND NOT EXISTS (SELECT 1 FROM Tb_StockBatch);
@@ -0,0 +1,20 @@
+-- =====================================================
+-- SCHEDULED JOB HISTORY
+-- =====================================================
+
+-- One row per job run (scheduler.py). ScheduledFor is the cron slot being
+-- served; the unique key lets only one app replica claim each slot.
+-- Manual runs have no slot.
+CREATE TABLE IF NOT EXISTS Tb_JobRun (
+    RunID INT PRIMARY KEY AUTO_INCREMENT,
+    JobName VARCHAR(64) NOT NULL,
+    ScheduledFor DATETIME NULL,
+    StartedAt DATETIME NOT NULL,
+    FinishedAt DATETIME NULL,
+    DurationMs INT NULL,
+    Status ENUM('running', 'succeeded', 'failed') NOT NULL DEFAULT 'running',
+    Detail VARCHAR(1000) NULL,
+    Host VARCHAR(255) NOT NULL,
+    CONSTRAINT uq_jobrun_slot UNIQUE (JobName, ScheduledFor),
+    INDEX idx_jobrun_started (StartedAt)
+);
@@ -0,0 +1,15 @@
+-- =====================================================
+-- CHANGE OUTBOX
+-- =====================================================
+
+-- One row per changed entity, written in the same transaction as the change
+-- (see events.py); other app processes poll it to invalidate caches
+CREATE TABLE IF NOT EXISTS Tb_ChangeOutbox (
+    OutboxID BIGINT PRIMARY KEY AUTO_INCREMENT,
+    Entity VARCHAR(32) NOT NULL,
+    EntityID INT NOT NULL,
+    Fields VARCHAR(255) NOT NULL DEFAULT '',
+    Origin VARCHAR(64) NOT NULL,
+    CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_changeoutbox_created (CreatedAt)
+);
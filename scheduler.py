@@ -0,0 +1,379 @@
+"""
+Thrift Store Management System - Job Scheduler
+Runs maintenance and aggregation jobs on cron schedules off the request path,
+either inside the Streamlit process or standalone:
+
+    python scheduler.py run
+    python scheduler.py once purge_inventory_log
+
+Every app replica may run a scheduler: each cron slot is claimed in
+Tb_JobRun and each job holds a MySQL GET_LOCK while it runs, so a job never
+runs twice for one slot or concurrently with itself.
+"""
+
+import argparse
+import getpass
+import os
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, NamedTuple, Optional, Set
+
+from mysql.connector import Error, errorcode
+
+from archive import archivable_years, archive_year
+from database import ThriftStoreDB
+
+INVENTORY_LOG_RETENTION_DAYS = 90
+JOB_HISTORY_RETENTION_DAYS = 90
+# A run still marked running after this long lost its process or connection
+STALE_RUN_HOURS = 24
+CHANGE_OUTBOX_RETENTION_HOURS = 24
+PURGE_BATCH_SIZE = 5000
+
+CRON_ALIASES = {
+    '@hourly': '0 * * * *',
+    '@daily': '0 0 * * *',
+    '@weekly': '0 0 * * 0',
+    '@monthly': '0 0 1 * *',
+}
+
+
+def _parse_field(field: str, low: int, high: int) -> Set[int]:
+    """Values allowed by one cron field: *, a, a-b, with optional /step, comma separated"""
+    values = set()
+    for part in field.split(','):
+        base, _, step = part.partition('/')
+        if base == '*':
+            start, end = low, high
+        elif '-' in base:
+            start, end = (int(v) for v in base.split('-', 1))
+        else:
+            start = int(base)
+            end = high if step else start
+        step = int(step) if step else 1
+        if not low <= start <= end <= high or step < 1:
+            raise ValueError(f"cron field '{field}' out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    def __init__(self, expression: str):
+        """Standard 5-field cron: minute hour day-of-month month day-of-week (0/7 = Sunday)"""
+        self.expression = expression
+        fields = CRON_ALIASES.get(expression, expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"cron expression '{expression}' needs 5 fields")
+        self.minutes = _parse_field(fields[0], 0, 59)
+        self.hours = _parse_field(fields[1], 0, 23)
+        self.days = _parse_field(fields[2], 1, 31)
+        self.months = _parse_field(fields[3], 1, 12)
+        self.weekdays = {d % 7 for d in _parse_field(fields[4], 0, 7)}
+        self._any_day = fields[2] == '*'
+        self._any_weekday = fields[4] == '*'
+
+    def _day_matches(self, moment: datetime) -> bool:
+        in_days = moment.day in self.days
+        in_weekdays = (moment.isoweekday() % 7) in self.weekdays
+        if self._any_day or self._any_weekday:
+            return in_days and in_weekdays
+        # Like cron: when both are restricted, either one matching is enough
+        return in_days or in_weekdays
+
+    def next_after(self, moment: datetime) -> datetime:
+        """First matching minute strictly after moment"""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.months or not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"cron expression '{self.expression}' never matches")
+
+
+class Job(NamedTuple):
+    name: str
+    schedule: str
+    func: Callable[[ThriftStoreDB], Optional[str]]
+    description: str
+
+
+# ==================== MAINTENANCE JOBS ====================
+
+def _delete_in_batches(db: ThriftStoreDB, query: str, params: tuple) -> int:
+    """Run a DELETE ... LIMIT repeatedly, committing each batch, until nothing is left"""
+    deleted = 0
+    cursor = db.connection.cursor()
+    try:
+        while True:
+            cursor.execute(query, params + (PURGE_BATCH_SIZE,))
+            db.connection.commit()
+            deleted += cursor.rowcount
+            if cursor.rowcount < PURGE_BATCH_SIZE:
+                return deleted
+    finally:
+        cursor.close()
+
+
+def purge_inventory_log(db: ThriftStoreDB) -> str:
+    deleted = _delete_in_batches(
+        db, "DELETE FROM Tb_InventoryLog WHERE ChangeDate < NOW() - INTERVAL %s DAY LIMIT %s",
+        (INVENTORY_LOG_RETENTION_DAYS,)
+    )
+    return f"{deleted} log rows older than {INVENTORY_LOG_RETENTION_DAYS} days deleted"
+
+
+def purge_job_history(db: ThriftStoreDB) -> str:
+    cursor = db.connection.cursor()
+    try:
+        cursor.execute(
+            "UPDATE Tb_JobRun SET Status = 'failed', FinishedAt = NOW(), "
+            "Detail = 'abandoned: never finished' "
+            "WHERE Status = 'running' AND StartedAt < NOW() - INTERVAL %s HOUR",
+            (STALE_RUN_HOURS,)
+        )
+        abandoned = cursor.rowcount
+        db.connection.commit()
+    finally:
+        cursor.close()
+    deleted = _delete_in_batches(
+        db, "DELETE FROM Tb_JobRun WHERE StartedAt < NOW() - INTERVAL %s DAY LIMIT %s",
+        (JOB_HISTORY_RETENTION_DAYS,)
+    )
+    return (f"{abandoned} abandoned runs closed, "
+            f"{deleted} job runs older than {JOB_HISTORY_RETENTION_DAYS} days deleted")
+
+
+def purge_change_outbox(db: ThriftStoreDB) -> str:
+    deleted = _delete_in_batches(
+        db, "DELETE FROM Tb_ChangeOutbox WHERE CreatedAt < NOW() - INTERVAL %s HOUR LIMIT %s",
+        (CHANGE_OUTBOX_RETENTION_HOURS,)
+    )
+    return f"{deleted} change events older than {CHANGE_OUTBOX_RETENTION_HOURS} hours deleted"
+
+
+def archive_sales(db: ThriftStoreDB) -> str:
+    archived = [archive_year(db, year, db.archive_dir) for year in archivable_years(db)]
+    if not archived:
+        return "nothing to archive"
+    return ', '.join(f"{r['year']}: {r['transactions']} transactions" for r in archived)
+
+
+MAINTENANCE_JOBS = [
+    Job('purge_inventory_log', '30 2 * * *', purge_inventory_log,
+        f"Delete Tb_InventoryLog rows older than {INVENTORY_LOG_RETENTION_DAYS} days"),
+    Job('purge_job_history', '45 2 * * 0', purge_job_history,
+        f"Close runs stuck as running for {STALE_RUN_HOURS}h; delete runs older than "
+        f"{JOB_HISTORY_RETENTION_DAYS} days"),
+    Job('purge_change_outbox', '5 * * * *', purge_change_outbox,
+        f"Delete change feed events older than {CHANGE_OUTBOX_RETENTION_HOURS} hours"),
+    Job('archive_sales', '0 3 2 * *', archive_sales,
+        "Move closed sales years to the Parquet archive"),
+]
+
+
+# ==================== SCHEDULER ====================
+
+class JobScheduler:
+    def __init__(self, connect: Callable[[], ThriftStoreDB], jobs: List[Job],
+                 max_workers: int = 2, tick: float = 15.0):
+        """Fire jobs on their schedules on a bounded worker pool
+
+        connect returns a new, unconnected ThriftStoreDB; every run gets its
+        own connection, which also holds the job's lock.
+        """
+        self.jobs = {job.name: job for job in jobs}
+        self.schedules = {job.name: CronSchedule(job.schedule) for job in jobs}
+        self.tick = tick
+        self.host = socket.gethostname()
+        self._connect = connect
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._running: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        now = datetime.now()
+        self.next_runs: Dict[str, datetime] = {
+            name: schedule.next_after(now) for name, schedule in self.schedules.items()
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, name='job-scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _loop(self):
+        while not self._stopping.is_set():
+            now = datetime.now()
+            for name, due in list(self.next_runs.items()):
+                if due <= now:
+                    # Missed slots (e.g. while the process was down) are not caught up
+                    self.next_runs[name] = self.schedules[name].next_after(now)
+                    self.submit(name, due)
+            self._stopping.wait(self.tick)
+
+    def running(self) -> Set[str]:
+        with self._lock:
+            return set(self._running)
+
+    def submit(self, name: str, slot: Optional[datetime] = None) -> Optional[Future]:
+        """Queue a run; slot is the cron time being served, None for a manual run"""
+        with self._lock:
+            if name in self._running:
+                return None
+            self._running.add(name)
+        return self._executor.submit(self._execute, self.jobs[name], slot)
+
+    def _execute(self, job: Job, slot: Optional[datetime]) -> Optional[str]:
+        """Run one job under its lock and record it; returns its status, None if skipped"""
+        try:
+            db = self._connect()
+            if not db.connect():
+                return None
+            try:
+                return run_job(db, job, slot, self.host)
+            finally:
+                db.disconnect()
+        finally:
+            with self._lock:
+                self._running.discard(job.name)
+
+
+def run_job(db: ThriftStoreDB, job: Job, slot: Optional[datetime] = None,
+            host: Optional[str] = None) -> Optional[str]:
+    """Run a job on db if no other instance holds it or has claimed the slot
+
+    Returns 'succeeded' or 'failed', or None when the run was skipped.
+    """
+    lock_name = f"thrift:{db.database}:{job.name}"[:64]
+    locked = db.fetch_query("SELECT GET_LOCK(%s, 0)", (lock_name,))
+    if not locked or locked[0][0] != 1:
+        return None
+    try:
+        cursor = db.connection.cursor()
+        try:
+            cursor.execute(
+                "INSERT INTO Tb_JobRun (JobName, ScheduledFor, StartedAt, Host) "
+                "VALUES (%s, %s, NOW(), %s)",
+                (job.name, slot, host or socket.gethostname())
+            )
+            run_id = cursor.lastrowid
+            db.connection.commit()
+        except Error as e:
+            db.connection.rollback()
+            if e.errno == errorcode.ER_DUP_ENTRY:
+                # Another replica already ran this slot
+                return None
+            raise
+        finally:
+            cursor.close()
+
+        started = time.perf_counter()
+        try:
+            detail, status = job.func(db) or '', 'succeeded'
+        except Exception as e:
+            try:
+                db.connection.rollback()
+            except Error:
+                pass
+            detail, status = f"{type(e).__name__}: {e}", 'failed'
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        _finish_run(db, run_id, duration_ms, status, detail)
+        return status
+    finally:
+        db.fetch_query("SELECT RELEASE_LOCK(%s)", (lock_name,))
+
+
+def _finish_run(db: ThriftStoreDB, run_id: int, duration_ms: int, status: str, detail: str):
+    """Record a run's outcome, reconnecting once if the job lost the connection
+
+    If that fails too, purge_job_history later closes the run as abandoned.
+    """
+    for attempt in range(2):
+        try:
+            if attempt:
+                db.connection.reconnect(attempts=2, delay=1)
+            cursor = db.connection.cursor()
+            try:
+                cursor.execute(
+                    "UPDATE Tb_JobRun SET FinishedAt = NOW(), DurationMs = %s, Status = %s, "
+                    "Detail = %s WHERE RunID = %s",
+                    (duration_ms, status, detail[:1000], run_id)
+                )
+                db.connection.commit()
+            finally:
+                cursor.close()
+            return
+        except Error as e:
+            error = e
+    print(f"Could not record the end of job run {run_id} ({status}): {error}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Thrift store job scheduler")
+    parser.add_argument('command', choices=['list', 'run', 'once'],
+                        help="list: show jobs; run: schedule jobs until interrupted; "
+                             "once: run one job now")
+    parser.add_argument('job', nargs='?', help="job name for 'once'")
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--host', default=os.environ.get('MYSQL_HOST', 'localhost'))
+    parser.add_argument('--user', default=os.environ.get('MYSQL_USER', 'root'))
+    parser.add_argument('--password', default=os.environ.get('MYSQL_PWD'))
+    parser.add_argument('--database', default=os.environ.get('MYSQL_DATABASE', 'MINIPROJECT_DBMS'))
+    args = parser.parse_args(argv)
+
+    jobs = {job.name: job for job in MAINTENANCE_JOBS}
+    if args.command == 'list':
+        now = datetime.now()
+        for job in jobs.values():
+            next_run = CronSchedule(job.schedule).next_after(now)
+            print(f"{job.name:22} {job.schedule:14} next {next_run:%Y-%m-%d %H:%M}  "
+                  f"{job.description}")
+        return 0
+    if args.command == 'once' and args.job not in jobs:
+        parser.error(f"job must be one of: {', '.join(jobs)}")
+
+    password = args.password if args.password is not None else getpass.getpass("MySQL password: ")
+
+    def connect() -> ThriftStoreDB:
+        return ThriftStoreDB(args.host, args.user, password, args.database)
+
+    if args.command == 'once':
+        db = connect()
+        if not db.connect():
+            return 1
+        try:
+            status = run_job(db, jobs[args.job])
+        finally:
+            db.disconnect()
+        print(status or "skipped: already running elsewhere")
+        return 0 if status != 'failed' else 1
+
+    scheduler = JobScheduler(connect, list(jobs.values()), max_workers=args.workers)
+    scheduler.start()
+    print(f"scheduling {len(jobs)} job(s); Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        scheduler.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,13 @@
+-- =====================================================
+-- SEED DATA: ITEM CATEGORIES
+-- =====================================================
+-- Categories cannot be created from the app, so a fresh store database
+-- needs at least these before items can be added.
+
+INSERT IGNORE INTO Tb_Category (CategoryName, Description) VALUES
+    ('Clothing', 'Apparel, shoes and accessories'),
+    ('Books', 'Books, magazines and comics'),
+    ('Electronics', 'Small appliances, audio and gadgets'),
+    ('Furniture', 'Tables, chairs, shelving and decor'),
+    ('Kitchenware', 'Cookware, crockery and utensils'),
+    ('Toys', 'Toys, games and puzzles');
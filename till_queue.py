@@ -0,0 +1,257 @@
+"""
+Thrift Store Management System - Offline Till Queue
+Durable local write-ahead queue for completed sales. The till records a sale
+in an embedded SQLite file immediately; a background flusher replays queued
+sales to MySQL in batches, so checkout keeps working while the main database
+is slow or unreachable.
+"""
+
+import json
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from database import SALE_APPLIED, SALE_CONFLICT, SALE_DUPLICATE, ThriftStoreDB
+
+# Queue entry states
+PENDING = 'pending'
+APPLIED = 'applied'
+CONFLICT = 'conflict'
+DISMISSED = 'dismissed'
+
+# A sale the database keeps failing (while reachable) is set aside as a
+# conflict after this many attempts, so it cannot block the sales behind it
+MAX_ATTEMPTS = 5
+
+
+class SaleQueue:
+    def __init__(self, path: str):
+        """Open (or create) the queue file at path
+
+        The file uses SQLite's WAL journal with synchronous=FULL, so an
+        enqueued sale survives a crash or power cut of the till.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS sales (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                idempotency_key TEXT NOT NULL UNIQUE,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                transaction_id INTEGER,
+                message TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_sales_status ON sales (status, seq)")
+
+    def enqueue(self, customer_id: int, employee_id: int, payment_mode: str,
+                lines: List[Tuple[int, int]], sold_at: Optional[datetime] = None) -> str:
+        """Durably record a sale of (item_id, quantity) lines; returns its idempotency key"""
+        key = str(uuid.uuid4())
+        sold_at = sold_at or datetime.now()
+        payload = json.dumps({
+            'customer_id': int(customer_id),
+            'employee_id': int(employee_id),
+            'payment_mode': payment_mode,
+            'lines': [[int(item_id), int(quantity)] for item_id, quantity in lines],
+            'sold_at': sold_at.isoformat(timespec='seconds'),
+        })
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO sales (idempotency_key, payload, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, now, now)
+            )
+        return key
+
+    def pending(self, limit: int = 50) -> List[Tuple[str, str]]:
+        """Oldest pending sales as (idempotency_key, JSON payload)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT idempotency_key, payload FROM sales WHERE status = ? "
+                "ORDER BY seq LIMIT ?",
+                (PENDING, limit)
+            ).fetchall()
+        return [(row['idempotency_key'], row['payload']) for row in rows]
+
+    def mark(self, key: str, status: str, transaction_id: Optional[int] = None,
+             message: Optional[str] = None):
+        """Record the outcome of a replay attempt"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE sales SET status = ?, transaction_id = COALESCE(?, transaction_id), "
+                "message = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE idempotency_key = ?",
+                (status, transaction_id, message,
+                 datetime.now().isoformat(timespec='seconds'), key)
+            )
+
+    def record_failure(self, key: str, message: str) -> int:
+        """Count a failed replay of a still-pending sale; returns its attempts so far"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE sales SET message = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE idempotency_key = ?",
+                (message, datetime.now().isoformat(timespec='seconds'), key)
+            )
+            row = self._conn.execute(
+                "SELECT attempts FROM sales WHERE idempotency_key = ?", (key,)
+            ).fetchone()
+        return row['attempts'] if row else 0
+
+    def counts(self) -> Dict[str, int]:
+        """Number of entries per status"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS n FROM sales GROUP BY status"
+            ).fetchall()
+        return {row['status']: row['n'] for row in rows}
+
+    def conflicts(self) -> List[Dict]:
+        """Sales the database rejected, for staff to resolve by hand"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT idempotency_key, payload, message, updated_at FROM sales "
+                "WHERE status = ? ORDER BY seq",
+                (CONFLICT,)
+            ).fetchall()
+        conflicts = []
+        for row in rows:
+            try:
+                payload = json.loads(row['payload'])
+                sale = {
+                    'SoldAt': payload['sold_at'],
+                    'CustomerID': payload['customer_id'],
+                    'Lines': ', '.join(f"{item_id} x{qty}" for item_id, qty in payload['lines']),
+                }
+            except (ValueError, KeyError, TypeError):
+                sale = {'SoldAt': None, 'CustomerID': None, 'Lines': row['payload']}
+            conflicts.append({
+                'Key': row['idempotency_key'],
+                **sale,
+                'Reason': row['message'],
+                'CheckedAt': row['updated_at'],
+            })
+        return conflicts
+
+    def dismiss(self, key: str):
+        """Acknowledge a conflict so it no longer shows as outstanding"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE sales SET status = ?, updated_at = ? "
+                "WHERE idempotency_key = ? AND status = ?",
+                (DISMISSED, datetime.now().isoformat(timespec='seconds'), key, CONFLICT)
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class QueueFlusher(threading.Thread):
+    def __init__(self, queue: SaleQueue, connect: Callable[[], ThriftStoreDB],
+                 interval: float = 2.0, batch_size: int = 50):
+        """Background thread replaying queued sales to MySQL
+
+        connect returns a new, unconnected ThriftStoreDB; the flusher keeps
+        its own connection so it never shares one with the page thread.
+        Each sale is its own MySQL transaction, keyed by its idempotency key,
+        so a batch interrupted mid-way is simply retried.
+        """
+        super().__init__(name='till-queue-flusher', daemon=True)
+        self.queue = queue
+        self.interval = interval
+        self.batch_size = batch_size
+        self.last_error: Optional[str] = None
+        self.last_flush: Optional[datetime] = None
+        self._connect = connect
+        self._db: Optional[ThriftStoreDB] = None
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+
+    def wake(self):
+        """Flush now instead of waiting for the next interval"""
+        self._wake.set()
+
+    def stop(self):
+        self._stopping.set()
+        self._wake.set()
+
+    def run(self):
+        while not self._stopping.is_set():
+            try:
+                while self.flush_once() == self.batch_size:
+                    pass
+            except Exception as e:
+                # e.g. the queue file locked by another process; the thread
+                # must outlive it, so the batch is retried next interval
+                print(f"Till queue flush failed: {e}")
+                self.last_error = str(e)
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def _database(self) -> Optional[ThriftStoreDB]:
+        if self._db is not None and self._db.connection is not None \
+                and self._db.connection.is_connected():
+            return self._db
+        db = self._connect()
+        if not db.connect():
+            self.last_error = "main database unreachable"
+            return None
+        self._db = db
+        return db
+
+    def flush_once(self) -> int:
+        """Replay one batch of pending sales; returns how many were settled"""
+        batch = self.queue.pending(self.batch_size)
+        if not batch:
+            return 0
+        db = self._database()
+        if db is None:
+            return 0
+
+        settled = 0
+        for key, payload in batch:
+            try:
+                sale = json.loads(payload)
+                args = (sale['customer_id'], sale['employee_id'], sale['payment_mode'],
+                        sale['lines'], datetime.fromisoformat(sale['sold_at']))
+            except (ValueError, KeyError, TypeError) as e:
+                # Retrying cannot fix it, and it would block the sales behind it
+                self.queue.mark(key, CONFLICT, None, f"Unreadable queued sale: {e!r}")
+                settled += 1
+                continue
+            status, trans_id, message = db.record_sale(key, *args)
+            if status in (SALE_APPLIED, SALE_DUPLICATE):
+                self.queue.mark(key, APPLIED, trans_id or None, message)
+            elif status == SALE_CONFLICT:
+                self.queue.mark(key, CONFLICT, None, message)
+            elif not db.connection.is_connected():
+                # Lost the database: leave it pending, in order, until the next interval
+                self.last_error = message
+                self._db = None
+                break
+            elif self.queue.record_failure(key, message) >= MAX_ATTEMPTS:
+                self.queue.mark(key, CONFLICT, None,
+                                f"Gave up after {MAX_ATTEMPTS} attempts: {message}")
+            else:
+                # Retry it first next interval, in case the failure was transient
+                self.last_error = message
+                break
+            settled += 1
+
+        if settled == len(batch):
+            self.last_error = None
+        self.last_flush = datetime.now()
+        return settled
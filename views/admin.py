@@ -0,0 +1,104 @@
+"""
+Thrift Store Management System - Admin Page
+Background job schedules, manual runs and run history
+"""
+
+import os
+from datetime import date
+
+import pandas as pd
+import streamlit as st
+
+from database import ThriftStoreDB
+from scheduler import MAINTENANCE_JOBS, Job, JobScheduler
+from views.common import background_worker, page_header, tab_selector
+
+# Set to 0 when jobs run from a standalone `python scheduler.py run` instead
+IN_APP_SCHEDULER = os.environ.get('THRIFT_IN_APP_SCHEDULER', '1') != '0'
+
+
+def _refresh_analytics(db: ThriftStoreDB) -> str:
+    """Fold new sales into the shared dashboard and basket caches before anyone opens them"""
+    # Imported here so the page modules load in the job thread, not at startup
+    from views.dashboard import sales_history
+    from views.reports import basket_analyzer
+
+    sales_history(db.host, db.database).refresh(db, date.today())
+    added = sum(basket_analyzer(db.host, db.database, level).refresh(db)
+                for level in ('item', 'category'))
+    return f"sales history refreshed, {added} new baskets"
+
+
+APP_JOBS = MAINTENANCE_JOBS + [
+    Job('refresh_analytics', '15 1 * * *', _refresh_analytics,
+        "Refresh reorder-suggestion and basket statistics caches"),
+]
+
+
+def app_scheduler(db: ThriftStoreDB) -> JobScheduler:
+    """The in-app job scheduler for db's database, started by the first session"""
+    return background_worker('scheduler', db, lambda connect: JobScheduler(connect, APP_JOBS))
+
+
+def _jobs(db):
+    st.subheader("Scheduled Jobs")
+    if not IN_APP_SCHEDULER:
+        st.info("The in-app scheduler is off (THRIFT_IN_APP_SCHEDULER=0); "
+                "jobs run from `python scheduler.py run`")
+        return
+
+    scheduler = app_scheduler(db)
+    running = scheduler.running()
+    jobs_df = pd.DataFrame({
+        'Job': list(scheduler.jobs),
+        'Schedule': [job.schedule for job in scheduler.jobs.values()],
+        'Next Run': [scheduler.next_runs[name] for name in scheduler.jobs],
+        'Running Here': [name in running for name in scheduler.jobs],
+        'Description': [job.description for job in scheduler.jobs.values()],
+    })
+    st.dataframe(jobs_df, use_container_width=True, hide_index=True)
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        job_name = st.selectbox("Job", list(scheduler.jobs))
+    with col2:
+        st.write("")
+        st.write("")
+        if st.button("Run Now"):
+            if scheduler.submit(job_name) is None:
+                st.warning(f"{job_name} is already running")
+            else:
+                st.success(f"{job_name} started; see Run History")
+
+
+def _run_history(db):
+    st.subheader("Run History")
+    runs_df = db.get_job_runs()
+
+    if runs_df.empty:
+        st.info("No job runs recorded yet")
+        return
+
+    summary = (runs_df.groupby('JobName')
+               .agg(Runs=('RunID', 'size'),
+                    LastStarted=('StartedAt', 'max'),
+                    Failures=('Status', lambda s: int((s == 'failed').sum())),
+                    MedianMs=('DurationMs', 'median'))
+               .reset_index())
+    st.dataframe(summary, use_container_width=True, hide_index=True,
+                 column_config={'MedianMs': st.column_config.NumberColumn(
+                     "Median Duration (ms)", format="%.0f")})
+    st.dataframe(runs_df, use_container_width=True, hide_index=True)
+    if st.button("Refresh"):
+        st.rerun()
+
+
+TABS = {
+    "⏰ Jobs": _jobs,
+    "📜 Run History": _run_history,
+}
+
+
+def render(db):
+    page_header("🛠️ Admin")
+    TABS[tab_selector(list(TABS), key="admin_tab")](db)
@@ -0,0 +1,81 @@
+"""
+Thrift Store Management System - Chain-Wide Reports Page
+"""
+
+import os
+from datetime import datetime
+
+import streamlit as st
+
+from federation import FederatedReports, StoreRegistry
+from views.common import page_header, tab_selector
+
+STORES_FILE = os.environ.get('THRIFT_STORES_FILE', 'stores.json')
+
+
+@st.cache_resource(show_spinner=False)
+def _federation(path: str, modified: float) -> FederatedReports:
+    """One thread pool and set of store connections per registry file version"""
+    return FederatedReports(StoreRegistry.from_json(path))
+
+
+def _show(result, money_column: str = None):
+    df, errors = result
+    for store, error in sorted(errors.items()):
+        st.warning(f"{store}: {error}")
+    if df.empty:
+        st.info("No data returned")
+        return
+    st.dataframe(df, use_container_width=True, hide_index=True)
+    if money_column:
+        totals = df.groupby('Store', as_index=False)[money_column].sum()
+        st.markdown("**Totals by Store**")
+        st.dataframe(totals, use_container_width=True, hide_index=True)
+
+
+def _sales(federation):
+    current_date = datetime.now()
+    col1, col2 = st.columns(2)
+    with col1:
+        month = st.selectbox("Month", range(1, 13), index=current_date.month-1)
+    with col2:
+        year = st.number_input("Year", min_value=2020, value=current_date.year)
+    if st.button("Run Across Stores"):
+        _show(federation.sales_report(year, month, year, month), 'TotalAmount')
+
+
+def _low_stock(federation):
+    threshold = st.number_input("Threshold", min_value=0, value=5)
+    if st.button("Run Across Stores"):
+        _show(federation.low_stock(int(threshold)))
+
+
+def _inventory_value(federation):
+    if st.button("Run Across Stores"):
+        _show(federation.inventory_value(), 'InventoryValue')
+
+
+def _employee_performance(federation):
+    if st.button("Run Across Stores"):
+        _show(federation.employee_performance(), 'TotalSales')
+
+
+TABS = {
+    "📈 Sales": _sales,
+    "⚠️ Low Stock": _low_stock,
+    "📦 Inventory Value": _inventory_value,
+    "👤 Employee Performance": _employee_performance,
+}
+
+
+def render(db):
+    page_header(" Chain Reports")
+    if not os.path.exists(STORES_FILE):
+        st.info(f"No store registry found. Copy stores.example.json to {STORES_FILE} "
+                "(or set THRIFT_STORES_FILE) to report across branches.")
+        return
+    
+    federation = _federation(STORES_FILE, os.path.getmtime(STORES_FILE))
+    st.caption(f"{len(federation.registry.names())} stores: "
+               + ", ".join(federation.registry.names()))
+    TABS[tab_selector(list(TABS), key="chain_tab")](federation)
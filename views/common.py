@@ -0,0 +1,108 @@
+"""
+Thrift Store Management System - Shared Page Helpers
+"""
+
+import atexit
+import threading
+import time
+from typing import Callable, Dict, Iterable, List
+
+import pandas as pd
+import streamlit as st
+
+from database import ThriftStoreDB
+from events import ChangeTracker, OutboxPoller
+from frames import patch_rows
+
+_workers_lock = threading.Lock()
+
+# Seconds before a live listing is reloaded in full, picking up any change
+# the tracker missed (e.g. one written while this process's poller was down)
+LIVE_FRAME_TTL = 300
+
+
+def page_header(title: str):
+    """Render the large centered page title"""
+    st.markdown(f"<div class='main-header'>{title}</div>", unsafe_allow_html=True)
+
+
+def tab_selector(labels: List[str], key: str) -> str:
+    """Tab-style selector that, unlike st.tabs, lets the caller render only the active tab"""
+    return st.radio("Section", labels, key=key, horizontal=True,
+                    label_visibility="collapsed")
+
+
+def _stop_workers(workers: Dict[tuple, tuple]):
+    for worker, _ in list(workers.values()):
+        worker.stop()
+    workers.clear()
+
+
+@st.cache_resource(show_spinner=False)
+def _background_workers() -> Dict[tuple, tuple]:
+    """Process-wide {(name, host, port, database, user): (worker, password)}"""
+    workers: Dict[tuple, tuple] = {}
+    atexit.register(_stop_workers, workers)
+    return workers
+
+
+def background_worker(name: str, db: ThriftStoreDB,
+                      build: Callable[[Callable[[], ThriftStoreDB]], object], **options):
+    """Start the named background worker for db's database and user once per process
+
+    build(connect) returns an unstarted worker with start(), stop() and
+    is_alive(); connect returns a new, unconnected ThriftStoreDB with db's
+    credentials and the given constructor options. Sessions of the same user
+    share the worker; one connecting with a different password, or finding
+    the worker's thread dead, replaces it. Workers are stopped when the
+    process exits.
+    """
+    key = (name, db.host, db.port, db.database, db.user)
+    host, port, database, user, password = db.host, db.port, db.database, db.user, db.password
+    archive_dir = db.archive_dir
+    workers = _background_workers()
+    with _workers_lock:
+        worker, started_with = workers.get(key, (None, None))
+        if worker is not None and (started_with != password or not worker.is_alive()):
+            worker.stop()
+            worker = None
+        if worker is None:
+            worker = build(lambda: ThriftStoreDB(host, user, password, database, port=port,
+                                                 archive_dir=archive_dir, **options))
+            worker.start()
+            workers[key] = (worker, password)
+    return worker
+
+
+def change_poller(db: ThriftStoreDB) -> OutboxPoller:
+    """The outbox poller relaying other processes' writes to this process's bus"""
+    return background_worker('change-poller', db, OutboxPoller)
+
+
+def live_frame(db, key: str, entities: Iterable[str],
+               load: Callable[..., pd.DataFrame], id_column: str) -> pd.DataFrame:
+    """A listing kept in the session and patched with just the rows changed since the last run
+
+    load(None, replica=False) returns the whole listing from the primary and
+    load(ids) just those rows. Full loads skip the replica: a change it has
+    not applied yet was published before the tracker subscribed and would
+    never be patched in. The first run, any run after the tracker overflowed
+    and the first run after LIVE_FRAME_TTL seconds load everything.
+    """
+    state_key = f"live_{key}_{db.host}_{db.database}"
+    live = st.session_state.get(state_key)
+    if live is None:
+        # Subscribe before loading so no change between the two is missed
+        tracker = ChangeTracker(entities)
+        live = st.session_state[state_key] = {'tracker': tracker, 'df': load(None, replica=False),
+                                              'loaded_at': time.monotonic()}
+        return live['df']
+
+    ids, overflowed = live['tracker'].drain()
+    if overflowed or live['df'].empty or time.monotonic() - live['loaded_at'] > LIVE_FRAME_TTL:
+        live['df'] = load(None, replica=False)
+        live['loaded_at'] = time.monotonic()
+    elif ids:
+        ids = sorted(ids)
+        live['df'] = patch_rows(live['df'], load(ids), id_column, ids)
+    return live['df']
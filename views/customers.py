@@ -0,0 +1,89 @@
+"""
+Thrift Store Management System - Customer Management Page
+"""
+
+import streamlit as st
+
+from archive import ArchiveUnavailable
+from events import CUSTOMER
+from frames import options_from_columns
+from views.common import live_frame, page_header, tab_selector
+
+
+def _customers(db):
+    return live_frame(db, 'customers', (CUSTOMER,), db.get_all_customers, 'CustomerID')
+
+
+def _view_customers(db):
+    st.subheader("All Customers")
+    customers_df = _customers(db)
+    if not customers_df.empty:
+        st.dataframe(customers_df, use_container_width=True, hide_index=True)
+    else:
+        st.info("No customers found")
+
+
+def _add_customer(db):
+    st.subheader("Add New Customer")
+    with st.form("add_customer_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            first_name = st.text_input("First Name*")
+            phone = st.text_input("Phone Number*")
+        with col2:
+            last_name = st.text_input("Last Name*")
+            email = st.text_input("Email*")
+        
+        submitted = st.form_submit_button("Add Customer")
+        
+        if submitted:
+            if first_name and last_name and phone and email:
+                success, message = db.add_customer(first_name, last_name, phone, email)
+                if success:
+                    st.success(message)
+                else:
+                    st.error(message)
+            else:
+                st.error("Please fill all required fields")
+
+
+def _customer_details(db):
+    st.subheader("Customer Purchase History")
+    customers_df = _customers(db)
+    if not customers_df.empty:
+        customer_options = options_from_columns(
+            customers_df, "{FirstName} {LastName} (ID: {CustomerID})", 'CustomerID'
+        )
+        selected_customer = st.selectbox("Select Customer", options=customer_options.keys())
+        
+        if selected_customer and st.button("View History"):
+            customer_id = customer_options[selected_customer]
+            
+            # Show total purchases
+            total = db.get_customer_total_purchases(customer_id)
+            st.metric("Total Purchases", f"₹{total:,.2f}")
+            
+            # Show purchase history
+            try:
+                history = db.get_customer_purchase_history(customer_id)
+            except ArchiveUnavailable as e:
+                st.error(str(e))
+                return
+            if not history.empty:
+                st.dataframe(history, use_container_width=True, hide_index=True)
+            else:
+                st.info("No purchase history found")
+    else:
+        st.info("No customers available")
+
+
+TABS = {
+    "📋 View Customers": _view_customers,
+    "➕ Add Customer": _add_customer,
+    "🔍 Customer Details": _customer_details,
+}
+
+
+def render(db):
+    page_header("👥 Customer Management")
+    TABS[tab_selector(list(TABS), key="customers_tab")](db)
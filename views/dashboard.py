@@ -0,0 +1,100 @@
+"""
+Thrift Store Management System - Dashboard Page
+"""
+
+from datetime import datetime
+
+import streamlit as st
+from mysql.connector import Error
+
+from archive import ArchiveUnavailable
+from forecast import SalesHistory, category_velocity, reorder_suggestions
+from views.common import page_header
+
+
+@st.cache_resource(show_spinner=False)
+def sales_history(host: str, database: str) -> SalesHistory:
+    """One sales history per store database, shared across sessions"""
+    return SalesHistory()
+
+
+def render(db):
+    page_header(" Dashboard")
+    
+    # Get statistics
+    stats = db.get_dashboard_stats()
+    
+    # Display metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Customers", stats['total_customers'])
+    with col2:
+        st.metric("Total Items", stats['total_items'])
+    with col3:
+        st.metric("Total Transactions", stats['total_transactions'])
+    with col4:
+        st.metric("Total Revenue", f"₹{stats['total_revenue']:,.2f}")
+    
+    st.divider()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("⚠️ Low Stock Alert")
+        if stats['low_stock_count'] > 0:
+            st.warning(f"{stats['low_stock_count']} items are low on stock!")
+            low_stock_df = db.get_low_stock_items(5)
+            if not low_stock_df.empty:
+                st.dataframe(low_stock_df, use_container_width=True)
+        else:
+            st.success("All items are well stocked!")
+    
+    with col2:
+        st.subheader(" Recent Transactions")
+        current_date = datetime.now()
+        try:
+            recent_trans = db.get_sales_report(
+                current_date.year, current_date.month,
+                current_date.year, current_date.month
+            )
+        except ArchiveUnavailable as e:
+            st.warning(str(e))
+        else:
+            if not recent_trans.empty:
+                st.dataframe(recent_trans.head(10), use_container_width=True)
+            else:
+                st.info("No transactions this month")
+    
+    st.divider()
+    
+    st.subheader("📉 Reorder Suggestions")
+    history = sales_history(db.host, db.database)
+    try:
+        history.refresh(db)
+    except Error as e:
+        st.warning(f"Sales history may be out of date: {e}")
+    stock = db.get_stock_levels()
+    if stock.empty:
+        st.info("No items in the catalogue")
+        return
+    
+    velocities = history.velocities(stock['ItemID'])
+    suggestions = reorder_suggestions(stock, velocities)
+    if not suggestions.empty:
+        st.dataframe(
+            suggestions[['Name', 'CategoryName', 'QuantityAvailable', 'Velocity',
+                         'DaysUntilStockout', 'ReorderQty']].head(10),
+            use_container_width=True, hide_index=True,
+            column_config={
+                'Velocity': st.column_config.NumberColumn("Units/Day", format="%.2f"),
+                'DaysUntilStockout': st.column_config.NumberColumn("Days Left", format="%.1f"),
+                'ReorderQty': st.column_config.NumberColumn("Reorder Qty"),
+            }
+        )
+    else:
+        st.success("No items are projected to run out within the reorder window")
+    
+    with st.expander("Sales velocity by category"):
+        st.dataframe(category_velocity(stock, velocities), use_container_width=True,
+                     hide_index=True)
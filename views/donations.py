@@ -0,0 +1,71 @@
+"""
+Thrift Store Management System - Donation Management Page
+"""
+
+import streamlit as st
+
+from frames import options_from_columns
+from views.common import page_header, tab_selector
+
+
+def _record_donation(db):
+    st.subheader("Record New Donation")
+    
+    donors_df = db.get_all_donors()
+    employees_df = db.get_all_employees()
+    
+    with st.form("add_donation_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if not donors_df.empty:
+                donor_options = options_from_columns(
+                    donors_df, "{FirstName} {LastName}", 'DonorID'
+                )
+                selected_donor = st.selectbox("Donor", options=donor_options.keys())
+                donor_id = donor_options[selected_donor]
+            else:
+                st.error("No donors available")
+                donor_id = None
+        
+        with col2:
+            if not employees_df.empty:
+                employee_options = options_from_columns(
+                    employees_df, "{FirstName} {LastName}", 'EmployeeID'
+                )
+                selected_employee = st.selectbox("Handled By", options=employee_options.keys())
+                employee_id = employee_options[selected_employee]
+            else:
+                st.error("No employees available")
+                employee_id = None
+        
+        estimated_value = st.number_input("Estimated Value (₹)", min_value=0.0, step=10.0)
+        
+        submitted = st.form_submit_button("Record Donation")
+        
+        if submitted and donor_id and employee_id:
+            success, message = db.add_donation(donor_id, employee_id, estimated_value)
+            if success:
+                st.success(message)
+            else:
+                st.error(message)
+
+
+def _view_donors(db):
+    st.subheader("All Donors")
+    donors_df = db.get_all_donors()
+    if not donors_df.empty:
+        st.dataframe(donors_df, use_container_width=True, hide_index=True)
+    else:
+        st.info("No donors found")
+
+
+TABS = {
+    "➕ Record Donation": _record_donation,
+    "📋 View Donors": _view_donors,
+}
+
+
+def render(db):
+    page_header(" Donation Management")
+    TABS[tab_selector(list(TABS), key="donations_tab")](db)
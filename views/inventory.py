@@ -0,0 +1,122 @@
+"""
+Thrift Store Management System - Inventory Management Page
+"""
+
+import streamlit as st
+
+from events import INVENTORY, ITEM
+from frames import options_from_columns
+from views.common import live_frame, page_header, tab_selector
+
+
+def _items(db):
+    return live_frame(db, 'items', (ITEM, INVENTORY), db.get_all_items, 'ItemID')
+
+
+def _view_items(db):
+    st.subheader("All Items")
+    items_df = _items(db)
+    if not items_df.empty:
+        st.dataframe(items_df, use_container_width=True, hide_index=True)
+    else:
+        st.info("No items found")
+
+
+def _add_item(db):
+    st.subheader("Add New Item")
+    categories_df = db.get_all_categories()
+    
+    with st.form("add_item_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            item_name = st.text_input("Item Name*")
+            sku = st.text_input("SKU / Barcode")
+            condition = st.selectbox("Condition*", 
+                ["New", "Like New", "Good", "Fair", "Poor"])
+            price = st.number_input("Price*", min_value=0.0, step=0.01)
+        
+        with col2:
+            if not categories_df.empty:
+                category_options = options_from_columns(
+                    categories_df, "{CategoryName}", 'CategoryID'
+                )
+                selected_category = st.selectbox("Category*", options=category_options.keys())
+                category_id = category_options[selected_category]
+            else:
+                st.error("No categories available")
+                category_id = None
+        
+        submitted = st.form_submit_button("Add Item")
+        
+        if submitted and item_name and category_id:
+            success, message = db.add_item(item_name, condition, price, category_id,
+                                           sku=sku.strip())
+            if success:
+                st.success(message)
+            else:
+                st.error(message)
+
+
+def _update_price(db):
+    st.subheader("Update Item Price")
+    items_df = _items(db)
+    
+    if not items_df.empty:
+        item_options = options_from_columns(
+            items_df, "{Name} - Current: ₹{Price:.2f} (ID: {ItemID})", 'ItemID'
+        )
+        
+        selected_item = st.selectbox("Select Item", options=item_options.keys())
+        new_price = st.number_input("New Price", min_value=0.0, step=0.01)
+        
+        if st.button("Update Price"):
+            item_id = item_options[selected_item]
+            success, message = db.update_item_price(item_id, new_price)
+            if success:
+                st.success(message)
+                st.rerun()
+            else:
+                st.error(message)
+    else:
+        st.info("No items available")
+
+
+def _add_stock(db):
+    st.subheader("Add Inventory Stock")
+    items_df = _items(db)
+    
+    if not items_df.empty:
+        with st.form("add_inventory_form"):
+            item_options = options_from_columns(
+                items_df, "{Name} (ID: {ItemID})", 'ItemID'
+            )
+            
+            selected_item = st.selectbox("Select Item", options=item_options.keys())
+            quantity = st.number_input("Quantity to Add", min_value=1, step=1)
+            location = st.text_input("Storage Location", value="Main Store")
+            
+            submitted = st.form_submit_button("Add to Inventory")
+            
+            if submitted:
+                item_id = item_options[selected_item]
+                success, message = db.add_inventory(item_id, quantity, location)
+                if success:
+                    st.success(message)
+                else:
+                    st.error(message)
+    else:
+        st.info("No items available")
+
+
+TABS = {
+    "📋 View Items": _view_items,
+    "➕ Add Item": _add_item,
+    "💰 Update Price": _update_price,
+    "📥 Add Stock": _add_stock,
+}
+
+
+def render(db):
+    page_header(" Inventory Management")
+    TABS[tab_selector(list(TABS), key="inventory_tab")](db)
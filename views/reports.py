@@ -0,0 +1,183 @@
+"""
+Thrift Store Management System - Reports & Analytics Page
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+from mysql.connector import Error
+
+from aging import AGE_LABELS
+from archive import ArchiveUnavailable
+from basket import BasketAnalyzer, keys_in, label_pairs
+from views.common import page_header, tab_selector
+
+
+def _sales_report(db):
+    st.subheader("Sales Report")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    current_date = datetime.now()
+    with col1:
+        start_month = st.selectbox("Start Month", range(1, 13), index=0)
+    with col2:
+        start_year = st.number_input("Start Year", min_value=2020, 
+                                    value=current_date.year)
+    with col3:
+        end_month = st.selectbox("End Month", range(1, 13), 
+                                index=current_date.month-1)
+    with col4:
+        end_year = st.number_input("End Year", min_value=2020, 
+                                  value=current_date.year)
+    
+    if st.button("Generate Report"):
+        try:
+            report_df = db.get_sales_report(start_year, start_month, end_year, end_month)
+        except ArchiveUnavailable as e:
+            st.error(str(e))
+            return
+        if not report_df.empty:
+            st.dataframe(report_df, use_container_width=True, hide_index=True)
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Transactions", len(report_df))
+            with col2:
+                st.metric("Total Revenue", f"₹{report_df['TotalAmount'].sum():,.2f}")
+            with col3:
+                st.metric("Average Transaction", 
+                        f"₹{report_df['TotalAmount'].mean():,.2f}")
+        else:
+            st.info("No sales data for selected period")
+
+
+def _inventory_report(db):
+    st.subheader("Inventory Report")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Low Stock Items**")
+        low_stock = db.get_low_stock_items(10)
+        if not low_stock.empty:
+            st.dataframe(low_stock, use_container_width=True, hide_index=True)
+        else:
+            st.success("No low stock items")
+    
+    with col2:
+        st.markdown("**Category Inventory Value**")
+        values_df = db.get_inventory_value_by_category()
+        if not values_df.empty:
+            category_values = pd.DataFrame({
+                'Category': values_df['CategoryName'],
+                'Inventory Value': values_df['InventoryValue'].map("₹{:,.2f}".format)
+            })
+            st.dataframe(category_values, use_container_width=True, hide_index=True)
+
+
+def _employee_performance(db):
+    st.subheader("Employee Performance")
+    performance_df = db.get_employee_performance()
+    
+    if not performance_df.empty:
+        perf_df = pd.DataFrame({
+            'Employee': performance_df['Employee'],
+            'Role': performance_df['Role'],
+            'Total Sales': performance_df['TotalSales'].map("₹{:,.2f}".format)
+        })
+        st.dataframe(perf_df, use_container_width=True, hide_index=True)
+    else:
+        st.info("No employee data available")
+
+
+@st.cache_resource(show_spinner=False)
+def basket_analyzer(host: str, database: str, level: str) -> BasketAnalyzer:
+    """One analyzer per store database and level, shared across sessions"""
+    return BasketAnalyzer(level)
+
+
+def _basket_analysis(db):
+    st.subheader("Frequently Bought Together")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        level = st.radio("Level", ["item", "category"], horizontal=True,
+                         format_func=str.title)
+    with col2:
+        min_count = st.number_input("Minimum Times Bought Together", min_value=1, value=2)
+    
+    analyzer = basket_analyzer(db.host, db.database, level)
+    try:
+        with st.spinner("Updating basket statistics..."):
+            added = analyzer.refresh(db)
+    except Error as e:
+        st.warning(f"Basket statistics may be out of date: {e}")
+        added = 0
+    st.caption(f"{analyzer.n_baskets:,} baskets analysed ({added:,} new since last refresh)")
+    
+    pairs = analyzer.pairs(min_count=int(min_count))
+    if not pairs.empty:
+        names = db.get_names(level, keys_in(pairs))
+        st.dataframe(label_pairs(pairs, names), use_container_width=True, hide_index=True,
+                     column_config={
+                         'Support': st.column_config.NumberColumn(format="%.4f"),
+                         'Confidence A→B': st.column_config.NumberColumn(format="%.2f"),
+                         'Confidence B→A': st.column_config.NumberColumn(format="%.2f"),
+                         'Lift': st.column_config.NumberColumn(format="%.2f"),
+                     })
+    else:
+        st.info("Not enough sales data yet")
+
+
+def _inventory_aging(db):
+    st.subheader("Inventory Aging")
+    
+    groupings = {
+        "Category & Location": ('CategoryName', 'Location'),
+        "Category": ('CategoryName',),
+        "Location": ('Location',),
+    }
+    grouping = st.radio("Group By", list(groupings), horizontal=True)
+    aging_df = db.get_inventory_aging(groupings[grouping])
+    
+    if aging_df.empty:
+        st.info("No stock batches recorded yet")
+        return
+    
+    col1, col2, col3 = st.columns(3)
+    on_hand = aging_df['OnHand'].sum()
+    with col1:
+        st.metric("Units On Hand", f"{on_hand:,}")
+    with col2:
+        stale = aging_df[AGE_LABELS[-2:]].to_numpy().sum()
+        st.metric("On Shelf > 180 Days", f"{stale:,}")
+    with col3:
+        received = aging_df['Received'].sum()
+        st.metric("Sell-Through", f"{aging_df['Sold'].sum() / received:.0%}" if received else "-")
+    
+    st.dataframe(aging_df, use_container_width=True, hide_index=True,
+                 column_config={
+                     'CategoryName': st.column_config.TextColumn("Category"),
+                     'SellThrough': st.column_config.ProgressColumn(
+                         "Sell-Through", format="%.2f", min_value=0, max_value=1),
+                     'AvgDaysOnShelf': st.column_config.NumberColumn(
+                         "Avg Days On Shelf", format="%.0f"),
+                     'Turnover': st.column_config.NumberColumn("Turnover / Year", format="%.2f"),
+                 })
+    
+    labels = aging_df[list(groupings[grouping])].astype(str).agg(' / '.join, axis=1)
+    st.bar_chart(aging_df[AGE_LABELS].set_axis(labels))
+
+
+TABS = {
+    "📈 Sales Report": _sales_report,
+    "📦 Inventory Report": _inventory_report,
+    "👤 Employee Performance": _employee_performance,
+    "🛒 Frequently Bought Together": _basket_analysis,
+    "⏳ Inventory Aging": _inventory_aging,
+}
+
+
+def render(db):
+    page_header(" Reports & Analytics")
+    TABS[tab_selector(list(TABS), key="reports_tab")](db)
@@ -0,0 +1,298 @@
+"""
+Thrift Store Management System - Transaction Processing Page
+"""
+
+import os
+import re
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+import pandas as pd
+import streamlit as st
+from mysql.connector import Error
+
+from archive import ArchiveUnavailable
+from database import ThriftStoreDB
+from frames import options_from_columns
+from till_queue import PENDING, QueueFlusher, SaleQueue
+from views.common import background_worker, page_header, tab_selector
+
+# Directory holding the till's local sale queue files
+QUEUE_DIR = os.environ.get('THRIFT_TILL_QUEUE_DIR', '.')
+
+# Seconds a till read may take before the till carries on without the database
+TILL_TIMEOUT = int(os.environ.get('THRIFT_TILL_TIMEOUT', 3))
+
+
+def till_flusher(db: ThriftStoreDB) -> QueueFlusher:
+    """The durable sale queue of db's database and the thread replaying it"""
+    name = re.sub(r'[^\w.-]', '_', f"{db.host}_{db.port}_{db.database}")
+    path = os.path.join(QUEUE_DIR, f"till_queue_{name}.sqlite3")
+    return background_worker('till-queue', db,
+                             lambda connect: QueueFlusher(SaleQueue(path), connect), timeout=10)
+
+
+def till_db(db: ThriftStoreDB) -> Optional[ThriftStoreDB]:
+    """This session's connection for the till's reads, None while it cannot connect
+
+    Reads on it are bounded by TILL_TIMEOUT (connect, socket reads and
+    MAX_EXECUTION_TIME), so an unresponsive database stalls a scan for
+    seconds rather than hanging the page.
+    """
+    key = f"till_db_{db.host}_{db.port}_{db.database}_{db.user}"
+    till = st.session_state.get(key)
+    if till is None or till.password != db.password:
+        till = ThriftStoreDB(db.host, db.user, db.password, db.database, port=db.port,
+                             timeout=TILL_TIMEOUT)
+        st.session_state[key] = till
+    if till.connection is not None and till.connection.is_connected():
+        return till
+    return till if till.connect() else None
+
+
+def _last_known(key: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Remember a picker's rows so the till keeps working if the database drops out"""
+    if not df.empty:
+        st.session_state[key] = df
+    return st.session_state.get(key, df)
+
+
+def _catalogue_item(sku: str) -> Optional[Dict]:
+    """Find a SKU in the last catalogue this session loaded, for scans while offline"""
+    items_df = st.session_state.get('till_items')
+    if items_df is None or items_df.empty:
+        return None
+    rows = items_df[items_df['SKU'] == sku]
+    if rows.empty:
+        return None
+    first = rows.iloc[0]
+    return {
+        'ItemID': int(first['ItemID']),
+        'SKU': sku,
+        'Name': first['Name'],
+        'Price': float(first['Price']),
+        'QuantityAvailable': int(rows['QuantityAvailable'].fillna(0).sum())
+    }
+
+
+def _sync_status(flusher: QueueFlusher):
+    """Queue backlog, last sync error and unresolved conflicts"""
+    counts = flusher.queue.counts()
+    waiting = counts.get(PENDING, 0)
+    if waiting:
+        reason = f" — {flusher.last_error}" if flusher.last_error else ""
+        st.warning(f"⏳ {waiting} sale(s) waiting to sync{reason}")
+    
+    conflicts = flusher.queue.conflicts()
+    if conflicts:
+        with st.expander(f"⚠️ {len(conflicts)} sale(s) rejected during sync", expanded=True):
+            st.caption("These sales were taken at the till but the database refused them, "
+                       "usually because stock ran out. Settle them by hand, then dismiss.")
+            st.dataframe(pd.DataFrame(conflicts), use_container_width=True, hide_index=True)
+            options = [c['Key'] for c in conflicts]
+            selected = st.selectbox("Conflict", options, key="conflict_key")
+            if st.button("Dismiss Conflict"):
+                flusher.queue.dismiss(selected)
+                st.rerun()
+
+
+def _add_to_cart(item_id: int, name: str, price: float, quantity: int,
+                 available: int) -> Optional[str]:
+    """Add a line to the cart (merging repeat scans); returns an error message or None"""
+    line = next((entry for entry in st.session_state.cart
+                 if entry['item_id'] == item_id), None)
+    in_cart = line['quantity'] if line else 0
+    if in_cart + quantity > available:
+        return f"Only {available} units available!"
+    
+    if line:
+        line['quantity'] += quantity
+        line['line_total'] = line['unit_price'] * line['quantity']
+    else:
+        st.session_state.cart.append({
+            'item_id': item_id,
+            'name': name,
+            'quantity': quantity,
+            'unit_price': price,
+            'line_total': price * quantity
+        })
+    return None
+
+
+def _new_transaction(db):
+    st.subheader("Process New Sale")
+    
+    flusher = till_flusher(db)
+    if 'till_notice' in st.session_state:
+        st.success(st.session_state.pop('till_notice'))
+    _sync_status(flusher)
+    
+    reader = till_db(db)
+    if reader is None:
+        st.warning("⚠️ Database unavailable — using the last known customers and "
+                   "catalogue; sales are queued until it is back")
+    empty = pd.DataFrame()
+    customers_df = _last_known('till_customers',
+                               reader.get_all_customers() if reader else empty)
+    employees_df = _last_known('till_employees',
+                               reader.get_all_employees() if reader else empty)
+    
+    if customers_df.empty or employees_df.empty:
+        st.error("Please ensure customers and employees are available")
+        return
+    
+    # Transaction header
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        customer_options = options_from_columns(
+            customers_df, "{FirstName} {LastName}", 'CustomerID'
+        )
+        selected_customer = st.selectbox("Customer", options=customer_options.keys())
+        customer_id = customer_options[selected_customer]
+    
+    with col2:
+        employee_options = options_from_columns(
+            employees_df, "{FirstName} {LastName} ({Role})", 'EmployeeID'
+        )
+        selected_employee = st.selectbox("Employee", options=employee_options.keys())
+        employee_id = employee_options[selected_employee]
+    
+    with col3:
+        payment_mode = st.selectbox("Payment Mode", ["Cash", "Card", "UPI", "Check"])
+    
+    st.divider()
+    
+    # Initialize cart in session state
+    if 'cart' not in st.session_state:
+        st.session_state.cart = []
+    
+    # Scan to add: barcode scanners type the code and press Enter
+    st.subheader("Add Items to Cart")
+    with st.form("scan_form", clear_on_submit=True):
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            sku = st.text_input("Scan SKU / Barcode")
+        with col2:
+            st.write("")
+            st.write("")
+            scanned = st.form_submit_button("Add")
+    
+    if scanned and sku.strip():
+        sku = sku.strip()
+        started = time.perf_counter()
+        item, unavailable = None, "not connected"
+        if reader is not None:
+            try:
+                item, unavailable = reader.lookup_item(sku), None
+            except Error as e:
+                unavailable = e.msg
+        if unavailable:
+            item = _catalogue_item(sku)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if item is None and unavailable:
+            st.error(f"Could not look up SKU {sku}: database unavailable ({unavailable})")
+        elif item is None:
+            st.error(f"No item with SKU {sku}")
+        else:
+            error = _add_to_cart(item['ItemID'], item['Name'], item['Price'], 1,
+                                 item['QuantityAvailable'])
+            if error:
+                st.error(error)
+            else:
+                st.success(f"Added {item['Name']} ({elapsed_ms:.1f} ms)")
+    
+    # Fallback picker; only loads the catalogue when opened
+    if st.checkbox("Browse catalogue"):
+        items_df = _last_known('till_items', reader.get_all_items() if reader else empty)
+        in_stock = items_df[items_df['QuantityAvailable'].fillna(0) > 0] if not items_df.empty else items_df
+        
+        if in_stock.empty:
+            st.info("No items in stock")
+        else:
+            col1, col2, col3 = st.columns([3, 1, 1])
+            
+            with col1:
+                item_options = options_from_columns(
+                    in_stock, "{Name} - ₹{Price:.2f} (Stock: {QuantityAvailable})",
+                    ('ItemID', 'Price', 'QuantityAvailable')
+                )
+                selected_item = st.selectbox("Select Item", options=item_options.keys())
+            
+            with col2:
+                quantity = st.number_input("Qty", min_value=1, value=1)
+            
+            with col3:
+                st.write("")
+                st.write("")
+                if st.button("Add to Cart"):
+                    item_id, price, available = item_options[selected_item]
+                    error = _add_to_cart(item_id, selected_item.split(' - ')[0], price,
+                                         quantity, available)
+                    if error:
+                        st.error(error)
+                    else:
+                        st.success("Item added to cart!")
+    
+    # Display cart
+    if st.session_state.cart:
+        st.subheader("Shopping Cart")
+        cart_df = pd.DataFrame(st.session_state.cart)
+        st.dataframe(cart_df, use_container_width=True, hide_index=True)
+        
+        total = sum(item['line_total'] for item in st.session_state.cart)
+        st.metric("Total Amount", f"₹{total:,.2f}")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Complete Transaction", type="primary"):
+                # Recorded locally first; the flusher replays it to the database
+                key = flusher.queue.enqueue(
+                    customer_id, employee_id, payment_mode,
+                    [(item['item_id'], item['quantity']) for item in st.session_state.cart]
+                )
+                flusher.wake()
+                st.session_state.cart = []
+                st.session_state.till_notice = f"Sale recorded (ref {key[:8]})"
+                st.rerun()
+        
+        with col2:
+            if st.button("Clear Cart"):
+                st.session_state.cart = []
+                st.rerun()
+
+
+def _view_transactions(db):
+    st.subheader("Transaction History")
+    current_date = datetime.now()
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        month = st.selectbox("Month", range(1, 13), index=current_date.month-1)
+    with col2:
+        year = st.number_input("Year", min_value=2020, max_value=2030, 
+                              value=current_date.year)
+    
+    if st.button("View Transactions"):
+        try:
+            trans_df = db.get_sales_report(year, month, year, month)
+        except ArchiveUnavailable as e:
+            st.error(str(e))
+            return
+        if not trans_df.empty:
+            st.dataframe(trans_df, use_container_width=True, hide_index=True)
+            st.metric("Total Sales", f"₹{trans_df['TotalAmount'].sum():,.2f}")
+        else:
+            st.info("No transactions found for this period")
+
+
+TABS = {
+    "➕ New Transaction": _new_transaction,
+    "📋 View Transactions": _view_transactions,
+}
+
+
+def render(db):
+    page_header("🛒 Transaction Processing")
+    TABS[tab_selector(list(TABS), key="transactions_tab")](db)